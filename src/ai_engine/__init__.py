@@ -7,6 +7,9 @@ from .predictor import BallPredictor
 from .model_manager import ModelManager, get_model_manager
 from .difficulty_system import DifficultyConfig, AIBehaviorModifier, get_neat_config_for_difficulty
 from .ai_controller import AIController, create_ai_controller
+from .compiled_network import CompiledNetwork, create_network
+from .match_scheduler import MatchScheduler
+from .vector_env import VectorPongEnv
 
 __all__ = [
     'NEATTrainer', 
@@ -17,5 +20,9 @@ __all__ = [
     'AIBehaviorModifier',
     'AIController',
     'create_ai_controller',
+    'CompiledNetwork',
+    'create_network',
+    'MatchScheduler',
+    'VectorPongEnv',
     'get_neat_config_for_difficulty'
 ]
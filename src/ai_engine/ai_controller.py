@@ -8,7 +8,7 @@ Tích hợp:
 - Difficulty modifiers
 - Reaction time simulation
 """
-import neat
+from .compiled_network import create_network
 from .predictor import BallPredictor
 from .difficulty_system import AIBehaviorModifier
 
@@ -21,7 +21,7 @@ class AIController:
     
     def __init__(self, neural_net, config, difficulty='medium', 
                  window_width=800, window_height=600, 
-                 paddle_width=20, paddle_height=100):
+                 paddle_width=20, paddle_height=100, rng=None):
         """
         Initialize AI controller
         
@@ -33,13 +33,14 @@ class AIController:
             window_height: Window height
             paddle_width: Paddle width
             paddle_height: Paddle height
+            rng: random.Random cho behavior (None = module random global)
         """
         self.net = neural_net
         self.config = config
         self.difficulty = difficulty
         
         # Initialize behavior modifier
-        self.behavior = AIBehaviorModifier(difficulty)
+        self.behavior = AIBehaviorModifier(difficulty, rng=rng)
         
         # Initialize predictor
         self.predictor = BallPredictor(
@@ -94,8 +95,7 @@ class AIController:
             
             # Add some random offset for easy mode
             if self.difficulty == 'easy':
-                import random
-                offset = random.uniform(-50, 50)
+                offset = self.behavior.rng.uniform(-50, 50)
                 target_y += offset
         
         # Get neural network input
@@ -167,7 +167,8 @@ class AIController:
         return self.behavior.get_speed_factor()
 
 
-def create_ai_controller(genome, config, difficulty, window_width=800, window_height=600):
+def create_ai_controller(genome, config, difficulty, window_width=800, window_height=600,
+                         rng=None):
     """
     Factory function to create AI controller
     
@@ -177,17 +178,19 @@ def create_ai_controller(genome, config, difficulty, window_width=800, window_he
         difficulty: 'easy', 'medium', or 'hard'
         window_width: Window width
         window_height: Window height
+        rng: random.Random cho behavior (None = module random global)
         
     Returns:
         AIController: Configured AI controller
     """
-    # Create neural network
-    net = neat.nn.FeedForwardNetwork.create(genome, config)
+    # Create neural network (compiled, same outputs as neat)
+    net = create_network(genome, config)
     
     # Create controller
     controller = AIController(
         net, config, difficulty,
-        window_width, window_height
+        window_width, window_height,
+        rng=rng
     )
     
     return controller
@@ -0,0 +1,194 @@
+"""
+Training Checkpoint - TV1 (Trí Hoằng)
+Lưu và khôi phục trạng thái training NEAT
+
+Snapshot gồm population, species, config, trạng thái random của NEAT và
+seed của trainer (seed các trận suy ra từ đó), nên train tiếp từ checkpoint
+cho kết quả giống hệt chạy liên tục. File được nén gzip và ghi atomic (file tạm + rename),
+nên process bị kill giữa chừng không để lại checkpoint hỏng.
+"""
+import glob
+import gzip
+import os
+import pickle
+import random
+import re
+import neat
+
+
+class TrainingCheckpointer(neat.Checkpointer):
+    """
+    NEAT reporter lưu checkpoint mỗi N generations hoặc M phút
+
+    Dùng logic interval của neat.Checkpointer (cái nào đến trước thì lưu),
+    chỉ thay cách ghi file và nội dung snapshot.
+    """
+
+    KEEP = 2  # Số checkpoint giữ lại cho mỗi difficulty
+
+    def __init__(self, trainer, directory, difficulty, generation_interval=5,
+                 time_interval_minutes=10, start_generation=0, best_genome=None):
+        """
+        Khởi tạo checkpointer
+
+        Args:
+            trainer: NEATTrainer đang chạy (lấy seed của run)
+            directory: Thư mục chứa checkpoints
+            difficulty: 'easy', 'medium', hoặc 'hard'
+            generation_interval: Lưu sau mỗi N generations (None = tắt)
+            time_interval_minutes: Lưu sau mỗi M phút (None = tắt)
+            start_generation: Generation bắt đầu (khi resume)
+            best_genome: Genome tốt nhất trước start_generation (khi resume)
+        """
+        time_interval = None if time_interval_minutes is None else time_interval_minutes * 60
+        super().__init__(generation_interval, time_interval)
+        self.trainer = trainer
+        self.directory = directory
+        self.difficulty = difficulty
+        self.last_generation_checkpoint = start_generation
+        self.best_genome = best_genome
+
+        os.makedirs(directory, exist_ok=True)
+
+    def post_evaluate(self, config, population, species, best_genome):
+        """Ghi nhận genome tốt nhất từ đầu run (lưu cùng checkpoint)"""
+        if self.best_genome is None or best_genome.fitness > self.best_genome.fitness:
+            self.best_genome = best_genome
+
+    def save_checkpoint(self, config, population, species_set, generation):
+        """
+        Ghi snapshot (gọi bởi neat.Checkpointer.end_generation)
+
+        Args:
+            config: NEAT config
+            population: Population của generation tiếp theo
+            species_set: Species set
+            generation: Generation tiếp theo sẽ được evaluate
+        """
+        state = {
+            'generation': generation,
+            'difficulty': self.difficulty,
+            'config': config,
+            'population': population,
+            'species_set': species_set,
+            'random_state': random.getstate(),
+            'seed': self.trainer.seed,
+            'best_genome': self.best_genome,
+        }
+        path = checkpoint_path(self.directory, self.difficulty, generation)
+
+        # Species set giữ reporters của run (kể cả checkpointer này và trainer),
+        # neat.Population gắn lại reporters mới khi resume nên không cần lưu
+        reporters = species_set.reporters
+        species_set.reporters = None
+        try:
+            save_checkpoint(path, state)
+        finally:
+            species_set.reporters = reporters
+        print(f" > Checkpoint: generation {generation} saved")
+
+        # Chỉ giữ vài checkpoint mới nhất
+        for old in list_checkpoints(self.directory, self.difficulty)[:-self.KEEP]:
+            os.remove(old)
+
+
+def checkpoint_path(directory, difficulty, generation):
+    """
+    Đường dẫn checkpoint của một generation
+
+    Args:
+        directory: Thư mục chứa checkpoints
+        difficulty: 'easy', 'medium', hoặc 'hard'
+        generation: Generation tiếp theo sẽ được evaluate
+
+    Returns:
+        str: Đường dẫn file
+    """
+    return os.path.join(directory, f"{difficulty}-gen{generation:04d}.pkl.gz")
+
+
+def save_checkpoint(path, state):
+    """
+    Ghi snapshot nén gzip một cách atomic
+
+    Args:
+        path: Đường dẫn file đích
+        state: Dict trạng thái training
+
+    Raises:
+        Exception: Lỗi pickle/ghi file (file tạm đã được xóa)
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as raw:
+            with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=5) as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Không để lại file tạm khi pickle hoặc ghi file lỗi
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(path):
+    """
+    Đọc snapshot
+
+    Args:
+        path: Đường dẫn checkpoint
+
+    Returns:
+        dict: Trạng thái training (xem TrainingCheckpointer.save_checkpoint)
+    """
+    with gzip.open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def list_checkpoints(directory, difficulty):
+    """
+    Các checkpoint của một difficulty, cũ nhất trước
+
+    Args:
+        directory: Thư mục chứa checkpoints
+        difficulty: 'easy', 'medium', hoặc 'hard'
+
+    Returns:
+        list: Đường dẫn các checkpoint theo generation tăng dần
+    """
+    pattern = re.compile(rf"{re.escape(difficulty)}-gen(\d+)\.pkl\.gz$")
+    found = []
+    for path in glob.glob(os.path.join(directory, f"{difficulty}-gen*.pkl.gz")):
+        match = pattern.search(os.path.basename(path))
+        if match:
+            found.append((int(match.group(1)), path))
+    return [path for generation, path in sorted(found)]
+
+
+def find_latest_checkpoint(directory, difficulty):
+    """
+    Checkpoint mới nhất của một difficulty
+
+    Args:
+        directory: Thư mục chứa checkpoints
+        difficulty: 'easy', 'medium', hoặc 'hard'
+
+    Returns:
+        str hoặc None nếu chưa có checkpoint
+    """
+    checkpoints = list_checkpoints(directory, difficulty)
+    return checkpoints[-1] if checkpoints else None
+
+
+def clear_checkpoints(directory, difficulty):
+    """
+    Xóa mọi checkpoint của một difficulty (sau khi training hoàn tất)
+
+    Args:
+        directory: Thư mục chứa checkpoints
+        difficulty: 'easy', 'medium', hoặc 'hard'
+    """
+    for path in list_checkpoints(directory, difficulty):
+        os.remove(path)
@@ -0,0 +1,321 @@
+"""
+Compiled Network - TV1 (Trí Hoằng)
+Biên dịch NEAT genome thành các ma trận NumPy theo layer
+
+neat.nn.FeedForwardNetwork.activate duyệt từng node bằng Python list mỗi frame.
+CompiledNetwork gom các node cùng độ sâu thành một layer và tính cả layer bằng
+một phép nhân ma trận, nên có thể activate cả batch inputs trong một lần gọi.
+Với 1 bộ inputs (1 paddle, 1 frame) overhead của NumPy lớn hơn cả network,
+nên activate() chạy một chương trình Python phẳng đánh index theo slot.
+
+PopulationNetwork xếp các CompiledNetwork của cả generation thành padded
+tensors, nên một lần gọi cho ra quyết định của mọi paddle trong mọi trận.
+
+Kết quả giống neat-python (trong sai số float) với các activation/aggregation
+có trong ACTIVATIONS/AGGREGATIONS; genome dùng hàm khác thì create_network()
+trả về network của neat.
+"""
+import neat
+import numpy as np
+
+
+def _relu(z):
+    return np.maximum(z, 0.0)
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(5.0 * z, -60.0, 60.0)))
+
+
+def _tanh(z):
+    return np.tanh(np.clip(2.5 * z, -60.0, 60.0))
+
+
+def _clamped(z):
+    return np.clip(z, -1.0, 1.0)
+
+
+def _identity(z):
+    return z
+
+
+# NumPy versions of neat.activations (same scaling and clamping)
+ACTIVATIONS = {
+    'relu': _relu,
+    'sigmoid': _sigmoid,
+    'tanh': _tanh,
+    'clamped': _clamped,
+    'identity': _identity,
+}
+
+# Chỉ 'sum' biểu diễn được bằng phép nhân ma trận
+AGGREGATIONS = ('sum',)
+
+
+class CompiledNetwork:
+    """
+    Feed-forward network dạng ma trận
+
+    Mọi giá trị node nằm trong một vector "slots": các input trước, sau đó
+    các node được evaluate theo thứ tự layer. Mỗi layer có ma trận trọng số
+    (đã nhân response) đọc từ toàn bộ slots.
+
+    Attributes:
+        num_inputs (int): Số inputs
+        num_slots (int): Số phần tử của vector giá trị
+        layers (list): (depth, activation, slot indices, weights, biases)
+        output_slots (ndarray): Vị trí của output nodes trong slots
+        node_evals (list): (slot, activation, bias, links) cho activate()
+    """
+
+    def __init__(self, num_inputs, num_slots, layers, output_slots, node_evals):
+        """
+        Khởi tạo network đã biên dịch
+
+        Args:
+            num_inputs: Số inputs
+            num_slots: Tổng số slots (inputs + nodes)
+            layers: List of (depth, activation, slot indices, weights, biases)
+            output_slots: Slot của từng output node
+            node_evals: List of (slot, scalar activation, bias, links)
+        """
+        self.num_inputs = num_inputs
+        self.num_slots = num_slots
+        self.layers = layers
+        self.output_slots = output_slots
+        self.node_evals = node_evals
+        self._outputs = output_slots.tolist()
+
+    @staticmethod
+    def create(genome, config):
+        """
+        Biên dịch genome thành CompiledNetwork
+
+        Dùng đúng các node/link mà neat.nn.FeedForwardNetwork.create chọn,
+        nên bỏ qua các node không ảnh hưởng tới output giống neat.
+
+        Args:
+            genome: NEAT genome
+            config: NEAT config
+
+        Returns:
+            CompiledNetwork: Network dạng ma trận
+
+        Raises:
+            ValueError: Genome dùng activation/aggregation không hỗ trợ
+        """
+        genome_config = config.genome_config
+        reference = neat.nn.FeedForwardNetwork.create(genome, config)
+
+        slots = {key: i for i, key in enumerate(reference.input_nodes)}
+        depth = {key: 0 for key in reference.input_nodes}
+        for node, act_func, agg_func, bias, response, links in reference.node_evals:
+            ng = genome.nodes[node]
+            if ng.activation not in ACTIVATIONS:
+                raise ValueError(f"Unsupported activation: {ng.activation}")
+            if ng.aggregation not in AGGREGATIONS:
+                raise ValueError(f"Unsupported aggregation: {ng.aggregation}")
+            depth[node] = 1 + max((depth.get(i, 0) for i, w in links), default=0)
+            slots[node] = len(slots)
+
+        # Output không được evaluate giữ giá trị 0.0 như neat
+        num_slots = len(slots)
+        for key in genome_config.output_keys:
+            if key not in slots:
+                slots[key] = num_slots
+                num_slots += 1
+
+        # Gom node cùng độ sâu và cùng activation thành một layer
+        groups = {}
+        for node, act_func, agg_func, bias, response, links in reference.node_evals:
+            activation = genome.nodes[node].activation
+            groups.setdefault((depth[node], activation), []).append(
+                (node, bias, response, links)
+            )
+
+        layers = []
+        for (level, activation) in sorted(groups):
+            nodes = groups[(level, activation)]
+            weights = np.zeros((num_slots, len(nodes)))
+            biases = np.empty(len(nodes))
+            for column, (node, bias, response, links) in enumerate(nodes):
+                for i, w in links:
+                    if i in slots:
+                        weights[slots[i], column] += response * w
+                biases[column] = bias
+            indices = np.array([slots[node] for node, _, _, _ in nodes])
+            layers.append((level, activation, indices, weights, biases))
+
+        # Bản phẳng cho activate(): dùng đúng activation function của neat
+        node_evals = []
+        for node, act_func, agg_func, bias, response, links in reference.node_evals:
+            node_evals.append((
+                slots[node], act_func, bias,
+                tuple((slots[i], response * w) for i, w in links if i in slots)
+            ))
+
+        output_slots = np.array([slots[key] for key in genome_config.output_keys])
+        return CompiledNetwork(len(reference.input_nodes), num_slots, layers,
+                               output_slots, node_evals)
+
+    def activate(self, inputs):
+        """
+        Activate với 1 bộ inputs (cùng API với neat network)
+
+        Args:
+            inputs: Sequence of num_inputs values
+
+        Returns:
+            list: Giá trị các output nodes
+        """
+        if len(inputs) != self.num_inputs:
+            raise RuntimeError(f"Expected {self.num_inputs} inputs, got {len(inputs)}")
+        values = list(inputs) + [0.0] * (self.num_slots - self.num_inputs)
+        for slot, activation, bias, links in self.node_evals:
+            total = bias
+            for i, w in links:
+                total += values[i] * w
+            values[slot] = activation(total)
+        return [values[i] for i in self._outputs]
+
+    def activate_batch(self, inputs):
+        """
+        Activate nhiều bộ inputs cùng lúc
+
+        Args:
+            inputs: Array shape (batch, num_inputs)
+
+        Returns:
+            ndarray: Outputs shape (batch, num_outputs)
+        """
+        inputs = np.asarray(inputs, dtype=float)
+        values = np.zeros((inputs.shape[0], self.num_slots))
+        values[:, :self.num_inputs] = inputs
+        for level, activation, indices, weights, biases in self.layers:
+            values[:, indices] = ACTIVATIONS[activation](values @ weights + biases)
+        return values[:, self.output_slots]
+
+
+def create_network(genome, config):
+    """
+    Tạo network nhanh nhất có thể cho genome
+
+    Args:
+        genome: NEAT genome
+        config: NEAT config
+
+    Returns:
+        CompiledNetwork, hoặc neat.nn.FeedForwardNetwork nếu genome dùng
+        activation/aggregation chưa được hỗ trợ
+    """
+    try:
+        return CompiledNetwork.create(genome, config)
+    except ValueError:
+        return neat.nn.FeedForwardNetwork.create(genome, config)
+
+
+class PopulationNetwork:
+    """
+    Mọi network của một generation dạng padded tensors
+
+    Slots của từng network được pad về cùng số slots S, layer thứ d của mọi
+    network được xếp thành tensor (G, S, S). Mỗi dòng inputs chọn network
+    của mình bằng genome index, nên một lần activate() tính được mọi paddle.
+
+    Attributes:
+        networks (list): Network của từng genome (theo index)
+        num_inputs (int): Số inputs
+        num_slots (int): Số slots sau khi pad
+        levels (list): (weights, biases, [(activation, mask)]) theo độ sâu
+        output_slots (ndarray): Slots của output nodes, shape (G, num_outputs)
+        fallback (ndarray): Mask genome dùng network của neat (activate riêng)
+    """
+
+    def __init__(self, networks, num_inputs, num_outputs):
+        """
+        Xếp các network thành padded tensors
+
+        Args:
+            networks: List of CompiledNetwork (hoặc network của neat)
+            num_inputs: Số inputs
+            num_outputs: Số outputs
+        """
+        self.networks = networks
+        self.num_inputs = num_inputs
+        self.fallback = np.array(
+            [not isinstance(net, CompiledNetwork) for net in networks], dtype=bool
+        )
+        compiled = [(g, net) for g, net in enumerate(networks)
+                    if isinstance(net, CompiledNetwork)]
+
+        self.num_slots = max([net.num_slots for g, net in compiled],
+                             default=num_inputs + num_outputs)
+        depth = max([layer[0] for g, net in compiled for layer in net.layers], default=0)
+        count, size = len(networks), self.num_slots
+
+        weights = np.zeros((depth, count, size, size))
+        biases = np.zeros((depth, count, size))
+        masks = [{} for _ in range(depth)]
+        self.output_slots = np.zeros((count, num_outputs), dtype=np.int64)
+
+        for g, net in compiled:
+            for level, activation, indices, layer_weights, layer_biases in net.layers:
+                block = weights[level - 1, g]
+                block[:net.num_slots, indices] = layer_weights
+                biases[level - 1, g, indices] = layer_biases
+                if activation not in masks[level - 1]:
+                    masks[level - 1][activation] = np.zeros((count, size), dtype=bool)
+                masks[level - 1][activation][g, indices] = True
+            self.output_slots[g] = net.output_slots
+
+        self.levels = [
+            (weights[level], biases[level], list(masks[level].items()))
+            for level in range(depth)
+        ]
+
+    @staticmethod
+    def create(genomes, config):
+        """
+        Biên dịch cả generation
+
+        Args:
+            genomes: List of NEAT genomes (index = genome index)
+            config: NEAT config
+
+        Returns:
+            PopulationNetwork
+        """
+        genome_config = config.genome_config
+        return PopulationNetwork(
+            [create_network(genome, config) for genome in genomes],
+            len(genome_config.input_keys), len(genome_config.output_keys)
+        )
+
+    def activate(self, genome_indices, inputs):
+        """
+        Activate mọi dòng inputs bằng network của genome tương ứng
+
+        Args:
+            genome_indices: Int array shape (batch,)
+            inputs: Array shape (batch, num_inputs)
+
+        Returns:
+            ndarray: Outputs shape (batch, num_outputs)
+        """
+        genome_indices = np.asarray(genome_indices, dtype=np.int64)
+        inputs = np.asarray(inputs, dtype=float)
+        values = np.zeros((len(genome_indices), self.num_slots))
+        values[:, :self.num_inputs] = inputs
+
+        for weights, biases, activations in self.levels:
+            z = np.matmul(values[:, None, :], weights[genome_indices])[:, 0, :]
+            z += biases[genome_indices]
+            for activation, mask in activations:
+                values = np.where(mask[genome_indices], ACTIVATIONS[activation](z), values)
+
+        outputs = np.take_along_axis(values, self.output_slots[genome_indices], axis=1)
+
+        # Genome không biên dịch được: activate từng dòng bằng neat
+        for row in np.flatnonzero(self.fallback[genome_indices]):
+            outputs[row] = self.networks[genome_indices[row]].activate(inputs[row].tolist())
+        return outputs
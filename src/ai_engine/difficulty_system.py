@@ -101,14 +101,16 @@ class AIBehaviorModifier:
     Áp dụng các thuật toán để tạo sự khác biệt
     """
     
-    def __init__(self, difficulty='medium'):
+    def __init__(self, difficulty='medium', rng=None):
         """
         Initialize behavior modifier
         
         Args:
             difficulty: 'easy', 'medium', or 'hard'
+            rng: random.Random cho errors/noise (None = module random global)
         """
         self.difficulty = difficulty
+        self.rng = rng if rng is not None else random
         self.config = DifficultyConfig.get_config(difficulty)
         self.last_decision_time = 0
         self.last_decision = 0
@@ -167,11 +169,11 @@ class AIBehaviorModifier:
         """
         error_rate = self.config['error_rate']
         
-        if random.random() < error_rate:
+        if self.rng.random() < error_rate:
             # Make a mistake
             possible_decisions = [0, 1, 2]
             possible_decisions.remove(optimal_decision)
-            return random.choice(possible_decisions)
+            return self.rng.choice(possible_decisions)
         
         return optimal_decision
     
@@ -195,7 +197,7 @@ class AIBehaviorModifier:
         # Add gaussian noise proportional to (1 - accuracy)
         max_error = window_height * 0.2  # Max 20% of screen
         noise_std = max_error * (1 - accuracy)
-        noise = random.gauss(0, noise_std)
+        noise = self.rng.gauss(0, noise_std)
         
         # Blend between prediction and current position based on accuracy
         noisy_prediction = prediction_y + noise
@@ -0,0 +1,97 @@
+"""
+Fitness Cache - TV1 (Trí Hoằng)
+Cache kết quả trận đấu giữa các genome không thay đổi
+
+Elites được giữ nguyên qua các generation nhưng trước đây vẫn bị đấu lại.
+Một trận có seed cố định là deterministic, nên kết quả chỉ phụ thuộc vào cấu
+trúc 2 genome, seed và luật chơi (frame skip): cache theo (fingerprint trái,
+fingerprint phải, seed, frame skip) cho phép bỏ qua các trận đã chơi.
+"""
+import hashlib
+from collections import OrderedDict
+
+
+def genome_fingerprint(genome):
+    """
+    Hash cấu trúc của genome (mọi thứ quyết định network)
+
+    Hai genome có cùng nodes (bias, response, activation, aggregation) và
+    cùng connections đang bật (weight) cho cùng fingerprint, kể cả khi khác
+    genome key.
+
+    Args:
+        genome: NEAT genome
+
+    Returns:
+        str: Hex digest ổn định giữa các process
+    """
+    nodes = sorted(
+        (key, repr(node.bias), repr(node.response), node.activation, node.aggregation)
+        for key, node in genome.nodes.items()
+    )
+    connections = sorted(
+        (key, repr(conn.weight))
+        for key, conn in genome.connections.items() if conn.enabled
+    )
+    return hashlib.blake2b(repr((nodes, connections)).encode(), digest_size=16).hexdigest()
+
+
+class FitnessCache:
+    """
+    LRU cache kết quả trận: (fingerprint1, fingerprint2, seed, frame_skip) -> (fitness1, fitness2)
+
+    Attributes:
+        max_size (int): Số trận tối đa được giữ
+        hits (int): Số lần tìm thấy
+        misses (int): Số lần không tìm thấy
+    """
+
+    def __init__(self, max_size=10000):
+        """
+        Khởi tạo cache
+
+        Args:
+            max_size: Số trận tối đa được giữ (LRU)
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+
+    def get(self, key):
+        """
+        Lấy kết quả đã lưu
+
+        Args:
+            key: (fingerprint1, fingerprint2, seed, frame_skip)
+
+        Returns:
+            tuple (fitness1, fitness2) hoặc None
+        """
+        result = self._results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._results.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """
+        Lưu kết quả trận
+
+        Args:
+            key: (fingerprint1, fingerprint2, seed, frame_skip)
+            result: (fitness1, fitness2)
+        """
+        self._results[key] = result
+        self._results.move_to_end(key)
+        if len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+    def clear(self):
+        """Xóa toàn bộ cache"""
+        self._results.clear()
+
+    def __len__(self):
+        return len(self._results)
@@ -0,0 +1,194 @@
+"""
+Match Scheduler - TV1 (Trí Hoằng)
+Lập lịch thi đấu giữa các genome trong một generation
+
+Scheduler chỉ trả về danh sách cặp đấu (genome trái, genome phải), nên bất kỳ
+evaluator nào (serial, pool, batch) cũng dùng được. Số trận quyết định chi phí
+evaluate, số đối thủ quyết định độ nhiễu của fitness.
+
+Modes:
+    'sequential': Vòng tròn i gặp i+1 (cuối gặp đầu) - 2 trận mỗi genome
+    'round_robin': Mọi cặp gặp nhau 1 lần
+    'k_random': Mỗi genome gặp k đối thủ ngẫu nhiên
+    'swiss': Nhiều vòng, mỗi vòng ghép các genome có điểm gần nhau
+    'benchmark': Mọi genome gặp cùng một genome chuẩn cố định
+"""
+import random
+
+
+class MatchScheduler:
+    """
+    Lập lịch trận đấu cho một generation
+
+    Mỗi generation gồm num_rounds vòng; vòng sau có thể dựa vào điểm của
+    vòng trước (Swiss). Các mode khác chỉ có 1 vòng.
+
+    Attributes:
+        mode (str): Một trong MODES
+        opponents (int): Số đối thủ mỗi genome ('k_random')
+        rounds (int): Số vòng ('swiss')
+        benchmark: Genome chuẩn ('benchmark')
+        match_budget (int): Số trận tối đa mỗi generation (None = không giới hạn)
+        rng: Nguồn random (random.Random hoặc module random)
+    """
+
+    MODES = ('sequential', 'round_robin', 'k_random', 'swiss', 'benchmark')
+
+    def __init__(self, mode='sequential', opponents=3, rounds=4, benchmark=None,
+                 match_budget=None, rng=None):
+        """
+        Khởi tạo scheduler
+
+        Args:
+            mode: Một trong MODES
+            opponents: Số đối thủ mỗi genome ('k_random')
+            rounds: Số vòng ('swiss')
+            benchmark: Genome chuẩn (bắt buộc cho 'benchmark')
+            match_budget: Số trận tối đa mỗi generation (None = không giới hạn)
+            rng: random.Random (None = module random global)
+
+        Raises:
+            ValueError: Mode không hợp lệ hoặc thiếu benchmark genome
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Invalid scheduler mode: {mode}")
+        if mode == 'benchmark' and benchmark is None:
+            raise ValueError("Benchmark mode requires a benchmark genome")
+        if match_budget is not None and match_budget < 1:
+            raise ValueError(f"Match budget must be positive, got {match_budget}")
+
+        self.mode = mode
+        self.opponents = opponents
+        self.rounds = rounds
+        self.benchmark = benchmark
+        self.match_budget = match_budget
+        self.rng = rng if rng is not None else random
+
+        # Các cặp đã gặp nhau trong generation hiện tại (Swiss)
+        self._played = set()
+
+    @property
+    def num_rounds(self):
+        """Số vòng đấu mỗi generation"""
+        return self.rounds if self.mode == 'swiss' else 1
+
+    def schedule_round(self, genomes, round_index=0, scores=None):
+        """
+        Lập danh sách trận cho một vòng
+
+        Args:
+            genomes: List of genomes
+            round_index: Vòng hiện tại (0 .. num_rounds-1)
+            scores: Điểm hiện tại của từng genome (cùng thứ tự genomes), cho Swiss
+
+        Returns:
+            list: (genome trái, genome phải) theo thứ tự thi đấu
+        """
+        if len(genomes) < 2 and self.mode != 'benchmark':
+            # Không có đối thủ: genome tự đấu với chính nó
+            return [(genome, genome) for genome in genomes]
+
+        if self.mode == 'sequential':
+            pairs = self._sequential(len(genomes))
+        elif self.mode == 'round_robin':
+            pairs = self._round_robin(len(genomes))
+        elif self.mode == 'k_random':
+            pairs = self._k_random(len(genomes))
+        elif self.mode == 'swiss':
+            pairs = self._swiss(len(genomes), round_index, scores)
+        else:
+            return [(genome, self.benchmark)
+                    for genome in self._budget_genomes(genomes)]
+
+        pairs = self._apply_budget(pairs)
+        return [(genomes[i], genomes[j]) for i, j in pairs]
+
+    def _sequential(self, count):
+        """Vòng tròn: i gặp i+1, genome cuối gặp genome đầu"""
+        return [(i, (i + 1) % count) for i in range(count)]
+
+    def _round_robin(self, count):
+        """Mọi cặp 1 lần, xen kẽ bên trái/phải"""
+        pairs = []
+        for i in range(count):
+            for j in range(i + 1, count):
+                pairs.append((i, j) if (i + j) % 2 else (j, i))
+        return pairs
+
+    def _k_random(self, count):
+        """Mỗi genome (bên trái) gặp k đối thủ khác nhau"""
+        k = min(self.opponents, count - 1)
+        pairs = []
+        for i in range(count):
+            others = [j for j in range(count) if j != i]
+            pairs.extend((i, j) for j in self.rng.sample(others, k))
+        return pairs
+
+    def _swiss(self, count, round_index, scores):
+        """Ghép các genome có điểm liền kề, tránh gặp lại nếu được"""
+        order = list(range(count))
+        if round_index == 0 or scores is None:
+            self.rng.shuffle(order)
+            self._played = set()
+        else:
+            order.sort(key=lambda i: -scores[i])
+
+        pairs = []
+        waiting = order
+        while len(waiting) >= 2:
+            first = waiting[0]
+            partner = next(
+                (j for j in waiting[1:] if frozenset((first, j)) not in self._played),
+                waiting[1]
+            )
+            waiting = [i for i in waiting if i not in (first, partner)]
+            self._played.add(frozenset((first, partner)))
+            pairs.append((first, partner) if round_index % 2 else (partner, first))
+        # Số genome lẻ: genome cuối được nghỉ vòng này
+        return pairs
+
+    def _round_budget(self):
+        """Số trận tối đa của một vòng"""
+        if self.match_budget is None:
+            return None
+        return max(1, self.match_budget // self.num_rounds)
+
+    def _budget_genomes(self, genomes):
+        """Giới hạn số genome gặp benchmark theo budget"""
+        budget = self._round_budget()
+        if budget is None or len(genomes) <= budget:
+            return list(genomes)
+        chosen = sorted(self.rng.sample(range(len(genomes)), budget))
+        return [genomes[i] for i in chosen]
+
+    def _apply_budget(self, pairs):
+        """
+        Cắt bớt trận cho vừa budget
+
+        Ưu tiên các trận giúp mọi genome có ít nhất 1 trận, phần còn lại chọn
+        ngẫu nhiên. Thứ tự thi đấu được giữ nguyên.
+
+        Args:
+            pairs: List of (index trái, index phải)
+
+        Returns:
+            list: Các cặp được giữ lại
+        """
+        budget = self._round_budget()
+        if budget is None or len(pairs) <= budget:
+            return pairs
+
+        candidates = list(range(len(pairs)))
+        self.rng.shuffle(candidates)
+        covered = set()
+        chosen = set()
+        for index in candidates:
+            i, j = pairs[index]
+            if len(chosen) < budget and (i not in covered or j not in covered):
+                chosen.add(index)
+                covered.update((i, j))
+        for index in candidates:
+            if len(chosen) >= budget:
+                break
+            chosen.add(index)
+        return [pairs[index] for index in sorted(chosen)]
@@ -1,8 +1,13 @@
 """
 Ball Predictor - TV1 (Trí Hoằng)
 Dự đoán quỹ đạo bóng với physics đầy đủ
+
+Các hàm *_batch/get_intercept_points/get_optimal_actions nhận NumPy arrays
+trạng thái bóng của nhiều trận và trả về kết quả cho tất cả trong một lần
+gọi, không có vòng lặp Python.
 """
 import math
+import numpy as np
 
 
 class BallPredictor:
@@ -11,6 +16,8 @@ class BallPredictor:
     Dự đoán vị trí bóng trong tương lai
     """
     
+    ACTION_THRESHOLD = 10  # Khoảng cách (pixels) coi như đã đúng vị trí, tránh rung
+    
     def __init__(self, window_width, window_height, paddle_width, paddle_height):
         """
         Khởi tạo predictor
@@ -26,11 +33,41 @@ class BallPredictor:
         self.paddle_width = paddle_width
         self.paddle_height = paddle_height
     
+    def _fold_y(self, y, ball_radius):
+        """
+        Phản xạ tọa độ Y tự do vào dải bóng được phép [R, H - R]
+
+        Bóng nảy giữa 2 tường giống như bay thẳng trong các bản sao đối xứng
+        của dải có bề rộng L = H - 2R, nên chu kỳ là 2L: lấy modulo 2L rồi
+        lật nửa sau. Không phụ thuộc số lần nảy.
+
+        Args:
+            y: Tọa độ Y nếu không có tường
+            ball_radius: Bán kính bóng
+
+        Returns:
+            tuple: (y trong dải, số lần nảy, hệ số hướng vy: 1 hoặc -1)
+        """
+        band = self.window_height - 2 * ball_radius
+        if band <= 0:
+            return self.window_height / 2, 0, 1
+
+        offset = y - ball_radius
+        lap = math.floor(offset / band)
+        folded = offset - lap * band
+        if lap % 2:
+            # Lần nảy lẻ: đang bay ngược chiều ban đầu
+            return ball_radius + band - folded, abs(lap), -1
+        return ball_radius + folded, abs(lap), 1
+    
     def predict_ball_position(self, ball_x, ball_y, ball_vx, ball_vy, 
                              ball_radius, time_steps=10, paddle_x=None, paddle_y=None):
         """
         Dự đoán vị trí bóng sau N time steps với đầy đủ collision physics
         
+        Tính dạng đóng O(1): tường được phản xạ bằng _fold_y, vợt (nếu có)
+        được kiểm tra tại frame bóng chạm mặt vợt.
+        
         Args:
             ball_x, ball_y: Vị trí hiện tại
             ball_vx, ball_vy: Vận tốc hiện tại
@@ -41,55 +78,43 @@ class BallPredictor:
         Returns:
             tuple: (pred_x, pred_y, pred_vx, pred_vy)
         """
-        # Copy để không thay đổi giá trị gốc
-        pred_x = ball_x
-        pred_y = ball_y
-        pred_vx = ball_vx
-        pred_vy = ball_vy
-        
-        for _ in range(time_steps):
-            # Di chuyển
-            pred_x += pred_vx
-            pred_y += pred_vy
-            
-            # Va chạm tường trên/dưới
-            if pred_y + ball_radius >= self.window_height:
-                pred_y = self.window_height - ball_radius
-                pred_vy *= -1
-            elif pred_y - ball_radius <= 0:
-                pred_y = ball_radius
-                pred_vy *= -1
-            
-            # Va chạm vợt (nếu có thông tin)
-            if paddle_x is not None and paddle_y is not None:
-                if pred_vx < 0:  # Bóng đi về bên trái
-                    if (pred_y >= paddle_y and 
-                        pred_y <= paddle_y + self.paddle_height):
-                        if pred_x - ball_radius <= paddle_x + self.paddle_width:
-                            # Va chạm vợt
-                            pred_x = paddle_x + self.paddle_width + ball_radius
-                            pred_vx *= -1
-                            
-                            # Tính góc bounce
-                            middle_y = paddle_y + self.paddle_height / 2
-                            difference_in_y = middle_y - pred_y
-                            reduction_factor = (self.paddle_height / 2) / abs(ball_vx)
-                            pred_vy = -1 * (difference_in_y / reduction_factor)
-        
-        return (pred_x, pred_y, pred_vx, pred_vy)
+        steps = time_steps
+        
+        # Va chạm vợt (nếu có thông tin): frame đầu tiên bóng chạm mặt vợt
+        if paddle_x is not None and paddle_y is not None and ball_vx < 0:
+            face = paddle_x + self.paddle_width + ball_radius
+            hit_step = max(1, math.ceil((face - ball_x) / ball_vx))
+            if hit_step <= steps:
+                hit_y, _, _ = self._fold_y(ball_y + ball_vy * hit_step, ball_radius)
+                if paddle_y <= hit_y <= paddle_y + self.paddle_height:
+                    # Tính góc bounce
+                    middle_y = paddle_y + self.paddle_height / 2
+                    difference_in_y = middle_y - hit_y
+                    reduction_factor = (self.paddle_height / 2) / abs(ball_vx)
+                    
+                    ball_x, ball_y = face, hit_y
+                    ball_vx, ball_vy = -ball_vx, -1 * (difference_in_y / reduction_factor)
+                    steps -= hit_step
+        
+        pred_y, _, direction = self._fold_y(ball_y + ball_vy * steps, ball_radius)
+        return (ball_x + ball_vx * steps, pred_y, ball_vx, ball_vy * direction)
     
     def predict_y_at_x(self, ball_x, ball_y, ball_vx, ball_vy, 
-                       ball_radius, target_x, max_bounces=3):
+                       ball_radius, target_x, max_bounces=None):
         """
         Dự đoán vị trí Y khi bóng đến vị trí X
         Quan trọng cho AI positioning
         
+        Tính dạng đóng O(1) bằng _fold_y: chi phí không phụ thuộc tốc độ
+        bóng hay số lần nảy.
+        
         Args:
             ball_x, ball_y: Vị trí hiện tại
             ball_vx, ball_vy: Vận tốc hiện tại
             ball_radius: Bán kính
             target_x: Vị trí X cần predict
-            max_bounces: Số lần bounce tối đa
+            max_bounces: Số lần bounce tối đa (None = không giới hạn). Cần
+                         nhiều hơn thì trả về tường của lần bounce vượt giới hạn
         
         Returns:
             float: Vị trí Y dự đoán hoặc None
@@ -97,53 +122,20 @@ class BallPredictor:
         if ball_vx == 0:
             return None
         
-        pred_x = ball_x
-        pred_y = ball_y
-        pred_vx = ball_vx
-        pred_vy = ball_vy
-        bounces = 0
-        
-        max_iterations = 1000
-        iterations = 0
-        
-        while iterations < max_iterations and bounces <= max_bounces:
-            iterations += 1
-            
-            # Tính thời gian đến target_x
-            if pred_vx == 0:
-                return None
-            
-            time_to_target = (target_x - pred_x) / pred_vx
-            
-            # Nếu target nằm trước mặt
-            if time_to_target > 0:
-                # Tính Y tương lai
-                future_y = pred_y + pred_vy * time_to_target
-                
-                # Check bounce với tường
-                if future_y - ball_radius < 0:
-                    # Bounce tường trên
-                    time_to_wall = (ball_radius - pred_y) / pred_vy
-                    pred_x += pred_vx * time_to_wall
-                    pred_y = ball_radius
-                    pred_vy *= -1
-                    bounces += 1
-                elif future_y + ball_radius > self.window_height:
-                    # Bounce tường dưới
-                    time_to_wall = (self.window_height - ball_radius - pred_y) / pred_vy
-                    pred_x += pred_vx * time_to_wall
-                    pred_y = self.window_height - ball_radius
-                    pred_vy *= -1
-                    bounces += 1
-                else:
-                    # Không có bounce, return kết quả
-                    return future_y
-            else:
-                # Bóng đang đi xa target
-                return None
-        
-        # Timeout hoặc quá nhiều bounces
-        return pred_y
+        time_to_target = (target_x - ball_x) / ball_vx
+        if time_to_target <= 0:
+            # Bóng đang đi xa target
+            return None
+        
+        future_y, bounces, _ = self._fold_y(ball_y + ball_vy * time_to_target, ball_radius)
+        
+        if max_bounces is not None and bounces > max_bounces:
+            # Tường xen kẽ, lần bounce đầu ở phía bóng đang bay tới
+            first_is_bottom = ball_vy > 0
+            bottom = first_is_bottom == (max_bounces % 2 == 0)
+            return self.window_height - ball_radius if bottom else ball_radius
+        
+        return future_y
     
     def get_intercept_point(self, ball_x, ball_y, ball_vx, ball_vy, 
                            ball_radius, paddle_x, is_left_paddle=True):
@@ -203,14 +195,113 @@ class BallPredictor:
             ball_radius, paddle_x, is_left_paddle
         )
         
-        # Threshold để tránh rung
-        threshold = 10
-        
         paddle_center = paddle_y + self.paddle_height / 2
         
-        if abs(target_y - paddle_center) < threshold:
+        # Threshold để tránh rung
+        if abs(target_y - paddle_center) < self.ACTION_THRESHOLD:
             return 0  # Stay
         elif target_y < paddle_center:
             return 1  # Move up
         else:
             return 2  # Move down
+    
+    def _fold_y_batch(self, y, ball_radius):
+        """
+        _fold_y cho array (không trả về số lần nảy)
+        
+        Args:
+            y: Array tọa độ Y nếu không có tường
+            ball_radius: Bán kính bóng
+        
+        Returns:
+            tuple: (array y trong dải, array hệ số hướng vy)
+        """
+        band = self.window_height - 2 * ball_radius
+        if band <= 0:
+            return np.full_like(y, self.window_height / 2), np.ones_like(y)
+        
+        offset = y - ball_radius
+        lap = np.floor(offset / band)
+        folded = offset - lap * band
+        odd = lap % 2 == 1
+        return (ball_radius + np.where(odd, band - folded, folded),
+                np.where(odd, -1.0, 1.0))
+    
+    def predict_y_at_x_batch(self, ball_x, ball_y, ball_vx, ball_vy,
+                             ball_radius, target_x):
+        """
+        predict_y_at_x cho nhiều bóng cùng lúc (không giới hạn bounce)
+        
+        Args:
+            ball_x, ball_y: Arrays vị trí hiện tại
+            ball_vx, ball_vy: Arrays vận tốc hiện tại
+            ball_radius: Bán kính
+            target_x: Vị trí X cần predict (scalar hoặc array)
+        
+        Returns:
+            ndarray: Vị trí Y dự đoán, NaN nếu bóng không bay tới target_x
+        """
+        ball_x, ball_y, ball_vx, ball_vy = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (ball_x, ball_y, ball_vx, ball_vy))
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            time_to_target = (target_x - ball_x) / ball_vx
+        valid = (ball_vx != 0) & (time_to_target > 0)
+        
+        future_y, _ = self._fold_y_batch(
+            ball_y + ball_vy * np.where(valid, time_to_target, 0.0), ball_radius
+        )
+        return np.where(valid, future_y, np.nan)
+    
+    def get_intercept_points(self, ball_x, ball_y, ball_vx, ball_vy,
+                             ball_radius, paddle_x, is_left_paddle=True):
+        """
+        get_intercept_point cho nhiều trận cùng lúc
+        
+        Args:
+            ball_x, ball_y: Arrays vị trí bóng
+            ball_vx, ball_vy: Arrays vận tốc bóng
+            ball_radius: Bán kính
+            paddle_x: Vị trí X của vợt (scalar hoặc array)
+            is_left_paddle: True nếu là vợt trái (bool hoặc bool array)
+        
+        Returns:
+            ndarray: Vị trí Y tối ưu cho center của vợt
+        """
+        target_x = np.where(is_left_paddle, np.add(paddle_x, self.paddle_width), paddle_x)
+        predicted_y = self.predict_y_at_x_batch(
+            ball_x, ball_y, ball_vx, ball_vy, ball_radius, target_x
+        )
+        
+        # Clamp trong giới hạn hợp lệ
+        clamped = np.clip(predicted_y, self.paddle_height / 2,
+                          self.window_height - self.paddle_height / 2)
+        
+        # Fallback: follow ball Y
+        return np.where(np.isnan(predicted_y), ball_y, clamped)
+    
+    def get_optimal_actions(self, paddle_y, ball_x, ball_y, ball_vx, ball_vy,
+                            ball_radius, paddle_x, is_left_paddle=True):
+        """
+        get_optimal_action cho nhiều trận cùng lúc
+        
+        Args:
+            paddle_y: Array vị trí Y hiện tại của vợt
+            ball_x, ball_y: Arrays vị trí bóng
+            ball_vx, ball_vy: Arrays vận tốc bóng
+            ball_radius: Bán kính
+            paddle_x: Vị trí X vợt (scalar hoặc array)
+            is_left_paddle: True nếu vợt trái (bool hoặc bool array)
+        
+        Returns:
+            ndarray: Int array 0 (stay), 1 (up), 2 (down)
+        """
+        target_y = self.get_intercept_points(
+            ball_x, ball_y, ball_vx, ball_vy,
+            ball_radius, paddle_x, is_left_paddle
+        )
+        
+        paddle_center = np.asarray(paddle_y, dtype=float) + self.paddle_height / 2
+        
+        actions = np.where(target_y < paddle_center, 1, 2)
+        return np.where(np.abs(target_y - paddle_center) < self.ACTION_THRESHOLD, 0, actions)
@@ -1,20 +1,108 @@
 """
 NEAT Trainer - TV1 (Trí Hoằng)
 Training logic cho NEAT AI - Speed optimized
+
+Headless training chỉ dùng PongPhysics nên không import pygame.
+pygame chỉ được load khi bật dashboard.
 """
-import pygame
 import neat
-import time
-from game_engine.game_manager import GameManager
+import os
+import random
+import hashlib
+import multiprocessing
+import numpy as np
+from game_engine.physics import PongPhysics
+from game_engine.batch_physics import BatchPongPhysics
+from game_engine.replay import ReplayRecorder
 from .difficulty_system import get_neat_config_for_difficulty, DifficultyConfig
+from .compiled_network import create_network, PopulationNetwork
+from .checkpoint import TrainingCheckpointer, find_latest_checkpoint, load_checkpoint
+from .fitness_cache import FitnessCache, genome_fingerprint
+from .match_scheduler import MatchScheduler
+
+
+# Trainer riêng của mỗi worker process (tạo bởi _init_worker)
+_worker_trainer = None
+
+
+def _init_worker(config, width, height, engine, frame_skip, replay_dir):
+    """
+    Khởi tạo worker process cho parallel evaluation
+
+    Args:
+        config: NEAT config
+        width: Window width
+        height: Window height
+        engine: 'scalar' hoặc 'batch'
+        frame_skip: Số frame giữa 2 lần network quyết định
+        replay_dir: Thư mục lưu replay các trận (None = không ghi)
+    """
+    global _worker_trainer
+    _worker_trainer = NEATTrainer(config, width, height, show_dashboard=False)
+    _worker_trainer.engine = engine
+    _worker_trainer.frame_skip = frame_skip
+    _worker_trainer.replay_dir = replay_dir
+
+
+def _play_pair_worker(genome1, genome2, seed):
+    """
+    Chơi 1 trận trong worker process
+
+    Genomes là bản copy (pickled), nên chỉ trả về phần fitness cộng thêm
+    để process chính merge lại theo đúng thứ tự.
+
+    Args:
+        genome1: Genome vợt trái
+        genome2: Genome vợt phải (có thể là chính genome1)
+        seed: Seed của trận
+
+    Returns:
+        tuple: (fitness genome1, fitness genome2)
+    """
+    return _worker_trainer._play_pair(genome1, genome2, seed)
+
+
+def _play_batch_worker(matches):
+    """
+    Chơi một nhóm trận bằng batch engine trong worker process
+
+    Args:
+        matches: List of (genome1, genome2, seed)
+
+    Returns:
+        list: (fitness genome1, fitness genome2) cho từng trận
+    """
+    return _worker_trainer._play_batch(matches)
 
 
 class NEATTrainer:
     """
     Trainer cho NEAT neural networks
     Quản lý quá trình training và evaluation
+    
+    Engines:
+        'scalar': Mỗi trận chạy một PongPhysics riêng
+        'batch': Mọi trận của generation chạy lock-step trong BatchPongPhysics
     """
     
+    ENGINES = ('scalar', 'batch')
+    
+    # Training config (short games for fast training)
+    MAX_HITS = 15
+    MAX_FRAMES = 3600  # Frame budget: 60s of game time
+    FPS = 60  # Game frames per second (dashboard speed, fitness duration)
+    FRAME_SKIP = 1  # Network quyết định mỗi N frames, giữ nguyên action ở giữa
+    
+    # Fitness: HIT_REWARD mỗi hit + thời gian trận (giây) + WIN_BONUS cho bên thắng
+    HIT_REWARD = 2
+    WIN_BONUS = 10.0
+    
+    # Checkpoint mặc định: mỗi 5 generations hoặc 10 phút
+    CHECKPOINT_GENERATIONS = 5
+    CHECKPOINT_MINUTES = 10
+    # Stages đo bởi profiler trong _train_pair
+    TRAIN_STAGES = ['events', 'loop', 'ai', 'advance', 'draw', 'flip']
+    
     def __init__(self, config, width=800, height=600, show_dashboard=False):
         """
         Khởi tạo trainer
@@ -30,19 +118,30 @@ class NEATTrainer:
         self.height = height
         self.show_dashboard = show_dashboard
         self.window = None
+        self.engine = 'scalar'
+        self.frame_skip = self.FRAME_SKIP
+        self.replay_dir = None
+        self.seed = None
+        self.fitness_cache = FitnessCache()
+        self.scheduler = MatchScheduler()
+        # FrameProfiler có TRAIN_STAGES (None = không đo); chỉ đo các trận chạy
+        # bằng _train_pair trong process này (engine 'scalar', workers=1)
+        self.profiler = None
+        self._pool = None
+        self._workers = 1
         
-        # Always initialize pygame (needed for game logic even without display)
-        pygame.init()
-        
-        # Create window only if showing dashboard
+        # Chỉ cần pygame khi hiển thị dashboard
         if self.show_dashboard:
+            import pygame
+            from game_engine.game_manager import GameManager
+            pygame.init()
             self.window = pygame.display.set_mode((width, height))
+            GameManager.clear_layer_cache()
             pygame.display.set_caption("NEAT Pong - Training")
-        else:
-            # Create invisible surface for headless training
-            self.window = pygame.Surface((width, height))
     
-    def train_ai(self, reporter=None, generations=None, difficulty='medium'):
+    def train_ai(self, reporter=None, generations=None, difficulty='medium', workers=1,
+                 engine='scalar', seed=None, checkpoint_dir=None, resume=False,
+                 scheduler=None, frame_skip=None, replay_dir=None):
         """
         Train AI using NEAT algorithm with difficulty-specific configs
         
@@ -50,13 +149,51 @@ class NEATTrainer:
             reporter: NEAT reporter (optional)
             generations: Number of generations (None = use config)
             difficulty: 'easy', 'medium', or 'hard'
+            workers: Số process để evaluate genomes song song (1 = serial)
+            engine: 'scalar' hoặc 'batch' (xem ENGINES)
+            seed: Seed của cả run (None = random, được in ra để chạy lại)
+            checkpoint_dir: Thư mục lưu checkpoints (None = không lưu)
+            resume: Train tiếp từ checkpoint mới nhất trong checkpoint_dir
+            scheduler: MatchScheduler lập lịch trận đấu (None = giữ self.scheduler)
+            frame_skip: Network quyết định mỗi N frames (None = giữ self.frame_skip)
+            replay_dir: Lưu replay mọi trận có seed vào thư mục này, tên file
+                        theo seed (chỉ engine 'scalar'; None = giữ self.replay_dir).
+                        Trận lấy từ fitness cache dùng file đã ghi khi trận
+                        được chơi lần đầu; nếu file không có, trận được chơi lại
         
         Returns:
-            Best genome after training
+            Best genome after training (genome tốt nhất đã lưu nếu checkpoint
+            đã đủ số generations)
+        
+        Raises:
+            ValueError: Engine không hợp lệ, frame skip < 1 hoặc replay_dir với engine 'batch'
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Invalid engine: {engine}")
+        if engine == 'batch' and (replay_dir or self.replay_dir) is not None:
+            raise ValueError("Replays are only recorded by the 'scalar' engine")
+        if scheduler is not None:
+            self.scheduler = scheduler
+        if frame_skip is not None:
+            if frame_skip < 1:
+                raise ValueError(f"Frame skip must be at least 1, got {frame_skip}")
+            self.frame_skip = frame_skip
+        if replay_dir is not None:
+            os.makedirs(replay_dir, exist_ok=True)
+            self.replay_dir = replay_dir
+        
         # Get difficulty config
         diff_config = DifficultyConfig.get_config(difficulty)
         
+        # Load checkpoint (config đã lưu giữ nguyên các chỉnh sửa bên dưới)
+        checkpoint = None
+        if resume and checkpoint_dir:
+            path = find_latest_checkpoint(checkpoint_dir, difficulty)
+            if path:
+                checkpoint = load_checkpoint(path)
+                self.config = checkpoint['config']
+                print(f" > Resuming from generation {checkpoint['generation']}")
+        
         # Update NEAT config based on difficulty
         if difficulty == 'easy':
             self.config.genome_config.num_hidden = 0
@@ -78,8 +215,20 @@ class NEATTrainer:
         if hasattr(self.config, 'min_species_size'):
             self.config.min_species_size = 1
         
-        # Create population
-        population = neat.Population(self.config)
+        if checkpoint is None:
+            # Seed cho NEAT (global random) và cho từng trận đấu
+            if seed is None:
+                seed = random.randrange(2**32)
+            print(f" Seed: {seed}")
+            self.seed = seed
+            random.seed(seed)
+            
+            # Create population
+            population = neat.Population(self.config)
+            start_generation = 0
+        else:
+            population = self._restore_population(checkpoint)
+            start_generation = checkpoint['generation']
         
         # Patch reproduction.min_species_size after population init
         if hasattr(population.reproduction, 'min_species_size'):
@@ -93,77 +242,357 @@ class NEATTrainer:
         if reporter:
             population.add_reporter(reporter)
         
-        # Start evolution
+        if checkpoint_dir:
+            population.add_reporter(TrainingCheckpointer(
+                self, checkpoint_dir, difficulty,
+                self.CHECKPOINT_GENERATIONS, self.CHECKPOINT_MINUTES,
+                start_generation=start_generation,
+                best_genome=checkpoint.get('best_genome') if checkpoint else None
+            ))
+        
+        # Start evolution (chỉ phần còn lại nếu resume)
         if generations is None:
             generations = diff_config['generations']
+        generations -= start_generation
+        if checkpoint is not None and generations <= 0:
+            # Checkpoint đã đủ số generations: không train thêm
+            print(f" > Checkpoint already reached generation {start_generation}")
+            return checkpoint.get('best_genome')
+        generations = max(1, generations)
+        
+        # Dashboard cần vẽ từng trận trong process chính
+        if self.show_dashboard and (workers > 1 or engine != 'scalar'):
+            print(" ! Dashboard enabled - using serial scalar evaluation")
+            workers = 1
+            engine = 'scalar'
+        self.engine = engine
+        
+        # Parallel evaluation
+        if workers > 1:
+            self._workers = workers
+            self._pool = multiprocessing.Pool(
+                workers,
+                initializer=_init_worker,
+                initargs=(self.config, self.width, self.height, engine,
+                          self.frame_skip, self.replay_dir)
+            )
         
         # Run NEAT
-        winner = population.run(self._eval_genomes, generations)
+        try:
+            winner = population.run(self._eval_genomes, generations)
+        finally:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool.join()
+                self._pool = None
         
         return winner
     
+    def _restore_population(self, checkpoint):
+        """
+        Tạo lại population và trạng thái random từ checkpoint
+        
+        Args:
+            checkpoint: Dict từ load_checkpoint()
+        
+        Returns:
+            neat.Population tiếp tục từ generation đã lưu
+        """
+        population = neat.Population(self.config, (
+            checkpoint['population'], checkpoint['species_set'], checkpoint['generation']
+        ))
+        
+        # neat-python >= 1.0 giữ innovation tracker trong genome config
+        tracker = getattr(self.config.genome_config, 'innovation_tracker', None)
+        if tracker is not None:
+            population.reproduction.innovation_tracker = tracker
+        
+        random.setstate(checkpoint['random_state'])
+        self.seed = checkpoint['seed']
+        print(f" Seed: {self.seed}")
+        return population
+    
     def _eval_genomes(self, genomes, config):
         """
         NEAT evaluation function
         Called by population.run()
         
+        Các trận do self.scheduler lập lịch; fitness của mỗi genome là trung
+        bình fitness các trận nó tham gia. Trận đã có trong fitness cache
+        (cùng cấu trúc 2 genome, cùng seed) không được chơi lại.
+        
         Args:
             genomes: List of (genome_id, genome) tuples
             config: NEAT config
         """
-        # Ensure window exists
-        if self.window is None:
-            self.window = pygame.display.set_mode((self.width, self.height))
-            pygame.display.set_caption("NEAT Pong - Training")
+        population = [genome for genome_id, genome in genomes]
+        totals = {id(genome): 0.0 for genome in population}
+        counts = {id(genome): 0 for genome in population}
+        fingerprints = {}
+        
+        for round_index in range(self.scheduler.num_rounds):
+            scores = [totals[id(genome)] / max(1, counts[id(genome)]) for genome in population]
+            pairs = self.scheduler.schedule_round(population, round_index, scores)
+            matches = self._seed_matches(pairs, fingerprints)
+            
+            results = self._evaluate_matches(matches, fingerprints)
+            if results is None:  # Force quit
+                return
+            
+            for (genome1, genome2, seed), (fitness1, fitness2) in zip(matches, results):
+                # Benchmark genome không thuộc population: không tính fitness
+                for genome, fitness in ((genome1, fitness1), (genome2, fitness2)):
+                    if id(genome) in totals:
+                        totals[id(genome)] += fitness
+                        counts[id(genome)] += 1
+        
+        for genome in population:
+            genome.fitness = totals[id(genome)] / max(1, counts[id(genome)])
+    
+    def _seed_matches(self, pairs, fingerprints):
+        """
+        Gắn seed cho từng cặp đấu
+        
+        Args:
+            pairs: List of (genome1, genome2) từ scheduler
+            fingerprints: Dict id(genome) -> genome_fingerprint (được bổ sung)
+        
+        Returns:
+            list: (genome1, genome2, seed) theo thứ tự thi đấu
+        """
+        matches = []
+        for genome1, genome2 in pairs:
+            for genome in (genome1, genome2):
+                if id(genome) not in fingerprints:
+                    fingerprints[id(genome)] = genome_fingerprint(genome)
+            seed = self._match_seed(fingerprints[id(genome1)], fingerprints[id(genome2)])
+            matches.append((genome1, genome2, seed))
+        return matches
+    
+    def _evaluate_matches(self, matches, fingerprints):
+        """
+        Kết quả các trận: lấy từ fitness cache hoặc chơi các trận còn thiếu
+        
+        Args:
+            matches: List of (genome1, genome2, seed)
+            fingerprints: Dict id(genome) -> genome_fingerprint
+        
+        Returns:
+            list: (fitness genome1, fitness genome2) theo thứ tự matches,
+            hoặc None nếu force quit
+        """
+        keys = [(fingerprints[id(genome1)], fingerprints[id(genome2)], seed, self.frame_skip)
+                for genome1, genome2, seed in matches]
+        if self.seed is None:
+            # Không có seed: trận không deterministic, không cache
+            results = [None] * len(matches)
+        else:
+            results = [self.fitness_cache.get(key) for key in keys]
+            if self.replay_dir is not None:
+                # Trận trong cache nhưng chưa có replay (vd. cache từ run trước
+                # khi bật replay_dir) được chơi lại để ghi replay
+                results = [result if os.path.exists(self._replay_path(seed)) else None
+                           for result, (_, _, seed) in zip(results, matches)]
+        
+        todo = [i for i, result in enumerate(results) if result is None]
+        if todo:
+            played = self._play_matches([matches[i] for i in todo])
+            if played is None:
+                return None
+            for i, result in zip(todo, played):
+                results[i] = result
+                if self.seed is not None:
+                    self.fitness_cache.put(keys[i], result)
+        return results
+    
+    def _replay_path(self, seed):
+        """Đường dẫn file replay của trận có seed"""
+        return os.path.join(self.replay_dir, f"{seed:016x}.rpl")
+    
+    def _match_seed(self, fingerprint1, fingerprint2):
+        """
+        Seed của trận, suy ra từ seed của run và cấu trúc 2 genome
+        
+        Cùng cặp genome không đổi luôn chơi cùng một trận, nên kết quả
+        có thể lấy từ fitness cache.
+        
+        Args:
+            fingerprint1: Fingerprint genome trái
+            fingerprint2: Fingerprint genome phải
+        
+        Returns:
+            int hoặc None (chưa có seed: dùng module random global)
+        """
+        if self.seed is None:
+            return None
+        digest = hashlib.blake2b(
+            f"{self.seed}:{fingerprint1}:{fingerprint2}".encode(), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, 'big')
+    
+    def _play_matches(self, matches):
+        """
+        Chơi các trận bằng engine đã chọn, trên pool nếu có
+        
+        Args:
+            matches: List of (genome1, genome2, seed)
+        
+        Returns:
+            list: (fitness genome1, fitness genome2) theo thứ tự matches,
+            hoặc None nếu dashboard bị đóng (force quit)
+        """
+        if self._pool is None:
+            if self.engine == 'batch':
+                return self._play_batch(matches)
+            
+            results = []
+            for genome1, genome2, seed in matches:
+                result = self._play_pair(genome1, genome2, seed)
+                if result is None:
+                    return None
+                results.append(result)
+            return results
         
-        # Train each genome pair
-        for i, (genome_id1, genome1) in enumerate(genomes):
-            genome1.fitness = 0
+        if self.engine == 'batch':
+            # Mỗi worker chạy một batch liên tiếp
+            size = -(-len(matches) // self._workers)
+            chunks = [matches[i:i + size] for i in range(0, len(matches), size)]
+            chunk_results = self._pool.map(_play_batch_worker, chunks)
+            return [result for chunk in chunk_results for result in chunk]
+        
+        chunksize = max(1, len(matches) // (self._workers * 4))
+        return self._pool.starmap(_play_pair_worker, matches, chunksize)
+    
+    def _play_pair(self, genome1, genome2, seed):
+        """
+        Chơi 1 trận và trả về fitness của trận đó
+        
+        Args:
+            genome1: Genome vợt trái
+            genome2: Genome vợt phải (có thể là chính genome1)
+            seed: Seed của trận
+        
+        Returns:
+            tuple: (fitness genome1, fitness genome2), None nếu force quit
+        """
+        genome1.fitness = 0
+        genome2.fitness = 0
+        if self._train_pair(genome1, genome2, seed):
+            return None
+        if genome2 is genome1:
+            return genome1.fitness, 0.0
+        return genome1.fitness, genome2.fitness
+    
+    def _play_batch(self, matches):
+        """
+        Chơi mọi trận cùng lúc trong BatchPongPhysics
+        
+        Args:
+            matches: List of (genome1, genome2, seed)
+        
+        Returns:
+            list: (fitness genome1, fitness genome2) theo thứ tự matches
+        """
+        # Mỗi genome chỉ biên dịch 1 lần dù chơi nhiều trận
+        index = {}
+        genomes = []
+        for genome1, genome2, seed in matches:
+            for genome in (genome1, genome2):
+                if id(genome) not in index:
+                    index[id(genome)] = len(genomes)
+                    genomes.append(genome)
+        population = PopulationNetwork.create(genomes, self.config)
+        left_index = np.array([index[id(genome1)] for genome1, genome2, seed in matches])
+        right_index = np.array([index[id(genome2)] for genome1, genome2, seed in matches])
+        
+        rngs = [self._make_rng(seed) for genome1, genome2, seed in matches]
+        sim = BatchPongPhysics(len(matches), self.width, self.height, rngs)
+        left_moves = np.zeros(len(matches), dtype=np.int64)
+        right_moves = np.zeros(len(matches), dtype=np.int64)
+        results = [None] * len(matches)
+        
+        while sim.active.any():
+            # Game loop
+            sim.step()
             
-            # Train against 2 opponents for maximum speed
-            for genome_id2, genome2 in genomes[min(i+1, len(genomes)-1):i+2]:
-                if genome2.fitness is None:
-                    genome2.fitness = 0
-                
-                # Play game
-                force_quit = self._train_pair(genome1, genome2)
-                if force_quit:
-                    return
-    
-    def _train_pair(self, genome1, genome2):
+            # AI control: 1 lần activate cho mọi paddle của các trận đến lượt
+            # quyết định (frame 1, 1 + k, 1 + 2k, ... như _train_pair)
+            games = np.flatnonzero(sim.active & ((sim.frames - 1) % self.frame_skip == 0))
+            if len(games):
+                ball = np.column_stack((
+                    sim.ball_x[games] / self.width,
+                    sim.ball_y[games] / self.height,
+                    sim.ball_vx[games] / 10,
+                    sim.ball_vy[games] / 10,
+                ))
+                inputs = np.vstack((
+                    np.column_stack((ball, sim.left_y[games] / self.height)),
+                    np.column_stack((ball, sim.right_y[games] / self.height)),
+                ))
+                decisions = population.activate(
+                    np.concatenate((left_index[games], right_index[games])), inputs
+                )[:, 0]
+                moves = self._decisions_to_moves(decisions)
+                left_moves[games] = moves[:len(games)]
+                right_moves[games] = moves[len(games):]
+            sim.move_paddles(left_moves, right_moves)
+            
+            # Check end conditions (giống _train_pair)
+            done = sim.active & ((sim.left_score >= 1) |
+                                 (sim.right_score >= 1) |
+                                 (sim.total_hits >= self.MAX_HITS) |
+                                 (sim.frames >= self.MAX_FRAMES))
+            
+            for game in np.flatnonzero(done):
+                results[game] = self._match_fitness(
+                    sim.left_hits[game], sim.right_hits[game],
+                    sim.left_score[game], sim.right_score[game],
+                    sim.frames[game] / self.FPS
+                )
+            sim.retire(done)
+        
+        return results
+    
+    def _train_pair(self, genome1, genome2, seed=None):
         """
         Train 2 genomes against each other
         
         Args:
             genome1: First genome
             genome2: Second genome
+            seed: Seed của trận (None = module random global)
         
         Returns:
             bool: True if force quit
         """
-        # Create networks
-        net1 = neat.nn.FeedForwardNetwork.create(genome1, self.config)
-        net2 = neat.nn.FeedForwardNetwork.create(genome2, self.config)
-        
-        # Create game
-        game = GameManager(self.window, self.width, self.height)
+        # Create networks (compiled, same outputs as neat)
+        net1 = create_network(genome1, self.config)
+        net2 = create_network(genome2, self.config)
         
-        # Training config (extreme speed optimization)
-        max_hits = 15  # Short games for fast training
-        max_duration = 5  # Quick timeout
-        start_time = time.time()
-        
-        # Only create clock if showing dashboard
+        # Create game (headless physics unless dashboard is shown)
         if self.show_dashboard:
+            import pygame
+            from game_engine.game_manager import GameManager
+            game = GameManager(self.window, self.width, self.height,
+                               rng=self._make_rng(seed))
             clock = pygame.time.Clock()
+        else:
+            game = PongPhysics(self.width, self.height, rng=self._make_rng(seed))
+        
+        # Replay: seed + input từng frame (trận có seed mới phát lại được)
+        recorder = None
+        if self.replay_dir is not None and seed is not None:
+            recorder = ReplayRecorder(game, seed)
         
+        profiler = self.profiler
+        frames = 0
         run = True
         while run:
-            # Only limit FPS if showing dashboard
+            # Only limit FPS and check quit events if showing dashboard
             if self.show_dashboard:
-                clock.tick(60)
-            
-            # Check quit events (only if showing dashboard)
+                clock.tick(self.FPS)
+            if profiler:
+                profiler.begin_frame()
             if self.show_dashboard:
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
@@ -171,62 +600,146 @@ class NEATTrainer:
                     if event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_ESCAPE:
                             return True
-            else:
-                # Clear events even when not showing to prevent queue buildup
-                pygame.event.pump()
+                if profiler:
+                    profiler.lap('events')
             
             # Game loop
             game.loop()
+            frames += 1
+            if profiler:
+                profiler.lap('loop')
             
             # AI control
-            self._move_ai_paddle(game, net1, genome1, game.left_paddle, True)
-            self._move_ai_paddle(game, net2, genome2, game.right_paddle, False)
+            left_move = self._move_ai_paddle(game, net1, genome1, game.left_paddle, True)
+            right_move = self._move_ai_paddle(game, net2, genome2, game.right_paddle, False)
+            if profiler:
+                profiler.lap('ai')
+            
+            # Frame skip: giữ nguyên action cho k-1 frames tiếp theo
+            # (advance() dừng sau mỗi hit/điểm để kiểm tra điều kiện kết thúc)
+            repeat = self.frame_skip - 1
+            while repeat > 0 and not self._match_over(game, frames):
+                advanced = game.advance(min(repeat, self.MAX_FRAMES - frames),
+                                        left_move, right_move)
+                frames += advanced
+                repeat -= advanced
+            if profiler:
+                profiler.lap('advance')
             
             # Draw only if dashboard enabled
             if self.show_dashboard:
                 game.draw()
+                if profiler:
+                    profiler.lap('draw')
                 pygame.display.update()
+                if profiler:
+                    profiler.lap('flip')
+            if profiler:
+                profiler.end_frame()
             
-            # Check end conditions
-            duration = time.time() - start_time
-            total_hits = game.left_hits + game.right_hits
-            if (game.left_score >= 1 or 
-                game.right_score >= 1 or 
-                total_hits >= max_hits or
-                duration >= max_duration):  # Add timeout
-                self._calculate_fitness(genome1, genome2, game, duration)
+            # Check end conditions (frame budget keeps fitness reproducible)
+            if self._match_over(game, frames):
+                self._calculate_fitness(genome1, genome2, game, frames / self.FPS)
+                if recorder is not None:
+                    recorder.save(self._replay_path(seed))
                 break
         
         return False
     
+    def _match_over(self, game, frames):
+        """
+        Điều kiện kết thúc trận training
+        
+        Args:
+            game: PongPhysics/GameManager instance
+            frames: Số frame đã chơi
+        
+        Returns:
+            bool: True nếu trận kết thúc
+        """
+        return (game.left_score >= 1 or
+                game.right_score >= 1 or
+                game.left_hits + game.right_hits >= self.MAX_HITS or
+                frames >= self.MAX_FRAMES)
+    
+    @staticmethod
+    def _make_rng(seed):
+        """
+        Tạo random.Random riêng cho một trận
+        
+        Args:
+            seed: Seed của trận (None = module random global)
+        
+        Returns:
+            random.Random hoặc None
+        """
+        return None if seed is None else random.Random(seed)
+    
     def _move_ai_paddle(self, game, net, genome, paddle, is_left):
         """
         Di chuyển paddle bởi AI
         
         Args:
-            game: GameManager instance
+            game: PongPhysics/GameManager instance
             net: Neural network
             genome: NEAT genome
             paddle: Paddle object
             is_left: True nếu là paddle trái
+        
+        Returns:
+            int: Action đã thực hiện (-1 = lên, 0 = đứng yên, 1 = xuống)
+        """
+        ball = game.ball
+        move = self._get_move(net, ball.x, ball.y, ball.x_vel, ball.y_vel, paddle.y)
+        
+        # Execute action
+        if move != 0:
+            game.move_paddle(left=is_left, up=move < 0)
+        return move
+    
+    def _get_move(self, net, ball_x, ball_y, ball_vx, ball_vy, paddle_y):
+        """
+        Quyết định hướng di chuyển của AI
+        
+        Args:
+            net: Neural network
+            ball_x, ball_y: Ball position
+            ball_vx, ball_vy: Ball velocity
+            paddle_y: Paddle Y position
+        
+        Returns:
+            int: -1 (up), 0 (stay), 1 (down)
         """
         # Get inputs (5 inputs as per config)
-        ball_x = game.ball.x / self.width
-        ball_y = game.ball.y / self.height
-        ball_vx = game.ball.x_vel / 10
-        ball_vy = game.ball.y_vel / 10
-        paddle_y = paddle.y / self.height
+        inputs = (
+            ball_x / self.width,
+            ball_y / self.height,
+            ball_vx / 10,
+            ball_vy / 10,
+            paddle_y / self.height
+        )
         
         # AI decision
-        output = net.activate((ball_x, ball_y, ball_vx, ball_vy, paddle_y))
-        decision = output[0]
+        decision = net.activate(inputs)[0]
         
-        # Execute action
         if decision > 0.5:  # Move up
-            game.move_paddle(left=is_left, up=True)
+            return -1
         elif decision < -0.5:  # Move down
-            game.move_paddle(left=is_left, up=False)
-        # else: stay (do nothing)
+            return 1
+        return 0  # Stay
+    
+    @staticmethod
+    def _decisions_to_moves(decisions):
+        """
+        Phiên bản vector của ngưỡng quyết định trong _get_move
+        
+        Args:
+            decisions: Array network outputs
+        
+        Returns:
+            ndarray: -1 (up), 0 (stay), 1 (down)
+        """
+        return np.where(decisions > 0.5, -1, np.where(decisions < -0.5, 1, 0))
     
     def _calculate_fitness(self, genome1, genome2, game, duration):
         """
@@ -235,15 +748,53 @@ class NEATTrainer:
         Args:
             genome1: Genome 1
             genome2: Genome 2
-            game: GameManager instance
-            duration: Game duration in seconds
-        """
-        # Reward hits and duration
-        genome1.fitness += game.left_hits * 2 + duration
-        genome2.fitness += game.right_hits * 2 + duration
-        
-        # Bonus for winning
-        if game.left_score > game.right_score:
-            genome1.fitness += 10
-        elif game.right_score > game.left_score:
-            genome2.fitness += 10
+            game: PongPhysics/GameManager instance
+            duration: Game duration in game seconds (frames / FPS)
+        """
+        fitness1, fitness2 = self._match_fitness(
+            game.left_hits, game.right_hits,
+            game.left_score, game.right_score, duration
+        )
+        genome1.fitness += fitness1
+        genome2.fitness += fitness2
+    
+    @classmethod
+    def _match_fitness(cls, left_hits, right_hits, left_score, right_score, duration):
+        """
+        Fitness của 2 bên sau một trận
+        
+        Args:
+            left_hits, right_hits: Số hits mỗi bên
+            left_score, right_score: Điểm số mỗi bên
+            duration: Game duration in game seconds (frames / FPS)
+        
+        Returns:
+            tuple: (fitness trái, fitness phải)
+        """
+        fitness1, fitness2 = cls._match_fitness_batch(
+            left_hits, right_hits, left_score, right_score, duration
+        )
+        return float(fitness1), float(fitness2)
+    
+    @classmethod
+    def _match_fitness_batch(cls, left_hits, right_hits, left_score, right_score, duration):
+        """
+        Fitness của 2 bên, nhận số hoặc NumPy arrays (mỗi phần tử một trận)
+        
+        Công thức duy nhất cho fitness: _match_fitness và reward của
+        VectorPongEnv đều gọi hàm này.
+        
+        Args:
+            left_hits, right_hits: Số hits mỗi bên
+            left_score, right_score: Điểm số mỗi bên
+            duration: Game duration in game seconds (frames / FPS)
+        
+        Returns:
+            tuple: (fitness trái, fitness phải), cùng shape với inputs
+        """
+        # Reward hits and duration, bonus for winning
+        fitness1 = (left_hits * cls.HIT_REWARD + duration
+                    + cls.WIN_BONUS * (left_score > right_score))
+        fitness2 = (right_hits * cls.HIT_REWARD + duration
+                    + cls.WIN_BONUS * (right_score > left_score))
+        return fitness1, fitness2
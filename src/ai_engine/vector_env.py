@@ -0,0 +1,341 @@
+"""
+Vector Environment - TV1 (Trí Hoằng)
+Môi trường kiểu Gym chạy N trận Pong song song
+
+VectorPongEnv cho phép optimizer/benchmark bên ngoài điều khiển engine qua
+reset()/step(actions) thay vì đi qua NEATTrainer. Luật chơi, điều kiện kết
+thúc và thứ tự frame giống hệt _train_pair: observation được chuẩn hóa như
+AIController._get_neural_inputs, tổng reward của một trận bằng đúng fitness
+mà _calculate_fitness cộng cho genome.
+
+Backends:
+    'sync': Mọi trận chạy trong một BatchPongPhysics của process hiện tại
+    'subprocess': Các trận được chia cho N worker processes, mỗi worker
+                  giữ một BatchPongPhysics riêng (giao tiếp bằng Pipe)
+"""
+import multiprocessing
+import random
+import numpy as np
+from game_engine.batch_physics import BatchPongPhysics
+from .trainer import NEATTrainer
+
+
+class _PongShard:
+    """
+    Một nhóm trận chạy lock-step trong BatchPongPhysics (tự reset khi kết thúc)
+
+    Attributes:
+        sim (BatchPongPhysics): Trạng thái các trận
+        rngs (list): random.Random của từng trận (dùng tiếp cho các trận sau)
+    """
+
+    def __init__(self, width, height, frame_skip, max_hits, max_frames, seeds):
+        """
+        Khởi tạo các trận và chạy frame đầu tiên
+
+        Args:
+            width: Chiều rộng sân
+            height: Chiều cao sân
+            frame_skip: Số frame mỗi action được giữ
+            max_hits: Tổng số hits kết thúc trận
+            max_frames: Số frame tối đa của trận
+            seeds: Seed của từng trận (None = seed ngẫu nhiên từ hệ điều hành)
+        """
+        self.width = width
+        self.height = height
+        self.frame_skip = frame_skip
+        self.max_hits = max_hits
+        self.max_frames = max_frames
+        self.rngs = [random.Random(seed) for seed in seeds]
+        self.sim = BatchPongPhysics(len(seeds), width, height, self.rngs)
+
+        # Fitness đã trả về dưới dạng reward trong trận hiện tại
+        self._paid = np.zeros((len(seeds), 2))
+
+        # Frame 1 chạy trước quyết định đầu tiên, giống _train_pair
+        self.sim.step()
+
+    def observations(self):
+        """
+        Inputs của network cho vợt trái và phải
+
+        Returns:
+            ndarray: Shape (games, 2, 5), chuẩn hóa như _get_neural_inputs
+        """
+        sim = self.sim
+        ball = np.column_stack((
+            sim.ball_x / self.width,
+            sim.ball_y / self.height,
+            sim.ball_vx / 10,
+            sim.ball_vy / 10,
+        ))
+        return np.stack((
+            np.column_stack((ball, sim.left_y / self.height)),
+            np.column_stack((ball, sim.right_y / self.height)),
+        ), axis=1)
+
+    def step(self, actions):
+        """
+        Giữ action trong frame_skip frames (dừng sớm trận vừa kết thúc)
+
+        Args:
+            actions: Int array shape (games, 2), -1 = lên, 0 = đứng yên, 1 = xuống
+
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, final_observations)
+        """
+        sim = self.sim
+        done = np.zeros(sim.num_games, dtype=bool)
+        for _ in range(self.frame_skip):
+            sim.move_paddles(actions[:, 0], actions[:, 1])
+            sim.step()
+            over = sim.active & self._match_over()
+            done |= over
+            sim.retire(over)
+            if not sim.active.any():
+                break
+
+        fitness = self._fitness()
+        rewards = fitness - self._paid
+        self._paid = fitness
+
+        terminated = done & ((sim.left_score >= 1) | (sim.right_score >= 1) |
+                             (sim.total_hits >= self.max_hits))
+        truncated = done & ~terminated
+
+        final = np.full((sim.num_games, 2, 5), np.nan)
+        games = np.flatnonzero(done)
+        if len(games):
+            final[games] = self.observations()[games]
+            self._restart(games)
+        return self.observations(), rewards, terminated, truncated, final
+
+    def _match_over(self):
+        """Điều kiện kết thúc trận (giống NEATTrainer._match_over)"""
+        sim = self.sim
+        return ((sim.left_score >= 1) | (sim.right_score >= 1) |
+                (sim.total_hits >= self.max_hits) | (sim.frames >= self.max_frames))
+
+    def _fitness(self):
+        """
+        Fitness hiện tại của 2 bên (NEATTrainer._match_fitness_batch)
+
+        Returns:
+            ndarray: Shape (games, 2)
+        """
+        sim = self.sim
+        left, right = NEATTrainer._match_fitness_batch(
+            sim.left_hits, sim.right_hits, sim.left_score, sim.right_score,
+            sim.frames / NEATTrainer.FPS
+        )
+        return np.column_stack((left, right))
+
+    def _restart(self, games):
+        """
+        Bắt đầu trận mới cho các game đã kết thúc
+
+        Args:
+            games: Index các trận (đã retire)
+        """
+        sim = self.sim
+        running = sim.active.copy()
+        sim.reset_games(games, [self.rngs[game] for game in games])
+        self._paid[games] = 0.0
+
+        # Chỉ các trận mới chạy frame đầu tiên
+        sim.retire(running)
+        sim.step()
+        sim.active |= running
+
+
+def _shard_worker(conn, width, height, frame_skip, max_hits, max_frames):
+    """
+    Vòng lặp của worker process ('subprocess' backend)
+
+    Nhận (command, data) qua Pipe: 'reset' (seeds), 'step' (actions), 'close'.
+
+    Args:
+        conn: Đầu Pipe của worker
+        width, height: Kích thước sân
+        frame_skip: Số frame mỗi action được giữ
+        max_hits: Tổng số hits kết thúc trận
+        max_frames: Số frame tối đa của trận
+    """
+    shard = None
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == 'reset':
+                shard = _PongShard(width, height, frame_skip, max_hits, max_frames, data)
+                conn.send(shard.observations())
+            elif command == 'step':
+                conn.send(shard.step(data))
+            elif command == 'close':
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+
+
+class VectorPongEnv:
+    """
+    N trận Pong song song với API reset()/step() kiểu Gym vector env
+
+    Mỗi trận có 2 agent (vợt trái, vợt phải). Trận kết thúc được tự động bắt
+    đầu lại trong cùng lần step(); observation cuối nằm trong
+    info['final_observation'].
+
+    Attributes:
+        num_envs (int): Số trận
+        backend (str): Một trong BACKENDS
+        workers (int): Số worker processes ('subprocess')
+        frame_skip (int): Số frame mỗi action được giữ
+        observation_shape (tuple): (num_envs, 2, 5)
+        action_shape (tuple): (num_envs, 2)
+    """
+
+    BACKENDS = ('sync', 'subprocess')
+
+    def __init__(self, num_envs, width=800, height=600, backend='sync', workers=2,
+                 frame_skip=1, max_hits=NEATTrainer.MAX_HITS,
+                 max_frames=NEATTrainer.MAX_FRAMES):
+        """
+        Khởi tạo môi trường (workers được tạo ngay, trận được tạo khi reset)
+
+        Args:
+            num_envs: Số trận chạy song song
+            width: Chiều rộng sân
+            height: Chiều cao sân
+            backend: 'sync' hoặc 'subprocess'
+            workers: Số worker processes ('subprocess')
+            frame_skip: Số frame mỗi action được giữ (như NEATTrainer.frame_skip)
+            max_hits: Tổng số hits kết thúc trận
+            max_frames: Số frame tối đa của trận
+
+        Raises:
+            ValueError: Backend không hợp lệ hoặc tham số không dương
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Invalid backend: {backend}")
+        if num_envs < 1:
+            raise ValueError(f"Number of environments must be positive, got {num_envs}")
+        if frame_skip < 1:
+            raise ValueError(f"Frame skip must be at least 1, got {frame_skip}")
+
+        self.num_envs = num_envs
+        self.width = width
+        self.height = height
+        self.backend = backend
+        self.frame_skip = frame_skip
+        self.max_hits = max_hits
+        self.max_frames = max_frames
+        self.observation_shape = (num_envs, 2, 5)
+        self.action_shape = (num_envs, 2)
+
+        self.workers = max(1, min(workers, num_envs)) if backend == 'subprocess' else 1
+        self._started = False
+        self._shard = None
+        self._conns = []
+        self._processes = []
+
+        # Trận của từng worker: slice liên tiếp, kích thước gần bằng nhau
+        bounds = np.linspace(0, num_envs, self.workers + 1).astype(int)
+        self._slices = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        if backend == 'subprocess':
+            for _ in range(self.workers):
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_shard_worker,
+                    args=(child, width, height, frame_skip, max_hits, max_frames),
+                    daemon=True
+                )
+                process.start()
+                child.close()
+                self._conns.append(parent)
+                self._processes.append(process)
+
+    def reset(self, seed=None):
+        """
+        Bắt đầu N trận mới
+
+        Args:
+            seed: Trận i dùng random.Random(seed + i), giống trận training có
+                  seed đó (None = seed ngẫu nhiên)
+
+        Returns:
+            tuple: (observations, info)
+        """
+        seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        self._started = True
+        if self.backend == 'sync':
+            self._shard = _PongShard(self.width, self.height, self.frame_skip,
+                                     self.max_hits, self.max_frames, seeds)
+            return self._shard.observations(), {}
+
+        for conn, part in zip(self._conns, self._slices):
+            conn.send(('reset', seeds[part]))
+        return np.concatenate([conn.recv() for conn in self._conns]), {}
+
+    def step(self, actions):
+        """
+        Áp dụng action của mọi vợt trong frame_skip frames
+
+        Args:
+            actions: Int array shape (num_envs, 2): [:, 0] vợt trái, [:, 1] vợt phải,
+                     -1 = lên, 0 = đứng yên, 1 = xuống
+
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, info)
+                observations: Shape (num_envs, 2, 5)
+                rewards: Fitness mỗi vợt nhận được trong step, shape (num_envs, 2)
+                terminated: Trận kết thúc do điểm hoặc đủ MAX_HITS
+                truncated: Trận kết thúc do hết frame budget
+                info: {'final_observation': observation cuối (NaN nếu chưa kết thúc)}
+
+        Raises:
+            RuntimeError: Chưa gọi reset()
+            ValueError: Sai shape của actions
+        """
+        if not self._started:
+            raise RuntimeError("Call reset() before step()")
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != self.action_shape:
+            raise ValueError(f"Expected actions of shape {self.action_shape}, "
+                             f"got {actions.shape}")
+
+        if self.backend == 'sync':
+            results = [self._shard.step(actions)]
+        else:
+            for conn, part in zip(self._conns, self._slices):
+                conn.send(('step', actions[part]))
+            results = [conn.recv() for conn in self._conns]
+
+        observations, rewards, terminated, truncated, final = (
+            np.concatenate(parts) for parts in zip(*results)
+        )
+        return observations, rewards, terminated, truncated, {'final_observation': final}
+
+    def close(self):
+        """Dừng các worker processes"""
+        for conn in self._conns:
+            try:
+                conn.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._conns = []
+        self._processes = []
+        self._shard = None
+        self._started = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -5,6 +5,7 @@ Hệ thống vật phẩm trong game - Optimized for NEAT
 import pygame
 import random
 import math
+from utils.assets import get_asset_manager
 
 class PowerUpType:
     """Các loại power-up"""
@@ -42,9 +43,14 @@ class PowerUp:
         return pygame.time.get_ticks() - self.spawn_time > self.LIFETIME
 
     def draw(self, win):
-        """Vẽ power-up với modern design và animation"""
+        """
+        Vẽ power-up với modern design và animation
+        
+        Returns:
+            pygame.Rect: Vùng đã vẽ (None nếu không active)
+        """
         if not self.active:
-            return
+            return None
 
         bg_color = self.COLORS.get(self.type, (255, 255, 255))
         
@@ -53,16 +59,16 @@ class PowerUp:
         float_offset = int(math.sin(time * 0.003) * 5)
         current_y = self.y + float_offset
         
-        # Pulsing glow effect
-        glow_alpha = int(100 + 50 * math.sin(time * 0.005))
+        # Pulsing glow effect (vẽ sẵn theo bậc alpha)
+        assets = get_asset_manager()
+        glow_alpha = assets.glow_alpha(100 + 50 * math.sin(time * 0.005))
         
         # Draw outer glow
-        glow_surf = pygame.Surface((self.WIDTH + 20, self.HEIGHT + 20), pygame.SRCALPHA)
-        glow_color = (*bg_color, glow_alpha)
-        pygame.draw.rect(glow_surf, glow_color, 
-                        (5, 5, self.WIDTH + 10, self.HEIGHT + 10), 
-                        border_radius=12)
-        win.blit(glow_surf, (self.x - 10, current_y - 10))
+        glow_surf = assets.get_sprite(
+            ('powerup_glow', bg_color, glow_alpha),
+            lambda: self._render_glow(bg_color, glow_alpha)
+        )
+        dirty = win.blit(glow_surf, (self.x - 10, current_y - 10))
         
         # Draw main body with rounded corners
         pygame.draw.rect(win, bg_color, 
@@ -81,6 +87,25 @@ class PowerUp:
         # Icon color (dark for visibility on bright backgrounds)
         icon_color = (50, 30, 20)
         self._draw_icon(win, center_x, center_y, icon_color)
+        return dirty
+
+    @classmethod
+    def _render_glow(cls, color, alpha):
+        """
+        Vẽ glow của power-up vào một Surface trong suốt
+        
+        Args:
+            color: Màu power-up (RGB)
+            alpha: Alpha của glow
+        
+        Returns:
+            pygame.Surface: Sprite glow, lệch (-10, -10) so với góc power-up
+        """
+        glow_surf = pygame.Surface((cls.WIDTH + 20, cls.HEIGHT + 20), pygame.SRCALPHA)
+        pygame.draw.rect(glow_surf, (*color, alpha), 
+                        (5, 5, cls.WIDTH + 10, cls.HEIGHT + 10), 
+                        border_radius=12)
+        return glow_surf
 
     def _draw_icon(self, win, cx, cy, color):
         """Hàm helper để vẽ các ký hiệu hình học (được vẽ bằng Polygon/Rect đặc)"""
@@ -161,15 +186,17 @@ class PowerUp:
 class PowerUpManager:
     """Quản lý power-ups"""
 
-    def __init__(self, window_width, window_height):
+    def __init__(self, window_width, window_height, rng=None):
         """
         Khởi tạo manager
         Args:
             window_width: Chiều rộng window
             window_height: Chiều cao window
+            rng: random.Random riêng của trận (None = module random global)
         """
         self.window_width = window_width
         self.window_height = window_height
+        self.rng = rng if rng is not None else random
         self.active_powerups = []
         self.hit_count = 0
         self.spawn_threshold = 5
@@ -204,8 +231,8 @@ class PowerUpManager:
     def spawn_random_powerup(self):
         """Spawn power-up ngẫu nhiên"""
         # Random position (tránh edges)
-        x = random.randint(100, self.window_width - 100)
-        y = random.randint(100, self.window_height - 100)
+        x = self.rng.randint(100, self.window_width - 100)
+        y = self.rng.randint(100, self.window_height - 100)
 
         # Random type
         types = [
@@ -215,7 +242,7 @@ class PowerUpManager:
             PowerUpType.BALL_SPEED_DOWN,
             PowerUpType.PADDLE_SPEED_UP,
         ]
-        powerup_type = random.choice(types)
+        powerup_type = self.rng.choice(types)
 
         powerup = PowerUp(x, y, powerup_type)
         self.active_powerups.append(powerup)
@@ -307,9 +334,18 @@ class PowerUpManager:
         return [target.x, target.y, type_val]
 
     def draw(self, win):
-        """Vẽ tất cả power-ups"""
+        """
+        Vẽ tất cả power-ups
+        
+        Returns:
+            list: Các vùng đã vẽ (pygame.Rect)
+        """
+        dirty = []
         for powerup in self.active_powerups:
-            powerup.draw(win)
+            rect = powerup.draw(win)
+            if rect is not None:
+                dirty.append(rect)
+        return dirty
 
     def reset(self):
         """Reset hệ thống"""
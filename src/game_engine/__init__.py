@@ -2,8 +2,29 @@
 Game Engine Module
 Quản lý logic vật lý của game Pong
 """
-from .ball import Ball
-from .paddle import Paddle
-from .game_manager import GameManager
+import importlib
 
-__all__ = ['Ball', 'Paddle', 'GameManager']
+from .physics import GameInfo, GameSnapshot, BallPhysics, PaddlePhysics, PongPhysics
+from .replay import ReplayRecorder, ReplayPlayer
+
+# Ball, Paddle, GameManager cần pygame nên chỉ import khi được dùng,
+# để headless training (và worker processes) không phải load SDL
+_RENDERING_MODULES = {
+    'Ball': '.ball',
+    'Paddle': '.paddle',
+    'GameManager': '.game_manager',
+}
+
+
+def __getattr__(name):
+    if name in _RENDERING_MODULES:
+        module = importlib.import_module(_RENDERING_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    'Ball', 'Paddle', 'GameManager',
+    'GameInfo', 'GameSnapshot', 'BallPhysics', 'PaddlePhysics', 'PongPhysics',
+    'ReplayRecorder', 'ReplayPlayer'
+]
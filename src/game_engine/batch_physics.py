@@ -0,0 +1,262 @@
+"""
+Batch Physics - TV2 (Dũng)
+Mô phỏng nhiều trận Pong cùng lúc bằng NumPy.
+
+Trạng thái bóng và vợt của mọi trận trong một generation được giữ trong các
+NumPy arrays và được cập nhật cùng lúc mỗi tick. Luật chơi giống hệt
+PongPhysics.loop()/handle_collision(); trận đã kết thúc được loại bằng mask.
+
+Classes:
+    BatchPongPhysics: N trận Pong chạy song song (lock-step)
+"""
+import numpy as np
+from .physics import BallPhysics, PaddlePhysics
+
+
+class BatchPongPhysics:
+    """
+    N trận Pong headless chạy lock-step
+
+    Attributes:
+        num_games (int): Số trận
+        ball_x, ball_y, ball_vx, ball_vy (ndarray): Trạng thái bóng
+        ball_speed (ndarray): Speed modifier của bóng
+        left_y, right_y (ndarray): Vị trí Y của vợt
+        left_height, right_height (ndarray): Chiều cao hiện tại của vợt
+        left_score, right_score (ndarray): Điểm số
+        left_hits, right_hits (ndarray): Số lần đỡ bóng
+        frames (ndarray): Số frame đã chạy của mỗi trận
+        active (ndarray): Mask các trận chưa kết thúc
+    """
+
+    def __init__(self, num_games, window_width, window_height, rngs=None):
+        """
+        Khởi tạo N trận với vị trí spawn chuẩn
+
+        Args:
+            num_games: Số trận chạy song song
+            window_width: Chiều rộng sân
+            window_height: Chiều cao sân
+            rngs: List random.Random của từng trận (None = module random global)
+        """
+        self.num_games = num_games
+        self.window_width = window_width
+        self.window_height = window_height
+
+        self.radius = BallPhysics.RADIUS
+        self.max_vel = BallPhysics.MAX_VEL
+        self.paddle_width = PaddlePhysics.WIDTH
+        self.paddle_vel = PaddlePhysics.VEL
+
+        # Vị trí X của vợt cố định
+        self.left_x = 10.0
+        self.right_x = float(window_width - 10 - PaddlePhysics.WIDTH)
+
+        # Mỗi trận có một BallPhysics riêng chỉ để sinh góc phóng,
+        # nên serve/reset giống hệt PongPhysics
+        if rngs is None:
+            rngs = [None] * num_games
+        self._serves = [
+            BallPhysics(window_width // 2, window_height // 2, rng=rng)
+            for rng in rngs
+        ]
+
+        self.ball_x = np.full(num_games, float(window_width // 2))
+        self.ball_y = np.full(num_games, float(window_height // 2))
+        self.ball_vx = np.array([serve.x_vel for serve in self._serves])
+        self.ball_vy = np.array([serve.y_vel for serve in self._serves])
+        self.ball_speed = np.ones(num_games)
+
+        paddle_y = float(window_height // 2 - PaddlePhysics.HEIGHT // 2)
+        self.left_y = np.full(num_games, paddle_y)
+        self.right_y = np.full(num_games, paddle_y)
+        self.left_height = np.full(num_games, PaddlePhysics.HEIGHT, dtype=np.int64)
+        self.right_height = np.full(num_games, PaddlePhysics.HEIGHT, dtype=np.int64)
+        self.left_speed = np.ones(num_games)
+        self.right_speed = np.ones(num_games)
+
+        self.left_score = np.zeros(num_games, dtype=np.int64)
+        self.right_score = np.zeros(num_games, dtype=np.int64)
+        self.left_hits = np.zeros(num_games, dtype=np.int64)
+        self.right_hits = np.zeros(num_games, dtype=np.int64)
+        self.frames = np.zeros(num_games, dtype=np.int64)
+        self.active = np.ones(num_games, dtype=bool)
+
+    def step(self):
+        """
+        Chạy 1 frame cho mọi trận đang active (giống PongPhysics.loop)
+
+        Returns:
+            ndarray: Mask các trận vừa có người ghi điểm
+        """
+        active = self.active
+        radius = self.radius
+
+        # Di chuyển bóng
+        move = self.ball_speed * active
+        dx = self.ball_vx * move
+        dy = self.ball_vy * move
+        self.ball_x += dx
+        self.ball_y += dy
+        x = self.ball_x
+        y = self.ball_y
+
+        # Va chạm tường trên/dưới
+        wall = active & ((y + radius >= self.window_height) | (y - radius <= 0))
+        self.ball_vy[wall] *= -1
+
+        # Va chạm vợt (vợt trái khi bóng đi sang trái, ngược lại vợt phải)
+        moving_left = self.ball_vx < 0
+        hit_left = self._paddle_contact(active & moving_left, x - radius, dx, dy,
+                                        self.left_x + self.paddle_width, -1,
+                                        self.left_y, self.left_height)
+        hit_right = self._paddle_contact(active & ~moving_left, x + radius, dx, dy,
+                                         self.right_x, 1,
+                                         self.right_y, self.right_height)
+        self.left_hits += hit_left
+        self.right_hits += hit_right
+
+        # Check scoring
+        right_point = active & (x < 0)
+        left_point = active & ~right_point & (x > self.window_width)
+        self.right_score += right_point
+        self.left_score += left_point
+        scored = right_point | left_point
+        for game in np.flatnonzero(scored):
+            self._reset_ball(game)
+
+        self.frames += active
+        return scored
+
+    def _paddle_contact(self, approaching, edge, dx, dy, face, side, paddle_y, paddle_height):
+        """
+        Va chạm swept với 1 phía vợt (giống PongPhysics.handle_collision)
+
+        Args:
+            approaching: Mask các trận có bóng bay về phía vợt này
+            edge: Mép bóng phía vợt sau khi di chuyển
+            dx, dy: Quãng đường bóng đi trong frame
+            face: Tọa độ X mặt vợt
+            side: -1 = vợt trái, 1 = vợt phải
+            paddle_y: Vị trí Y của vợt
+            paddle_height: Chiều cao vợt
+
+        Returns:
+            ndarray: Mask các trận có va chạm
+        """
+        before = edge - dx
+        if side < 0:
+            crossed = approaching & (before > face) & (face >= edge)
+            behind = approaching & (edge <= face)
+        else:
+            crossed = approaching & (before < face) & (face <= edge)
+            behind = approaching & (edge >= face)
+
+        # Thời điểm mép bóng chạm mặt vợt trong frame (0..1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            remaining = np.where(crossed, 1 - (before - face) / (before - edge), 0.0)
+        contact_y = np.where(crossed, self.ball_y - remaining * dy, self.ball_y)
+
+        hit = behind & (contact_y >= paddle_y) & (contact_y <= paddle_y + paddle_height)
+        if not hit.any():
+            return hit
+
+        # Góc bounce theo vị trí hit
+        height = paddle_height[hit]
+        middle_y = paddle_y[hit] + height / 2
+        difference_in_y = middle_y - contact_y[hit]
+        reduction_factor = (height / 2) / self.max_vel
+        self.ball_vx[hit] *= -1
+        self.ball_vy[hit] = -1 * (difference_in_y / reduction_factor)
+
+        # Phần còn lại của frame đi theo hướng mới
+        swept = hit & crossed
+        if swept.any():
+            rest = remaining[swept]
+            speed = self.ball_speed[swept]
+            self.ball_x[swept] = (face - side * self.radius) + rest * self.ball_vx[swept] * speed
+            self.ball_y[swept] = contact_y[swept] + rest * self.ball_vy[swept] * speed
+        return hit
+
+    def _reset_ball(self, game):
+        """
+        Serve lại bóng của 1 trận (giống BallPhysics.reset)
+
+        Args:
+            game: Index của trận
+        """
+        serve = self._serves[game]
+        serve.x_vel = self.ball_vx[game]
+        serve.y_vel = self.ball_vy[game]
+        serve.reset()
+        self.ball_x[game] = serve.x
+        self.ball_y[game] = serve.y
+        self.ball_vx[game] = serve.x_vel
+        self.ball_vy[game] = serve.y_vel
+        self.ball_speed[game] = serve.speed_modifier
+
+    def reset_games(self, games, rngs):
+        """
+        Bắt đầu lại một số trận từ vị trí spawn chuẩn (giống PongPhysics mới)
+
+        Args:
+            games: Index các trận
+            rngs: random.Random của từng trận (cùng thứ tự games)
+        """
+        for game, rng in zip(games, rngs):
+            serve = BallPhysics(self.window_width // 2, self.window_height // 2, rng=rng)
+            self._serves[game] = serve
+            self.ball_x[game] = serve.x
+            self.ball_y[game] = serve.y
+            self.ball_vx[game] = serve.x_vel
+            self.ball_vy[game] = serve.y_vel
+
+        games = np.asarray(games, dtype=np.int64)
+        paddle_y = float(self.window_height // 2 - PaddlePhysics.HEIGHT // 2)
+        self.ball_speed[games] = 1.0
+        self.left_y[games] = paddle_y
+        self.right_y[games] = paddle_y
+        self.left_height[games] = PaddlePhysics.HEIGHT
+        self.right_height[games] = PaddlePhysics.HEIGHT
+        self.left_speed[games] = 1.0
+        self.right_speed[games] = 1.0
+        self.left_score[games] = 0
+        self.right_score[games] = 0
+        self.left_hits[games] = 0
+        self.right_hits[games] = 0
+        self.frames[games] = 0
+        self.active[games] = True
+
+    def move_paddles(self, left_moves, right_moves):
+        """
+        Di chuyển vợt của mọi trận với boundary checking (giống move_paddle)
+
+        Args:
+            left_moves: Array hướng vợt trái (-1 = lên, 0 = đứng yên, 1 = xuống)
+            right_moves: Array hướng vợt phải
+        """
+        self._move(self.left_y, self.left_height, self.left_speed, left_moves)
+        self._move(self.right_y, self.right_height, self.right_speed, right_moves)
+
+    def _move(self, paddle_y, paddle_height, speed, moves):
+        """Di chuyển 1 phía vợt, bỏ qua bước vượt khỏi màn hình"""
+        vel = self.paddle_vel * speed
+        up = self.active & (moves < 0) & (paddle_y - vel >= 0)
+        down = (self.active & (moves > 0)
+                & (paddle_y + paddle_height <= self.window_height))
+        paddle_y -= vel * up
+        paddle_y += vel * down
+
+    def retire(self, mask):
+        """
+        Kết thúc các trận trong mask (không được cập nhật nữa)
+
+        Args:
+            mask: Bool array các trận cần dừng
+        """
+        self.active &= ~mask
+
+    @property
+    def total_hits(self):
+        """Tổng số hits của mỗi trận"""
+        return self.left_hits + self.right_hits
@@ -5,32 +5,32 @@ Quản lý điểm số, va chạm và game state
 import pygame
 from .ball import Ball
 from .paddle import Paddle
+from .physics import GameInfo, PongPhysics
+from utils.assets import get_asset_manager
 
 
-class GameInfo:
-    """Thông tin game state"""
-    
-    def __init__(self, left_hits, right_hits, left_score, right_score):
-        self.left_hits = left_hits
-        self.right_hits = right_hits
-        self.left_score = left_score
-        self.right_score = right_score
-
-
-class GameManager:
+class GameManager(PongPhysics):
     """
     Quản lý logic game chính
     - Va chạm
     - Điểm số
     - Drawing
+    
+    Va chạm, điểm số và game loop kế thừa từ PongPhysics.
     """
     
+    BALL_TYPE = Ball
+    PADDLE_TYPE = Paddle
     SCORE_FONT = None  # Will be initialized later
     WHITE = (255, 255, 255)
     BLACK = (0, 0, 0)
     RED = (255, 0, 0)
     
-    def __init__(self, window, window_width, window_height):
+    # Layer tĩnh (gradient + divider) dùng chung, xem _get_static_layer
+    _static_layer = None
+    _static_layer_key = None
+    
+    def __init__(self, window, window_width, window_height, rng=None):
         """
         Khởi tạo game manager
         
@@ -38,10 +38,11 @@ class GameManager:
             window: Pygame window
             window_width: Chiều rộng window
             window_height: Chiều cao window
+            rng: random.Random riêng của trận (None = module random global)
         """
-        self.window_width = window_width
-        self.window_height = window_height
+        super().__init__(window_width, window_height, rng=rng)
         self.window = window
+        self.assets = get_asset_manager()
         
         # Initialize font if not yet done
         if GameManager.SCORE_FONT is None:
@@ -49,20 +50,6 @@ class GameManager:
                 GameManager.SCORE_FONT = pygame.font.SysFont("comicsans", 50)
             except:
                 GameManager.SCORE_FONT = pygame.font.Font(None, 50)
-        
-        # Tạo game objects
-        self.left_paddle = Paddle(10, window_height // 2 - Paddle.HEIGHT // 2)
-        self.right_paddle = Paddle(
-            window_width - 10 - Paddle.WIDTH, 
-            window_height // 2 - Paddle.HEIGHT // 2
-        )
-        self.ball = Ball(window_width // 2, window_height // 2)
-        
-        # Game state
-        self.left_score = 0
-        self.right_score = 0
-        self.left_hits = 0
-        self.right_hits = 0
     
     def _draw_score(self):
         """Vẽ điểm số với modern styling - badges đẹp với icons"""
@@ -88,15 +75,16 @@ class GameManager:
         score_y = 75  # Vị trí score thấp hơn badge
         
         # Left score
-        shadow_left = self.SCORE_FONT.render(f"{self.left_score}", True, (255, 255, 255, 100))
-        left_score_text = self.SCORE_FONT.render(f"{self.left_score}", True, left_color)
+        render = self.assets.render_text
+        shadow_left = render(self.SCORE_FONT, f"{self.left_score}", (255, 255, 255, 100))
+        left_score_text = render(self.SCORE_FONT, f"{self.left_score}", left_color)
         left_x_pos = self.window_width // 4 - left_score_text.get_width() // 2
         self.window.blit(shadow_left, (left_x_pos + 3, score_y + 3))
         self.window.blit(left_score_text, (left_x_pos, score_y))
         
         # Right score
-        shadow_right = self.SCORE_FONT.render(f"{self.right_score}", True, (255, 255, 255, 100))
-        right_score_text = self.SCORE_FONT.render(f"{self.right_score}", True, right_color)
+        shadow_right = render(self.SCORE_FONT, f"{self.right_score}", (255, 255, 255, 100))
+        right_score_text = render(self.SCORE_FONT, f"{self.right_score}", right_color)
         right_x_pos = self.window_width * 3 // 4 - right_score_text.get_width() // 2
         self.window.blit(shadow_right, (right_x_pos + 3, score_y + 3))
         self.window.blit(right_score_text, (right_x_pos, score_y))
@@ -130,10 +118,10 @@ class GameManager:
         pygame.draw.rect(self.window, (255, 255, 255), (icon_x - 2, icon_y - 6, 4, 12))
         
         # Text with shadow
-        font = pygame.font.Font(None, 32)
+        font = self.assets.get_font(None, 32)
         text_color = (80, 60, 40)
-        shadow = font.render(text, True, (50, 50, 50))
-        text_surf = font.render(text, True, text_color)
+        shadow = self.assets.render_text(font, text, (50, 50, 50))
+        text_surf = self.assets.render_text(font, text, text_color)
         text_x = badge_x + 50
         text_y = badge_y + height // 2 - text_surf.get_height() // 2
         self.window.blit(shadow, (text_x + 2, text_y + 2))
@@ -174,10 +162,10 @@ class GameManager:
             pygame.draw.line(self.window, border_color, (icon_x + 8 * i, icon_y + 6), (icon_x + 11 * i, icon_y + 6), 2)
         
         # Text with shadow
-        font = pygame.font.Font(None, 36)
+        font = self.assets.get_font(None, 36)
         text_color = (80, 60, 40)
-        shadow = font.render(text, True, (50, 50, 50))
-        text_surf = font.render(text, True, text_color)
+        shadow = self.assets.render_text(font, text, (50, 50, 50))
+        text_surf = self.assets.render_text(font, text, text_color)
         text_x = badge_x + 55
         text_y = badge_y + height // 2 - text_surf.get_height() // 2
         self.window.blit(shadow, (text_x + 2, text_y + 2))
@@ -200,13 +188,20 @@ class GameManager:
                         (box_x, box_y, box_width, box_height), 3, border_radius=10)
         
         # Hits text
-        hits_font = pygame.font.Font(None, 32)
-        hits_text = hits_font.render(f"HITS: {total_hits}", True, (80, 60, 40))
+        hits_font = self.assets.get_font(None, 32)
+        hits_text = self.assets.render_text(hits_font, f"HITS: {total_hits}", (80, 60, 40))
         self.window.blit(hits_text, 
                         (self.window_width // 2 - hits_text.get_width() // 2, box_y + 10))
     
-    def _draw_gradient_background(self):
-        """Vẽ gradient background hiện đại (vàng-cam theo hình tham khảo)"""
+    def _draw_gradient_background(self, surface=None):
+        """
+        Vẽ gradient background hiện đại (vàng-cam theo hình tham khảo)
+        
+        Args:
+            surface: Surface đích (None = window)
+        """
+        if surface is None:
+            surface = self.window
         # Tạo gradient từ vàng sáng sang cam
         for y in range(self.window_height):
             progress = y / self.window_height
@@ -214,10 +209,17 @@ class GameManager:
             r = 255
             g = int(220 - (60 * progress))
             b = int(100 - (20 * progress))
-            pygame.draw.line(self.window, (r, g, b), (0, y), (self.window_width, y))
+            pygame.draw.line(surface, (r, g, b), (0, y), (self.window_width, y))
     
-    def _draw_divider(self):
-        """Vẽ đường chia giữa với modern style"""
+    def _draw_divider(self, surface=None):
+        """
+        Vẽ đường chia giữa với modern style
+        
+        Args:
+            surface: Surface đích (None = window)
+        """
+        if surface is None:
+            surface = self.window
         center_x = self.window_width // 2
         dash_height = 20
         dash_spacing = 35
@@ -226,65 +228,37 @@ class GameManager:
         for i in range(0, self.window_height, dash_spacing):
             # Màu trắng với độ mờ cao cho professional look
             pygame.draw.rect(
-                self.window, (255, 255, 255),
+                surface, (255, 255, 255),
                 (center_x - line_width//2, i, line_width, dash_height),
                 border_radius=3
             )
     
-    def handle_collision(self):
+    def _get_static_layer(self):
         """
-        Xử lý va chạm bóng với tường và vợt
+        Gradient + divider đã vẽ sẵn cho độ phân giải hiện tại
+        
+        Hai lớp này không đổi giữa các frame nhưng tốn window_height lần
+        draw.line, nên chỉ vẽ 1 lần vào Surface và blit mỗi frame. Layer
+        dùng chung cho mọi GameManager (dashboard tạo game mới mỗi trận)
+        và được vẽ lại khi độ phân giải thay đổi.
         
         Returns:
-            bool: True nếu có va chạm với vợt
+            pygame.Surface: Layer cùng kích thước sân
         """
-        ball = self.ball
-        left_paddle = self.left_paddle
-        right_paddle = self.right_paddle
-        
-        paddle_collision = False
-        
-        # Va chạm tường trên/dưới
-        if ball.y + ball.RADIUS >= self.window_height:
-            ball.y_vel *= -1
-        elif ball.y - ball.RADIUS <= 0:
-            ball.y_vel *= -1
-        
-        # Va chạm vợt trái
-        if ball.x_vel < 0:
-            paddle_height = left_paddle.get_current_height()
-            if ball.y >= left_paddle.y and ball.y <= left_paddle.y + paddle_height:
-                if ball.x - ball.RADIUS <= left_paddle.x + Paddle.WIDTH:
-                    ball.x_vel *= -1
-                    
-                    # Tính góc bounce dựa trên vị trí hit
-                    middle_y = left_paddle.y + paddle_height / 2
-                    difference_in_y = middle_y - ball.y
-                    reduction_factor = (paddle_height / 2) / ball.MAX_VEL
-                    y_vel = difference_in_y / reduction_factor
-                    ball.y_vel = -1 * y_vel
-                    
-                    self.left_hits += 1
-                    paddle_collision = True
-        
-        # Va chạm vợt phải
-        else:
-            paddle_height = right_paddle.get_current_height()
-            if ball.y >= right_paddle.y and ball.y <= right_paddle.y + paddle_height:
-                if ball.x + ball.RADIUS >= right_paddle.x:
-                    ball.x_vel *= -1
-                    
-                    # Tính góc bounce
-                    middle_y = right_paddle.y + paddle_height / 2
-                    difference_in_y = middle_y - ball.y
-                    reduction_factor = (paddle_height / 2) / ball.MAX_VEL
-                    y_vel = difference_in_y / reduction_factor
-                    ball.y_vel = -1 * y_vel
-                    
-                    self.right_hits += 1
-                    paddle_collision = True
-        
-        return paddle_collision
+        key = (self.window_width, self.window_height)
+        if GameManager._static_layer_key != key:
+            layer = pygame.Surface(key, 0, self.window)
+            self._draw_gradient_background(layer)
+            self._draw_divider(layer)
+            GameManager._static_layer = layer
+            GameManager._static_layer_key = key
+        return GameManager._static_layer
+    
+    @classmethod
+    def clear_layer_cache(cls):
+        """Bỏ layer đã vẽ sẵn (gọi sau mỗi lần set_mode, vì layer theo format của display)"""
+        cls._static_layer = None
+        cls._static_layer_key = None
     
     def draw(self, draw_score=True, draw_hits=False, bg_color=None):
         """
@@ -297,11 +271,11 @@ class GameManager:
         """
         if bg_color:
             self.window.fill(bg_color)
+            self._draw_divider()
         else:
             # Modern gradient background (yellow-orange like reference image)
-            self._draw_gradient_background()
-        
-        self._draw_divider()
+            # + divider, vẽ sẵn 1 lần cho mỗi độ phân giải
+            self.window.blit(self._get_static_layer(), (0, 0))
         
         if draw_score:
             self._draw_score()
@@ -313,66 +287,3 @@ class GameManager:
         self.left_paddle.draw(self.window)
         self.right_paddle.draw(self.window)
         self.ball.draw(self.window)
-    
-    def move_paddle(self, left=True, up=True):
-        """
-        Di chuyển vợt với boundary checking
-        
-        Args:
-            left: True = vợt trái, False = vợt phải
-            up: True = lên, False = xuống
-        
-        Returns:
-            bool: True nếu di chuyển hợp lệ
-        """
-        paddle = self.left_paddle if left else self.right_paddle
-        paddle_height = paddle.get_current_height()
-        vel = paddle.VEL * paddle.speed_modifier
-        
-        if left:
-            if up and paddle.y - vel < 0:
-                return False
-            if not up and paddle.y + paddle_height > self.window_height:
-                return False
-            paddle.move(up)
-        else:
-            if up and paddle.y - vel < 0:
-                return False
-            if not up and paddle.y + paddle_height > self.window_height:
-                return False
-            paddle.move(up)
-        
-        return True
-    
-    def loop(self):
-        """
-        Game loop chính
-        
-        Returns:
-            GameInfo: Thông tin game hiện tại
-        """
-        self.ball.move()
-        self.handle_collision()
-        
-        # Check scoring
-        if self.ball.x < 0:
-            self.ball.reset()
-            self.right_score += 1
-        elif self.ball.x > self.window_width:
-            self.ball.reset()
-            self.left_score += 1
-        
-        return GameInfo(
-            self.left_hits, self.right_hits, 
-            self.left_score, self.right_score
-        )
-    
-    def reset(self):
-        """Reset game về trạng thái ban đầu"""
-        self.ball.reset()
-        self.left_paddle.reset()
-        self.right_paddle.reset()
-        self.left_score = 0
-        self.right_score = 0
-        self.left_hits = 0
-        self.right_hits = 0
@@ -3,21 +3,25 @@ Paddle Class - TV2 (Dũng)
 Xử lý vợt và di chuyển với hỗ trợ power-up modifiers.
 
 Module này cung cấp Paddle class để quản lý trạng thái, chuyển động,
-rendering và modifiers của vợt người chơi/AI trong game Pong.
+rendering và modifiers của vợt người chơi/AI trong game Pong. Phần vật lý
+nằm trong PaddlePhysics (physics.py) để có thể chạy headless không cần pygame.
 
 Classes:
     Paddle: Đại diện cho vợt với visual effects và modifiers
 """
 import pygame
-from typing import Tuple, Optional
+from typing import Tuple
+from .physics import PaddlePhysics
+from utils.assets import get_asset_manager
 
 
-class Paddle:
+class Paddle(PaddlePhysics):
     """
     Đại diện cho vợt trong game Pong với power-up modifiers.
     
     Class này quản lý vị trí, kích thước, chuyển động và rendering của vợt.
     Hỗ trợ dynamic height và speed modifiers từ hệ thống power-ups.
+    Toàn bộ vật lý được kế thừa từ PaddlePhysics, class này chỉ thêm draw().
     
     Attributes:
         VEL (float): Vận tốc cơ bản của vợt (pixels per frame)
@@ -29,41 +33,12 @@ class Paddle:
         original_y (float): Tọa độ Y ban đầu để reset
         height_modifier (float): Hệ số điều chỉnh chiều cao (1.0 = normal)
         speed_modifier (float): Hệ số điều chỉnh tốc độ (1.0 = normal)
+        vel (float): Vận tốc cơ bản của vợt này (mặc định VEL)
     """
+
+    __slots__ = ()  # Chỉ thêm rendering, state nằm trong slots của class cha
     
-    VEL: float = 4.0
-    WIDTH: int = 20
-    HEIGHT: int = 100
-    
-    def __init__(self, x: float, y: float) -> None:
-        """
-        Khởi tạo đối tượng Paddle với vị trí ban đầu.
-        
-        Args:
-            x: Tọa độ X ban đầu của vợt (pixels). Phải là số không âm.
-            y: Tọa độ Y ban đầu của vợt (pixels). Phải là số không âm.
-            
-        Raises:
-            ValueError: Nếu x hoặc y là số âm
-            TypeError: Nếu x hoặc y không phải là số
-            
-        Note:
-            Modifiers được khởi tạo ở 1.0 (giá trị bình thường, không thay đổi).
-        """
-        # Input validation
-        if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
-            raise TypeError(f"Position coordinates must be numeric, got x={type(x)}, y={type(y)}")
-        if x < 0 or y < 0:
-            raise ValueError(f"Position coordinates must be non-negative, got x={x}, y={y}")
-        
-        self.x = self.original_x = float(x)
-        self.y = self.original_y = float(y)
-        
-        # Modifiers cho power-ups (1.0 = no modification)
-        self.height_modifier = 1.0
-        self.speed_modifier = 1.0
-    
-    def draw(self, win: pygame.Surface, color: Tuple[int, int, int] = (255, 255, 255)) -> None:
+    def draw(self, win: pygame.Surface, color: Tuple[int, int, int] = (255, 255, 255)) -> pygame.Rect:
         """
         Render vợt lên surface với gradient và glow effects.
         
@@ -76,6 +51,9 @@ class Paddle:
                   Mặc định là trắng (255, 255, 255). Note: tham số này
                   hiện không được sử dụng do theme tối đã hard-code.
                   
+        Returns:
+            pygame.Rect: Vùng màn hình đã vẽ (cho dirty-rect rendering)
+                  
         Note:
             - Chiều cao thực tế = HEIGHT * height_modifier
             - Màu được hard-code là (60, 40, 30) cho theme tối
@@ -86,18 +64,15 @@ class Paddle:
         # Sử dụng màu tối đậm cho vợt trên nền sáng
         paddle_color = (60, 40, 30)
         
-        # Glow effect sáng
-        glow_surf = pygame.Surface((self.WIDTH + 12, current_height + 12), pygame.SRCALPHA)
-        for i in range(3):
-            glow_alpha = 40 - i * 10
-            glow_color = (*paddle_color, glow_alpha)
-            pygame.draw.rect(glow_surf, glow_color, 
-                           (i, i, self.WIDTH + 12 - 2*i, current_height + 12 - 2*i), 
-                           border_radius=8)
-        win.blit(glow_surf, (self.x - 6, self.y - 6))
+        # Glow effect sáng (vẽ sẵn cho mỗi chiều cao, xem _render_glow)
+        glow_surf = get_asset_manager().get_sprite(
+            ('paddle_glow', current_height, paddle_color),
+            lambda: self._render_glow(current_height, paddle_color)
+        )
+        dirty = win.blit(glow_surf, (self.x - 6, self.y - 6))
         
         # Main paddle body
-        pygame.draw.rect(win, paddle_color, 
+        body = pygame.draw.rect(win, paddle_color, 
                         (self.x, self.y, self.WIDTH, current_height), 
                         border_radius=6)
         
@@ -106,98 +81,25 @@ class Paddle:
         pygame.draw.rect(win, highlight_color, 
                         (self.x, self.y, self.WIDTH, current_height), 
                         3, border_radius=6)
+        return dirty.union(body)
     
-    def move(self, up: bool = True) -> None:
-        """
-        Di chuyển vợt theo hướng chỉ định.
-        
-        Tốc độ di chuyển = VEL * speed_modifier. Method này chỉ update
-        vị trí, không kiểm tra boundary (kiểm tra boundary trong GameManager).
-        
-        Args:
-            up: True để di chuyển lên (giảm Y), False để di chuyển xuống (tăng Y).
-                Mặc định là True.
-                
-        Note:
-            - Trong pygame, Y tăng khi xuống, giảm khi lên
-            - Speed modifier ảnh hưởng trực tiếp đến vận tốc
-            - Không có boundary check, có thể di chuyển ra ngoài màn hình
-        """
-        vel = self.VEL * self.speed_modifier
-        if up:
-            self.y -= vel
-        else:
-            self.y += vel
-    
-    def reset(self) -> None:
-        """
-        Reset vợt về trạng thái ban đầu.
-        
-        Đặt lại vị trí về original position và reset tất cả modifiers
-        về giá trị mặc định (1.0).
-        
-        Note:
-            Được gọi khi bắt đầu game mới hoặc sau khi có người thắng.
-        """
-        self.x = self.original_x
-        self.y = self.original_y
-        self.height_modifier = 1.0
-        self.speed_modifier = 1.0
-    
-    def get_current_height(self) -> int:
-        """
-        Lấy chiều cao hiện tại của vợt (có tính modifier).
-        
-        Returns:
-            Chiều cao hiện tại tính bằng pixels (HEIGHT * height_modifier),
-            được làm tròn thành số nguyên.
-            
-        Examples:
-            >>> paddle = Paddle(10, 100)
-            >>> paddle.height_modifier = 1.5
-            >>> paddle.get_current_height()
-            150
-        """
-        return int(self.HEIGHT * self.height_modifier)
-    
-    def apply_height_modifier(self, modifier: float) -> None:
+    @classmethod
+    def _render_glow(cls, height: int, color: Tuple[int, int, int]) -> pygame.Surface:
         """
-        Áp dụng modifier cho chiều cao vợt.
+        Vẽ các lớp glow quanh vợt vào một Surface trong suốt.
         
         Args:
-            modifier: Hệ số nhân cho chiều cao. Phải > 0.
-                     - 0.5: Vợt ngắn hơn 50%
-                     - 1.0: Chiều cao bình thường
-                     - 1.5: Vợt cao hơn 50%
-                     
-        Raises:
-            ValueError: Nếu modifier <= 0
-            TypeError: Nếu modifier không phải số
-        """
-        if not isinstance(modifier, (int, float)):
-            raise TypeError(f"Height modifier must be numeric, got {type(modifier)}")
-        if modifier <= 0:
-            raise ValueError(f"Height modifier must be positive, got {modifier}")
+            height: Chiều cao hiện tại của vợt (pixels)
+            color: Màu glow (RGB)
             
-        self.height_modifier = float(modifier)
-    
-    def apply_speed_modifier(self, modifier: float) -> None:
-        """
-        Áp dụng modifier cho tốc độ di chuyển vợt.
-        
-        Args:
-            modifier: Hệ số nhân cho tốc độ. Phải > 0.
-                     - 0.5: Vợt chậm hơn 50%
-                     - 1.0: Tốc độ bình thường
-                     - 1.5: Vợt nhanh hơn 50%
-                     
-        Raises:
-            ValueError: Nếu modifier <= 0
-            TypeError: Nếu modifier không phải số
+        Returns:
+            pygame.Surface: Sprite glow, lệch (-6, -6) so với góc vợt
         """
-        if not isinstance(modifier, (int, float)):
-            raise TypeError(f"Speed modifier must be numeric, got {type(modifier)}")
-        if modifier <= 0:
-            raise ValueError(f"Speed modifier must be positive, got {modifier}")
-            
-        self.speed_modifier = float(modifier)
+        glow_surf = pygame.Surface((cls.WIDTH + 12, height + 12), pygame.SRCALPHA)
+        for i in range(3):
+            glow_alpha = 40 - i * 10
+            glow_color = (*color, glow_alpha)
+            pygame.draw.rect(glow_surf, glow_color, 
+                           (i, i, cls.WIDTH + 12 - 2*i, height + 12 - 2*i), 
+                           border_radius=8)
+        return glow_surf
@@ -0,0 +1,773 @@
+"""
+Physics Core - TV2 (Dũng)
+Luật chơi Pong thuần Python, không phụ thuộc pygame.
+
+Module này chứa toàn bộ vật lý của game (di chuyển, va chạm, tính điểm) để
+trainer có thể chạy headless mà không cần khởi tạo SDL. Ball, Paddle và
+GameManager kế thừa các class này và chỉ bổ sung phần rendering.
+
+Classes:
+    GameInfo: Thông tin game state trả về từ mỗi frame
+    GameSnapshot: Bản chụp bất biến của trận (snapshot/restore)
+    BallPhysics: Vị trí, vận tốc và modifiers của bóng
+    PaddlePhysics: Vị trí, kích thước và modifiers của vợt
+    PongPhysics: Va chạm, điểm số và game loop
+"""
+import math
+import random
+from typing import List, NamedTuple
+
+
+class GameInfo:
+    """
+    Thông tin game state
+
+    PongPhysics giữ một GameInfo duy nhất và cập nhật nó mỗi frame, nên
+    caller cần giữ giá trị qua nhiều frame phải tự copy.
+    """
+
+    __slots__ = ('left_hits', 'right_hits', 'left_score', 'right_score')
+
+    def __init__(self, left_hits, right_hits, left_score, right_score):
+        self.left_hits = left_hits
+        self.right_hits = right_hits
+        self.left_score = left_score
+        self.right_score = right_score
+
+
+class GameSnapshot(NamedTuple):
+    """
+    Bản chụp bất biến của một trận (PongPhysics.snapshot)
+
+    Chỉ gồm tuples và số nên có thể dùng chung giữa nhiều nhánh rollout
+    mà không cần copy; mỗi nhánh chỉ tạo state riêng khi restore().
+
+    Attributes:
+        ball: (x, y, x_vel, y_vel, speed_modifier, max_vel)
+        left_paddle: (y, height_modifier, speed_modifier, vel)
+        right_paddle: (y, height_modifier, speed_modifier, vel)
+        left_score, right_score: Điểm số
+        left_hits, right_hits: Số lần đỡ bóng
+        rng_state: rng.getstate() (quyết định các lần serve sau)
+    """
+
+    ball: tuple
+    left_paddle: tuple
+    right_paddle: tuple
+    left_score: int
+    right_score: int
+    left_hits: int
+    right_hits: int
+    rng_state: tuple
+
+
+class BallPhysics:
+    """
+    Trạng thái và chuyển động của bóng (không có rendering).
+
+    Attributes:
+        MAX_VEL (float): Vận tốc tối đa của bóng (pixels per frame)
+        RADIUS (int): Bán kính của bóng (pixels)
+        x (float): Tọa độ X hiện tại
+        y (float): Tọa độ Y hiện tại
+        original_x (float): Tọa độ X ban đầu để reset
+        original_y (float): Tọa độ Y ban đầu để reset
+        x_vel (float): Vận tốc theo trục X
+        y_vel (float): Vận tốc theo trục Y
+        speed_modifier (float): Hệ số điều chỉnh tốc độ từ power-ups
+        rng: Nguồn random cho góc phóng (random.Random hoặc module random)
+        max_vel (float): Vận tốc tối đa của bóng này (mặc định MAX_VEL)
+    """
+
+    MAX_VEL: float = 5.0
+    RADIUS: int = 7
+
+    # Không có __dict__ mỗi instance: nhẹ hơn và truy cập attribute nhanh hơn
+    __slots__ = ('x', 'y', 'original_x', 'original_y', 'x_vel', 'y_vel',
+                 'speed_modifier', 'rng', 'max_vel')
+
+    def __init__(self, x: float, y: float, rng=None) -> None:
+        """
+        Khởi tạo bóng với vị trí và vận tốc ban đầu.
+
+        Bóng được khởi tạo với góc phóng ngẫu nhiên trong khoảng [-30°, 30°]
+        và hướng random (trái hoặc phải). Vận tốc được tính toán dựa trên
+        góc phóng và MAX_VEL constant.
+
+        Args:
+            x: Tọa độ X ban đầu của bóng (pixels). Phải là số dương.
+            y: Tọa độ Y ban đầu của bóng (pixels). Phải là số dương.
+            rng: random.Random riêng của trận (None = module random global).
+                 Cùng seed cho cùng chuỗi góc phóng.
+
+        Raises:
+            ValueError: Nếu x hoặc y là số âm
+            TypeError: Nếu x hoặc y không phải là số
+        """
+        # Input validation
+        if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
+            raise TypeError(f"Position coordinates must be numeric, got x={type(x)}, y={type(y)}")
+        if x < 0 or y < 0:
+            raise ValueError(f"Position coordinates must be non-negative, got x={x}, y={y}")
+
+        self.x = self.original_x = float(x)
+        self.y = self.original_y = float(y)
+        self.rng = rng if rng is not None else random
+        self.max_vel = self.MAX_VEL
+
+        # Random angle và direction
+        angle = self._get_random_angle(-30, 30, [0])
+        pos = 1 if self.rng.random() < 0.5 else -1
+
+        self.x_vel = pos * abs(math.cos(angle) * self.max_vel)
+        self.y_vel = math.sin(angle) * self.max_vel
+
+        # Speed modifier cho power-ups (1.0 = normal speed)
+        self.speed_modifier = 1.0
+
+    def _get_random_angle(self, min_angle: int, max_angle: int, excluded: List[float]) -> float:
+        """
+        Tạo góc phóng ngẫu nhiên trong khoảng cho trước, tránh các góc excluded.
+
+        Method này sinh góc random trong khoảng [min_angle, max_angle] độ
+        và đảm bảo không trùng với bất kỳ giá trị nào trong danh sách excluded.
+
+        Args:
+            min_angle: Góc tối thiểu (degrees). Nên trong khoảng [-90, 90].
+            max_angle: Góc tối đa (degrees). Phải lớn hơn min_angle.
+            excluded: Danh sách các góc cần tránh (radians).
+
+        Returns:
+            Góc phóng được chọn (radians), không nằm trong excluded list.
+
+        Raises:
+            ValueError: Nếu max_angle <= min_angle
+
+        Note:
+            Góc được trả về ở dạng radians, trong khi input là degrees.
+            Infinite loop có thể xảy ra nếu excluded list quá lớn.
+        """
+        if max_angle <= min_angle:
+            raise ValueError(f"max_angle ({max_angle}) must be greater than min_angle ({min_angle})")
+
+        angle = 0.0
+        max_attempts = 100  # Prevent infinite loop
+        attempts = 0
+
+        while angle in excluded and attempts < max_attempts:
+            angle = math.radians(self.rng.randrange(min_angle, max_angle))
+            attempts += 1
+
+        if attempts >= max_attempts:
+            # Fallback: return a safe default angle if can't find non-excluded angle
+            angle = math.radians((min_angle + max_angle) // 2)
+
+        return angle
+
+    def move(self) -> None:
+        """
+        Cập nhật vị trí bóng dựa trên vận tốc hiện tại và speed modifier.
+
+        Phương thức này được gọi mỗi frame để update vị trí bóng.
+        Tốc độ cuối cùng = base_velocity * speed_modifier.
+
+        Speed modifier có thể thay đổi từ power-ups:
+        - < 1.0: Bóng chậm hơn (slow-motion)
+        - = 1.0: Tốc độ bình thường
+        - > 1.0: Bóng nhanh hơn (speed boost)
+
+        Note:
+            Method này không kiểm tra collision, chỉ update vị trí.
+            Collision detection được xử lý trong PongPhysics.
+        """
+        self.x += self.x_vel * self.speed_modifier
+        self.y += self.y_vel * self.speed_modifier
+
+    def reset(self) -> None:
+        """
+        Reset bóng về vị trí ban đầu với vận tốc mới.
+
+        Phương thức này được gọi khi có người ghi điểm để bắt đầu vòng mới.
+        Bóng được đặt lại ở trung tâm và được phóng về hướng ngược lại với
+        góc random mới.
+
+        Behaviors:
+            - Vị trí: Reset về (original_x, original_y)
+            - Góc: Random mới trong khoảng [-30°, 30°]
+            - Hướng X: Đảo ngược hướng hiện tại
+            - Hướng Y: Random dựa trên góc mới
+            - Speed modifier: Reset về 1.0 (normal speed)
+
+        Note:
+            Method này đảm bảo bóng luôn bay về hướng người vừa bị ghi điểm.
+        """
+        self.x = self.original_x
+        self.y = self.original_y
+
+        angle = self._get_random_angle(-30, 30, [0])
+        x_vel = abs(math.cos(angle) * self.max_vel)
+        y_vel = math.sin(angle) * self.max_vel
+
+        self.y_vel = y_vel
+        self.x_vel *= -1  # Reverse direction
+        self.speed_modifier = 1.0
+
+    def apply_speed_modifier(self, modifier: float) -> None:
+        """
+        Áp dụng hệ số tốc độ từ power-ups hoặc difficulty settings.
+
+        Phương thức này cho phép thay đổi tốc độ bóng mà không thay đổi
+        vận tốc cơ bản. Modifier được nhân với vận tốc trong move().
+
+        Args:
+            modifier: Hệ số nhân cho tốc độ. Phải > 0.
+                     - 0.5: Bóng chậm 50%
+                     - 1.0: Tốc độ bình thường (mặc định)
+                     - 1.5: Bóng nhanh 50%
+                     - 2.0: Bóng nhanh gấp đôi
+
+        Raises:
+            ValueError: Nếu modifier <= 0 (không cho phép tốc độ âm hoặc 0)
+            TypeError: Nếu modifier không phải là số
+
+        Examples:
+            >>> ball.apply_speed_modifier(1.5)  # Tăng tốc 50%
+            >>> ball.apply_speed_modifier(0.7)  # Giảm tốc 30%
+
+        Note:
+            Modifier quá cao (>3.0) có thể gây ra collision detection issues.
+            Khuyến nghị giữ modifier trong khoảng [0.5, 2.0].
+        """
+        if not isinstance(modifier, (int, float)):
+            raise TypeError(f"Speed modifier must be numeric, got {type(modifier)}")
+        if modifier <= 0:
+            raise ValueError(f"Speed modifier must be positive, got {modifier}")
+        if modifier > 5.0:
+            # Warning for extreme values but don't raise error
+            print(f"[WARNING] Extreme speed modifier {modifier} may cause issues")
+
+        self.speed_modifier = float(modifier)
+
+
+class PaddlePhysics:
+    """
+    Trạng thái và chuyển động của vợt (không có rendering).
+
+    Attributes:
+        VEL (float): Vận tốc cơ bản của vợt (pixels per frame)
+        WIDTH (int): Chiều rộng vợt (pixels)
+        HEIGHT (int): Chiều cao cơ bản của vợt (pixels)
+        x (float): Tọa độ X hiện tại
+        y (float): Tọa độ Y hiện tại
+        original_x (float): Tọa độ X ban đầu để reset
+        original_y (float): Tọa độ Y ban đầu để reset
+        height_modifier (float): Hệ số điều chỉnh chiều cao (1.0 = normal)
+        speed_modifier (float): Hệ số điều chỉnh tốc độ (1.0 = normal)
+        vel (float): Vận tốc cơ bản của vợt này (mặc định VEL)
+    """
+
+    VEL: float = 4.0
+    WIDTH: int = 20
+    HEIGHT: int = 100
+
+    __slots__ = ('x', 'y', 'original_x', 'original_y',
+                 'height_modifier', 'speed_modifier', 'vel')
+
+    def __init__(self, x: float, y: float) -> None:
+        """
+        Khởi tạo vợt với vị trí ban đầu.
+
+        Args:
+            x: Tọa độ X ban đầu của vợt (pixels). Phải là số không âm.
+            y: Tọa độ Y ban đầu của vợt (pixels). Phải là số không âm.
+
+        Raises:
+            ValueError: Nếu x hoặc y là số âm
+            TypeError: Nếu x hoặc y không phải là số
+
+        Note:
+            Modifiers được khởi tạo ở 1.0 (giá trị bình thường, không thay đổi).
+        """
+        # Input validation
+        if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
+            raise TypeError(f"Position coordinates must be numeric, got x={type(x)}, y={type(y)}")
+        if x < 0 or y < 0:
+            raise ValueError(f"Position coordinates must be non-negative, got x={x}, y={y}")
+
+        self.x = self.original_x = float(x)
+        self.y = self.original_y = float(y)
+        self.vel = self.VEL
+
+        # Modifiers cho power-ups (1.0 = no modification)
+        self.height_modifier = 1.0
+        self.speed_modifier = 1.0
+
+    def move(self, up: bool = True) -> None:
+        """
+        Di chuyển vợt theo hướng chỉ định.
+
+        Tốc độ di chuyển = vel * speed_modifier. Method này chỉ update
+        vị trí, không kiểm tra boundary (kiểm tra boundary trong PongPhysics).
+
+        Args:
+            up: True để di chuyển lên (giảm Y), False để di chuyển xuống (tăng Y).
+                Mặc định là True.
+
+        Note:
+            - Trong pygame, Y tăng khi xuống, giảm khi lên
+            - Speed modifier ảnh hưởng trực tiếp đến vận tốc
+            - Không có boundary check, có thể di chuyển ra ngoài màn hình
+        """
+        vel = self.vel * self.speed_modifier
+        if up:
+            self.y -= vel
+        else:
+            self.y += vel
+
+    def reset(self) -> None:
+        """
+        Reset vợt về trạng thái ban đầu.
+
+        Đặt lại vị trí về original position và reset tất cả modifiers
+        về giá trị mặc định (1.0).
+
+        Note:
+            Được gọi khi bắt đầu game mới hoặc sau khi có người thắng.
+        """
+        self.x = self.original_x
+        self.y = self.original_y
+        self.height_modifier = 1.0
+        self.speed_modifier = 1.0
+
+    def get_current_height(self) -> int:
+        """
+        Lấy chiều cao hiện tại của vợt (có tính modifier).
+
+        Returns:
+            Chiều cao hiện tại tính bằng pixels (HEIGHT * height_modifier),
+            được làm tròn thành số nguyên.
+
+        Examples:
+            >>> paddle = PaddlePhysics(10, 100)
+            >>> paddle.height_modifier = 1.5
+            >>> paddle.get_current_height()
+            150
+        """
+        return int(self.HEIGHT * self.height_modifier)
+
+    def apply_height_modifier(self, modifier: float) -> None:
+        """
+        Áp dụng modifier cho chiều cao vợt.
+
+        Args:
+            modifier: Hệ số nhân cho chiều cao. Phải > 0.
+                     - 0.5: Vợt ngắn hơn 50%
+                     - 1.0: Chiều cao bình thường
+                     - 1.5: Vợt cao hơn 50%
+
+        Raises:
+            ValueError: Nếu modifier <= 0
+            TypeError: Nếu modifier không phải số
+        """
+        if not isinstance(modifier, (int, float)):
+            raise TypeError(f"Height modifier must be numeric, got {type(modifier)}")
+        if modifier <= 0:
+            raise ValueError(f"Height modifier must be positive, got {modifier}")
+
+        self.height_modifier = float(modifier)
+
+    def apply_speed_modifier(self, modifier: float) -> None:
+        """
+        Áp dụng modifier cho tốc độ di chuyển vợt.
+
+        Args:
+            modifier: Hệ số nhân cho tốc độ. Phải > 0.
+                     - 0.5: Vợt chậm hơn 50%
+                     - 1.0: Tốc độ bình thường
+                     - 1.5: Vợt nhanh hơn 50%
+
+        Raises:
+            ValueError: Nếu modifier <= 0
+            TypeError: Nếu modifier không phải số
+        """
+        if not isinstance(modifier, (int, float)):
+            raise TypeError(f"Speed modifier must be numeric, got {type(modifier)}")
+        if modifier <= 0:
+            raise ValueError(f"Speed modifier must be positive, got {modifier}")
+
+        self.speed_modifier = float(modifier)
+
+
+class PongPhysics:
+    """
+    Logic game Pong không có rendering
+    - Va chạm
+    - Điểm số
+    - Game loop
+
+    Dùng trực tiếp cho headless training. GameManager kế thừa class này
+    và thay BALL_TYPE/PADDLE_TYPE bằng các class có hàm draw().
+    """
+
+    BALL_TYPE = BallPhysics
+    PADDLE_TYPE = PaddlePhysics
+
+    def __init__(self, window_width, window_height, rng=None):
+        """
+        Khởi tạo game state
+
+        Args:
+            window_width: Chiều rộng sân
+            window_height: Chiều cao sân
+            rng: random.Random riêng của trận (None = module random global)
+        """
+        self.window_width = window_width
+        self.window_height = window_height
+        self.rng = rng if rng is not None else random
+
+        # Tạo game objects
+        paddle_type = self.PADDLE_TYPE
+        self.left_paddle = paddle_type(10, window_height // 2 - paddle_type.HEIGHT // 2)
+        self.right_paddle = paddle_type(
+            window_width - 10 - paddle_type.WIDTH,
+            window_height // 2 - paddle_type.HEIGHT // 2
+        )
+        self.ball = self.BALL_TYPE(window_width // 2, window_height // 2, rng=self.rng)
+
+        # Game state
+        self.left_score = 0
+        self.right_score = 0
+        self.left_hits = 0
+        self.right_hits = 0
+        self.info = GameInfo(0, 0, 0, 0)
+
+        # ReplayRecorder đang ghi trận (None = không ghi)
+        self.recorder = None
+
+    def handle_collision(self):
+        """
+        Xử lý va chạm bóng với tường và vợt
+
+        Va chạm vợt được kiểm tra theo đoạn di chuyển của frame vừa rồi
+        (swept): nếu mép bóng cắt mặt vợt trong frame, thời điểm chạm được
+        tính chính xác, góc bounce lấy theo Y lúc chạm và phần đường còn lại
+        của frame được phản xạ. Bóng nhanh (speed modifier lớn) vì vậy không
+        xuyên qua vợt. Bóng đã nằm sau mặt vợt từ trước (ví dụ vợt di chuyển
+        tới chỗ bóng) vẫn được kiểm tra tại vị trí hiện tại như trước.
+
+        Returns:
+            bool: True nếu có va chạm với vợt
+        """
+        ball = self.ball
+
+        # Quãng đường của frame vừa rồi (trước khi tường đổi hướng)
+        dx = ball.x_vel * ball.speed_modifier
+        dy = ball.y_vel * ball.speed_modifier
+
+        # Va chạm tường trên/dưới
+        if ball.y + ball.RADIUS >= self.window_height:
+            ball.y_vel *= -1
+        elif ball.y - ball.RADIUS <= 0:
+            ball.y_vel *= -1
+
+        # Vợt trái khi bóng đi sang trái, ngược lại vợt phải
+        if ball.x_vel < 0:
+            paddle = self.left_paddle
+            face = paddle.x + paddle.WIDTH
+            edge = ball.x - ball.RADIUS
+            crossed = edge - dx > face >= edge
+            behind = edge <= face
+        else:
+            paddle = self.right_paddle
+            face = paddle.x
+            edge = ball.x + ball.RADIUS
+            crossed = edge - dx < face <= edge
+            behind = edge >= face
+
+        if not behind:
+            return False
+
+        if crossed:
+            # Thời điểm mép bóng chạm mặt vợt trong frame (0..1)
+            before = edge - dx
+            remaining = 1 - (before - face) / (before - edge)
+            contact_y = ball.y - remaining * dy
+        else:
+            remaining = 0.0
+            contact_y = ball.y
+
+        paddle_height = paddle.get_current_height()
+        if not paddle.y <= contact_y <= paddle.y + paddle_height:
+            return False
+
+        ball.x_vel *= -1
+
+        # Tính góc bounce dựa trên vị trí hit
+        middle_y = paddle.y + paddle_height / 2
+        difference_in_y = middle_y - contact_y
+        reduction_factor = (paddle_height / 2) / ball.max_vel
+        y_vel = difference_in_y / reduction_factor
+        ball.y_vel = -1 * y_vel
+
+        if crossed:
+            # Phần còn lại của frame đi theo hướng mới
+            center = face + ball.RADIUS if ball.x_vel > 0 else face - ball.RADIUS
+            ball.x = center + remaining * ball.x_vel * ball.speed_modifier
+            ball.y = contact_y + remaining * ball.y_vel * ball.speed_modifier
+
+        if paddle is self.left_paddle:
+            self.left_hits += 1
+        else:
+            self.right_hits += 1
+        return True
+
+    def move_paddle(self, left=True, up=True):
+        """
+        Di chuyển vợt với boundary checking
+
+        Args:
+            left: True = vợt trái, False = vợt phải
+            up: True = lên, False = xuống
+
+        Returns:
+            bool: True nếu di chuyển hợp lệ
+        """
+        paddle = self.left_paddle if left else self.right_paddle
+        paddle_height = paddle.get_current_height()
+        vel = paddle.vel * paddle.speed_modifier
+
+        if self.recorder is not None:
+            self.recorder.record_move(left, up)
+
+        if up and paddle.y - vel < 0:
+            return False
+        if not up and paddle.y + paddle_height > self.window_height:
+            return False
+        paddle.move(up)
+
+        return True
+
+    def loop(self):
+        """
+        Game loop chính
+
+        Returns:
+            GameInfo: Thông tin game hiện tại (cùng một object mỗi frame)
+        """
+        if self.recorder is not None:
+            self.recorder.record_frame()
+
+        self.ball.move()
+        self.handle_collision()
+
+        # Check scoring
+        if self.ball.x < 0:
+            self.ball.reset()
+            self.right_score += 1
+        elif self.ball.x > self.window_width:
+            self.ball.reset()
+            self.left_score += 1
+
+        # Cập nhật GameInfo dùng chung thay vì tạo object mới mỗi frame
+        info = self.info
+        info.left_hits = self.left_hits
+        info.right_hits = self.right_hits
+        info.left_score = self.left_score
+        info.right_score = self.right_score
+        return info
+
+    def advance(self, frames, left_move=0, right_move=0):
+        """
+        Chạy nhiều frame với input vợt không đổi (event-driven)
+
+        Mỗi frame tương đương loop() rồi move_paddle() cho 2 vợt. Giữa 2 sự
+        kiện (chạm tường, vào vùng vợt, ghi điểm, vợt chạm biên) mọi chuyển
+        động là tuyến tính, nên cả đoạn được nhảy qua không cần kiểm tra va
+        chạm; chỉ các frame quanh sự kiện mới được chạy từng frame. Kết quả
+        giống hệt chạy từng frame bằng loop().
+
+        Dừng sớm sau frame có ghi điểm hoặc chạm vợt để caller kiểm tra
+        điều kiện kết thúc trận.
+
+        Args:
+            frames: Số frame tối đa
+            left_move: Hướng vợt trái (-1 = lên, 0 = đứng yên, 1 = xuống)
+            right_move: Hướng vợt phải
+
+        Returns:
+            int: Số frame đã chạy
+        """
+        done = 0
+        while done < frames:
+            left = self._effective_move(self.left_paddle, left_move)
+            right = self._effective_move(self.right_paddle, right_move)
+
+            skip = min(frames - done, self._free_frames(left, right))
+            if skip > 0:
+                self._jump(skip, left, right)
+                done += skip
+                continue
+
+            # Frame có sự kiện: chạy đúng như loop()
+            events = (self.left_hits + self.right_hits +
+                      self.left_score + self.right_score)
+            self.loop()
+            if left_move != 0:
+                self.move_paddle(left=True, up=left_move < 0)
+            if right_move != 0:
+                self.move_paddle(left=False, up=right_move < 0)
+            done += 1
+
+            if (self.left_hits + self.right_hits +
+                    self.left_score + self.right_score) != events:
+                break
+        return done
+
+    def _effective_move(self, paddle, move):
+        """Hướng vợt thực sự di chuyển (0 nếu move_paddle sẽ chặn)"""
+        if move < 0 and paddle.y - paddle.vel * paddle.speed_modifier < 0:
+            return 0
+        if move > 0 and paddle.y + paddle.get_current_height() > self.window_height:
+            return 0
+        return move
+
+    def _free_frames(self, left_move, right_move):
+        """
+        Số frame chắc chắn không có sự kiện
+
+        Mỗi khoảng cách được trừ đi 1 frame an toàn để sai số float của
+        phép nhảy không làm lệch kết quả các phép so sánh.
+
+        Args:
+            left_move: Hướng vợt trái (đã qua _effective_move)
+            right_move: Hướng vợt phải (đã qua _effective_move)
+
+        Returns:
+            int: Số frame có thể nhảy (0 = phải chạy từng frame)
+        """
+        ball = self.ball
+        dx = ball.x_vel * ball.speed_modifier
+        dy = ball.y_vel * ball.speed_modifier
+        limits = []
+
+        # Tường trên/dưới (handle_collision kiểm tra cả 2 tường bất kể hướng bay,
+        # bóng đang nằm trong tường thì có thể bị đảo chiều liên tục)
+        if not ball.RADIUS < ball.y < self.window_height - ball.RADIUS:
+            return 0
+        if dy > 0:
+            limits.append((self.window_height - ball.RADIUS - ball.y) / dy)
+        elif dy < 0:
+            limits.append((ball.y - ball.RADIUS) / -dy)
+
+        # Mặt vợt phía bóng đang bay tới (cũng chặn trước vạch ghi điểm)
+        if ball.x_vel < 0:
+            paddle = self.left_paddle
+            limits.append((ball.x - ball.RADIUS - paddle.x - paddle.WIDTH) / -dx)
+        else:
+            if dx <= 0:
+                return 0
+            limits.append((self.right_paddle.x - ball.x - ball.RADIUS) / dx)
+
+        # Biên màn hình của vợt đang di chuyển
+        for paddle, move in ((self.left_paddle, left_move), (self.right_paddle, right_move)):
+            vel = paddle.vel * paddle.speed_modifier
+            if move < 0:
+                limits.append(paddle.y / vel)
+            elif move > 0:
+                limits.append((self.window_height - paddle.get_current_height() - paddle.y) / vel + 1)
+
+        return max(0, math.floor(min(limits)) - 1)
+
+    def _jump(self, frames, left_move, right_move):
+        """
+        Nhảy thẳng qua các frame không có sự kiện
+
+        Vị trí vẫn được cộng dồn từng frame (không dùng x + k*v): lệch 1 ulp
+        so với loop() đủ làm một phép so sánh với tường đổi kết quả ở cuối
+        pha bóng. Cộng float trong vòng lặp rẻ hơn nhiều so với loop().
+        """
+        if self.recorder is not None:
+            self.recorder.record_frames(frames, left_move, right_move)
+
+        ball = self.ball
+        dx = ball.x_vel * ball.speed_modifier
+        dy = ball.y_vel * ball.speed_modifier
+        x, y = ball.x, ball.y
+        for _ in range(frames):
+            x += dx
+            y += dy
+        ball.x, ball.y = x, y
+
+        for paddle, move in ((self.left_paddle, left_move), (self.right_paddle, right_move)):
+            if move != 0:
+                vel = paddle.vel * paddle.speed_modifier
+                paddle_y = paddle.y
+                for _ in range(frames):
+                    paddle_y = paddle_y - vel if move < 0 else paddle_y + vel
+                paddle.y = paddle_y
+
+    def snapshot(self):
+        """
+        Chụp trạng thái trận: bóng, vợt, điểm, hits và trạng thái random
+
+        Returns:
+            GameSnapshot: Bản chụp bất biến
+        """
+        ball = self.ball
+        left = self.left_paddle
+        right = self.right_paddle
+        return GameSnapshot(
+            (ball.x, ball.y, ball.x_vel, ball.y_vel, ball.speed_modifier, ball.max_vel),
+            (left.y, left.height_modifier, left.speed_modifier, left.vel),
+            (right.y, right.height_modifier, right.speed_modifier, right.vel),
+            self.left_score, self.right_score,
+            self.left_hits, self.right_hits,
+            self.rng.getstate()
+        )
+
+    def restore(self, snapshot):
+        """
+        Đưa trận về đúng trạng thái của snapshot
+
+        Nếu trận dùng module random global (rng=None) thì trạng thái random
+        global cũng được đặt lại.
+
+        Args:
+            snapshot: GameSnapshot từ snapshot() của một trận cùng kích thước sân
+        """
+        ball = self.ball
+        (ball.x, ball.y, ball.x_vel, ball.y_vel,
+         ball.speed_modifier, ball.max_vel) = snapshot.ball
+        left = self.left_paddle
+        left.y, left.height_modifier, left.speed_modifier, left.vel = snapshot.left_paddle
+        right = self.right_paddle
+        right.y, right.height_modifier, right.speed_modifier, right.vel = snapshot.right_paddle
+        self.left_score = snapshot.left_score
+        self.right_score = snapshot.right_score
+        self.left_hits = snapshot.left_hits
+        self.right_hits = snapshot.right_hits
+        self.rng.setstate(snapshot.rng_state)
+
+    def clone(self):
+        """
+        Tạo một trận headless độc lập từ trạng thái hiện tại
+
+        Bản clone có random.Random riêng (cùng trạng thái), nên các nhánh
+        rollout không ảnh hưởng lẫn nhau hay tới trận gốc.
+
+        Returns:
+            PongPhysics: Trận mới (không có rendering)
+        """
+        game = PongPhysics(self.window_width, self.window_height, rng=random.Random())
+        game.restore(self.snapshot())
+        return game
+
+    def reset(self):
+        """Reset game về trạng thái ban đầu"""
+        self.ball.reset()
+        self.left_paddle.reset()
+        self.right_paddle.reset()
+        self.left_score = 0
+        self.right_score = 0
+        self.left_hits = 0
+        self.right_hits = 0
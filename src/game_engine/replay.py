@@ -0,0 +1,281 @@
+"""
+Match Replay - TV2 (Dũng)
+Ghi và phát lại trận đấu từ seed + input từng frame
+
+Trận có seed cố định là deterministic, nên chỉ cần lưu seed của rng và chuỗi
+lệnh điều khiển (move_paddle, ranh giới frame) thay vì toàn bộ state. Mỗi
+lệnh là 1 byte, cả chuỗi được nén zlib: một trận training 3600 frames chỉ
+tốn vài KB.
+
+File format (little-endian):
+    header: magic b'PRPL', version (u8), width (u16), height (u16),
+            seed (u64), số frame (u32), độ dài payload (u32)
+    payload: zlib(chuỗi lệnh), mỗi lệnh 1 byte (xem FRAME/LEFT_UP/...)
+
+Chỉ các thay đổi đi qua loop(), move_paddle() và advance() được ghi; code
+sửa trực tiếp state (power-ups, tốc độ theo độ khó) sẽ không phát lại được.
+
+Classes:
+    ReplayRecorder: Gắn vào một trận và ghi lại các lệnh
+    ReplayPlayer: Đọc file replay, mô phỏng lại headless hoặc render
+"""
+import random
+import struct
+import zlib
+
+from .physics import PongPhysics
+
+MAGIC = b'PRPL'
+VERSION = 1
+_HEADER = struct.Struct('<4sBHHQII')
+
+# Mã lệnh: FRAME = một lần gọi loop(), các mã còn lại = move_paddle()
+FRAME = 0
+LEFT_UP = 1
+LEFT_DOWN = 2
+RIGHT_UP = 3
+RIGHT_DOWN = 4
+
+_MOVE_CODES = {
+    (True, True): LEFT_UP,
+    (True, False): LEFT_DOWN,
+    (False, True): RIGHT_UP,
+    (False, False): RIGHT_DOWN,
+}
+
+
+class ReplayRecorder:
+    """
+    Ghi lệnh điều khiển của một trận
+
+    Trận phải được tạo với rng=random.Random(seed) và chưa chạy frame nào,
+    để ReplayPlayer dựng lại đúng trận đó từ seed.
+
+    Attributes:
+        game: PongPhysics/GameManager đang được ghi
+        seed (int): Seed của rng của trận
+        frames (int): Số frame đã ghi
+    """
+
+    def __init__(self, game, seed):
+        """
+        Gắn recorder vào trận
+
+        Args:
+            game: PongPhysics/GameManager (game.recorder được đặt thành recorder này)
+            seed: Seed đã dùng cho random.Random của trận (0 .. 2**64 - 1)
+
+        Raises:
+            ValueError: Seed không lưu được trong header
+        """
+        if not 0 <= seed < 2**64:
+            raise ValueError(f"Replay seed must fit in 64 bits, got {seed}")
+
+        self.game = game
+        self.seed = seed
+        self.frames = 0
+        self._events = bytearray()
+        game.recorder = self
+
+    def record_frame(self):
+        """Ghi một lần gọi loop() (gọi bởi PongPhysics.loop)"""
+        self._events.append(FRAME)
+        self.frames += 1
+
+    def record_move(self, left, up):
+        """
+        Ghi một lần gọi move_paddle() (gọi bởi PongPhysics.move_paddle)
+
+        Args:
+            left: True = vợt trái
+            up: True = lên
+        """
+        self._events.append(_MOVE_CODES[(left, up)])
+
+    def record_frames(self, frames, left_move, right_move):
+        """
+        Ghi các frame advance() nhảy qua với input không đổi
+
+        Args:
+            frames: Số frame
+            left_move: Hướng vợt trái (-1, 0, 1)
+            right_move: Hướng vợt phải (-1, 0, 1)
+        """
+        frame = bytearray([FRAME])
+        if left_move != 0:
+            frame.append(_MOVE_CODES[(True, left_move < 0)])
+        if right_move != 0:
+            frame.append(_MOVE_CODES[(False, right_move < 0)])
+        self._events += frame * frames
+        self.frames += frames
+
+    def detach(self):
+        """Ngừng ghi (gỡ recorder khỏi trận)"""
+        if self.game.recorder is self:
+            self.game.recorder = None
+
+    def to_bytes(self):
+        """
+        Đóng gói replay
+
+        Returns:
+            bytes: Header + payload nén
+        """
+        payload = zlib.compress(bytes(self._events), 9)
+        header = _HEADER.pack(MAGIC, VERSION, self.game.window_width,
+                              self.game.window_height, self.seed,
+                              self.frames, len(payload))
+        return header + payload
+
+    def save(self, path):
+        """
+        Ghi replay ra file
+
+        Args:
+            path: Đường dẫn file
+        """
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+
+class ReplayPlayer:
+    """
+    Phát lại một replay
+
+    Attributes:
+        width (int): Chiều rộng sân
+        height (int): Chiều cao sân
+        seed (int): Seed của trận
+        frames (int): Số frame trong replay
+        events (bytes): Chuỗi lệnh đã giải nén
+    """
+
+    def __init__(self, width, height, seed, frames, events):
+        """
+        Khởi tạo player từ dữ liệu đã giải mã (xem load/from_bytes)
+
+        Args:
+            width: Chiều rộng sân
+            height: Chiều cao sân
+            seed: Seed của trận
+            frames: Số frame
+            events: Chuỗi lệnh
+        """
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.frames = frames
+        self.events = events
+
+    @staticmethod
+    def from_bytes(data):
+        """
+        Giải mã replay
+
+        Args:
+            data: Nội dung file replay
+
+        Returns:
+            ReplayPlayer
+
+        Raises:
+            ValueError: Không phải file replay hoặc sai version
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Replay file is truncated")
+        magic, version, width, height, seed, frames, length = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a replay file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version: {version}")
+        events = zlib.decompress(data[_HEADER.size:_HEADER.size + length])
+        return ReplayPlayer(width, height, seed, frames, events)
+
+    @staticmethod
+    def load(path):
+        """
+        Đọc file replay
+
+        Args:
+            path: Đường dẫn file
+
+        Returns:
+            ReplayPlayer
+        """
+        with open(path, 'rb') as f:
+            return ReplayPlayer.from_bytes(f.read())
+
+    def new_game(self):
+        """Trận headless ở trạng thái bắt đầu của replay"""
+        return PongPhysics(self.width, self.height, rng=random.Random(self.seed))
+
+    def play(self, game=None):
+        """
+        Mô phỏng lại toàn bộ trận với tốc độ tối đa
+
+        Args:
+            game: Trận mới tạo với rng=random.Random(seed) (None = new_game())
+
+        Returns:
+            Trận ở trạng thái cuối
+        """
+        if game is None:
+            game = self.new_game()
+        for _ in self.iter_frames(game):
+            pass
+        return game
+
+    def iter_frames(self, game):
+        """
+        Phát lại từng frame
+
+        Args:
+            game: Trận mới tạo với rng=random.Random(seed)
+
+        Yields:
+            int: Số frame đã chạy, sau khi frame đó và các lệnh của nó được áp dụng
+        """
+        frame = 0
+        for event in self.events:
+            if event == FRAME:
+                if frame:
+                    yield frame
+                game.loop()
+                frame += 1
+            elif event == LEFT_UP:
+                game.move_paddle(left=True, up=True)
+            elif event == LEFT_DOWN:
+                game.move_paddle(left=True, up=False)
+            elif event == RIGHT_UP:
+                game.move_paddle(left=False, up=True)
+            elif event == RIGHT_DOWN:
+                game.move_paddle(left=False, up=False)
+        if frame:
+            yield frame
+
+    def render(self, window, fps=60):
+        """
+        Phát lại có hình ở tốc độ thật
+
+        Args:
+            window: Pygame window
+            fps: Số frame mỗi giây
+
+        Returns:
+            bool: False nếu người xem đóng cửa sổ hoặc bấm ESC giữa chừng
+        """
+        import pygame
+        from .game_manager import GameManager
+
+        game = GameManager(window, self.width, self.height, rng=random.Random(self.seed))
+        clock = pygame.time.Clock()
+        for _ in self.iter_frames(game):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return False
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    return False
+            game.draw()
+            pygame.display.update()
+            clock.tick(fps)
+        return True
@@ -15,6 +15,7 @@ from game_engine.ball import Ball
 
 # Import AI engine (TV1 - Trí Hoằng)
 from ai_engine.trainer import NEATTrainer
+from ai_engine.checkpoint import find_latest_checkpoint, clear_checkpoints
 from ai_engine.model_manager import get_model_manager
 from ai_engine.predictor import BallPredictor
 
@@ -25,6 +26,10 @@ from features.analytics import TrainingAnalytics, TrainingDashboard, NEATReporte
 # Import UI (TV4 - Bảo)
 from ui.menu import show_menu
 from ui.visuals import VisualEffects, ScoreDisplay, get_asset_manager
+from ui.renderer import DirtyRectRenderer
+
+# Import utils
+from utils.profiler import FrameProfiler, profile_path
 
 
 # Constants
@@ -32,15 +37,30 @@ WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 # Get config path (relative to this file's parent directory)
 CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "config-feedforward.txt")
-
-
-def train_ai(config_path, target_difficulty="medium"):
+# Số process dùng để evaluate genomes khi train từ menu
+TRAINING_WORKERS = os.cpu_count() or 1
+# Checkpoints để train tiếp sau khi bị ngắt
+CHECKPOINT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "checkpoints")
+# Đo thời gian từng stage của play_vs_ai (NEAT_PONG_PROFILE=1): overlay p50/p99
+# và CSV trong PROFILE_DIR khi thoát trận
+PROFILE_GAME = os.environ.get("NEAT_PONG_PROFILE") == "1"
+PROFILE_DIR = "logs"
+PROFILE_STAGES = ['events', 'ai', 'powerups', 'loop', 'effects', 'draw', 'flip']
+
+
+def train_ai(config_path, target_difficulty="medium", workers=1, seed=None, resume=True,
+             frame_skip=1, profile=PROFILE_GAME):
     """
     Train AI với NEAT algorithm theo độ khó cụ thể
 
     Args:
         config_path: Đường dẫn config file
         target_difficulty: 'easy', 'medium', hoặc 'hard'
+        workers: Số process evaluate song song (1 = serial)
+        seed: Seed của run để train lại y hệt (None = random)
+        resume: Train tiếp từ checkpoint nếu lần trước bị ngắt
+        frame_skip: Network quyết định mỗi N frames (action được lặp lại ở giữa)
+        profile: Đo thời gian từng stage của các trận (train serial, CSV trong PROFILE_DIR)
     """
     print("\n" + "─"*45)
     print(f" Training Mode: {target_difficulty.upper()} Difficulty")
@@ -78,6 +98,12 @@ def train_ai(config_path, target_difficulty="medium"):
     )
     print(f" > Trainer: Ready")
 
+    # Profiler chỉ đo được các trận chạy trong process này
+    if profile:
+        trainer.profiler = FrameProfiler(NEATTrainer.TRAIN_STAGES)
+        workers = 1
+        print(f" > Profiling: ON (workers=1)")
+
     # Lấy số thế hệ cần train từ ModelManager
     model_manager = get_model_manager()
     generations = model_manager.get_training_generations(target_difficulty)
@@ -89,11 +115,21 @@ def train_ai(config_path, target_difficulty="medium"):
     print(f"\n Starting evolution process...")
     print(f" Generations: {generations}")
     print(f" Population: {model_manager.get_training_generations(target_difficulty)}")
+    print(f" Workers: {workers}")
     print(" (Press ESC to interrupt)\n")
 
     try:
         # Train với số thế hệ cụ thể cho độ khó đó và difficulty-specific config
-        best_genome = trainer.train_ai(reporter=reporter, generations=generations, difficulty=target_difficulty)
+        best_genome = trainer.train_ai(
+            reporter=reporter,
+            generations=generations,
+            difficulty=target_difficulty,
+            workers=workers,
+            seed=seed,
+            checkpoint_dir=CHECKPOINT_DIR,
+            resume=resume,
+            frame_skip=frame_skip
+        )
 
         if best_genome:
             print("\n" + "─"*45)
@@ -104,6 +140,7 @@ def train_ai(config_path, target_difficulty="medium"):
             # Save the trained model
             model_manager.save_model(best_genome, config, target_difficulty)
             print(f" Model saved: {target_difficulty}_ai.pkl")
+            clear_checkpoints(CHECKPOINT_DIR, target_difficulty)
 
             # Show summary stats
             summary = analytics.get_summary()
@@ -115,22 +152,30 @@ def train_ai(config_path, target_difficulty="medium"):
 
     except KeyboardInterrupt:
         print("\n\n Training stopped by user.")
+        if find_latest_checkpoint(CHECKPOINT_DIR, target_difficulty):
+            print(" Progress is checkpointed - training again will resume.")
     except Exception as e:
         print(f"\n ! Error during training: {e}")
         import traceback
         traceback.print_exc()
 
+    if trainer.profiler and trainer.profiler.frames:
+        path = profile_path(PROFILE_DIR, f"train_profile_{target_difficulty}")
+        trainer.profiler.to_csv(path)
+        print(f"\n Frame profile saved to: {path}")
+
     print("\n" + "─"*45)
     input("Press Enter to return to menu...")
 
 
-def play_vs_ai(difficulty="medium", fullscreen=False):
+def play_vs_ai(difficulty="medium", fullscreen=False, profile=PROFILE_GAME):
     """
     Chơi với AI
 
     Args:
         difficulty: 'easy', 'medium', 'hard'
         fullscreen: Enable fullscreen mode
+        profile: Đo thời gian từng stage (overlay p50/p99, CSV trong PROFILE_DIR)
     """
     print(f"\n Loading {difficulty.upper()} AI opponent...")
 
@@ -164,6 +209,8 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
         win = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         window_width = WINDOW_WIDTH
         window_height = WINDOW_HEIGHT
+    # Layer tĩnh cũ được tạo theo display của lần chơi trước
+    GameManager.clear_layer_cache()
     
     pygame.display.set_caption(f"NEAT Pong - vs {difficulty.upper()} AI")
     clock = pygame.time.Clock()
@@ -177,25 +224,25 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
     # Adjust game speed based on difficulty for better balance
     if difficulty == "easy":
         # Easy: Much slower ball, faster player paddle
-        game.ball.MAX_VEL = 3.5 * scale_factor
+        game.ball.max_vel = 3.5 * scale_factor
         game.ball.x_vel *= 0.7 * scale_factor
         game.ball.y_vel *= 0.7 * scale_factor
-        game.left_paddle.VEL = 6 * scale_factor  # Player faster
-        game.right_paddle.VEL = 3 * scale_factor  # AI slower
+        game.left_paddle.vel = 6 * scale_factor  # Player faster
+        game.right_paddle.vel = 3 * scale_factor  # AI slower
     elif difficulty == "medium":
         # Medium: Balanced speed
-        game.ball.MAX_VEL = 5 * scale_factor
+        game.ball.max_vel = 5 * scale_factor
         game.ball.x_vel *= scale_factor
         game.ball.y_vel *= scale_factor
-        game.left_paddle.VEL = 5 * scale_factor
-        game.right_paddle.VEL = 4 * scale_factor
+        game.left_paddle.vel = 5 * scale_factor
+        game.right_paddle.vel = 4 * scale_factor
     elif difficulty == "hard":
         # Hard: Fast ball, normal player paddle
-        game.ball.MAX_VEL = 6.5 * scale_factor
+        game.ball.max_vel = 6.5 * scale_factor
         game.ball.x_vel *= scale_factor
         game.ball.y_vel *= scale_factor
-        game.left_paddle.VEL = 5 * scale_factor
-        game.right_paddle.VEL = 5 * scale_factor
+        game.left_paddle.vel = 5 * scale_factor
+        game.right_paddle.vel = 5 * scale_factor
 
     # Initialize features
     powerup_manager = PowerUpManager(window_width, window_height)
@@ -204,13 +251,18 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
     # Initialize UI (TV4 - Bảo)
     effects = VisualEffects()
     score_display = ScoreDisplay(window_width, window_height)
+    profiler = FrameProfiler(PROFILE_STAGES) if profile else None
+    renderer = DirtyRectRenderer(win, game, powerup_manager, effects, score_display,
+                                 profiler=profiler)
 
     # Game loop
     running = True
     game_state = "waiting"  # waiting, playing, paused
-    font = pygame.font.Font(None, 40)
-    title_font = pygame.font.Font(None, 60)
-    small_font = pygame.font.Font(None, 30)
+    assets = get_asset_manager()
+    render = assets.render_text
+    font = assets.get_font(None, 40)
+    title_font = assets.get_font(None, 60)
+    small_font = assets.get_font(None, 30)
 
     print(" Game Starting...")
     print("\n Controls:")
@@ -221,6 +273,8 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
 
     while running:
         clock.tick(60)
+        if profiler:
+            profiler.begin_frame()
 
         # Events
         for event in pygame.event.get():
@@ -242,6 +296,7 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
         # Handle game states
         if game_state == "waiting":
             # Draw waiting screen
+            renderer.invalidate()  # Overlay phủ toàn màn hình
             game.draw(draw_score=False, draw_hits=False)
             
             # Semi-transparent overlay
@@ -250,7 +305,7 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
             win.blit(overlay, (0, 0))
             
             # Title
-            title_text = title_font.render(f"VS {difficulty.upper()} AI", True, (0, 255, 255))
+            title_text = render(title_font, f"VS {difficulty.upper()} AI", (0, 255, 255))
             title_rect = title_text.get_rect(center=(window_width // 2, window_height // 3))
             win.blit(title_text, title_rect)
             
@@ -278,11 +333,11 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
             y_offset = box_y + 20
             for i, line in enumerate(instructions):
                 if i == 0:
-                    text = font.render(line, True, (255, 255, 100))
+                    text = render(font, line, (255, 255, 100))
                 elif line == "":
                     continue
                 else:
-                    text = small_font.render(line, True, (200, 220, 255))
+                    text = render(small_font, line, (200, 220, 255))
                 text_rect = text.get_rect(center=(window_width // 2, y_offset))
                 win.blit(text, text_rect)
                 y_offset += 30 if i == 0 else 25
@@ -292,6 +347,7 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
 
         elif game_state == "paused":
             # Draw pause screen
+            renderer.invalidate()  # Overlay phủ toàn màn hình
             game.draw(draw_score=True, draw_hits=True)
             
             # Semi-transparent overlay
@@ -311,16 +367,16 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
             win.blit(box_surf, (box_x, box_y))
             
             # Pause text
-            pause_title = title_font.render("PAUSED", True, (255, 255, 100))
+            pause_title = render(title_font, "PAUSED", (255, 255, 100))
             pause_rect = pause_title.get_rect(center=(window_width // 2, window_height // 2 - 30))
             win.blit(pause_title, pause_rect)
             
             # Instructions
-            resume_text = small_font.render("Press P to Resume", True, (200, 220, 255))
+            resume_text = render(small_font, "Press P to Resume", (200, 220, 255))
             resume_rect = resume_text.get_rect(center=(window_width // 2, window_height // 2 + 20))
             win.blit(resume_text, resume_rect)
             
-            quit_text = small_font.render("Press ESC to Quit", True, (200, 220, 255))
+            quit_text = render(small_font, "Press ESC to Quit", (200, 220, 255))
             quit_rect = quit_text.get_rect(center=(window_width // 2, window_height // 2 + 50))
             win.blit(quit_text, quit_rect)
             
@@ -333,6 +389,8 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
             game.move_paddle(left=True, up=True)
         if keys[pygame.K_s]:
             game.move_paddle(left=True, up=False)
+        if profiler:
+            profiler.lap('events')
 
         # AI controls (right paddle) - TV1 with difficulty-based behavior
         if ai_controller:
@@ -352,13 +410,15 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
                 game.move_paddle(left=False, up=True)
                 # Apply speed modifier for lower difficulties
                 if speed_factor < 1.0:
-                    game.right_paddle.y += (1 - speed_factor) * game.right_paddle.VEL
+                    game.right_paddle.y += (1 - speed_factor) * game.right_paddle.vel
             elif action == 2:  # Move down
                 game.move_paddle(left=False, up=False)
                 # Apply speed modifier for lower difficulties
                 if speed_factor < 1.0:
-                    game.right_paddle.y -= (1 - speed_factor) * game.right_paddle.VEL
+                    game.right_paddle.y -= (1 - speed_factor) * game.right_paddle.vel
             # else: stay (action == 0)
+        if profiler:
+            profiler.lap('ai')
 
         # Update power-ups (TV2 - Dũng)
         total_hits = game.left_hits + game.right_hits
@@ -376,6 +436,8 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
         game.left_paddle.apply_height_modifier(modifiers['paddle_height'])
         game.right_paddle.apply_height_modifier(modifiers['paddle_height'])
         game.ball.apply_speed_modifier(modifiers['ball_speed'])
+        if profiler:
+            profiler.lap('powerups')
 
         # Check scoring BEFORE game.loop (loop will reset ball)
         score_left_before = game.left_score
@@ -391,30 +453,19 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
         elif game.left_score > score_left_before:
             effects.add_score_effect(0, game.ball.y)
             score_display.animate_score(left_scored=True)
+        if profiler:
+            profiler.lap('loop')
 
         # Update effects (TV4 - Bảo)
         effects.update()
+        if profiler:
+            profiler.lap('effects')
 
-        # Draw
-        win.fill((0, 0, 0))
-
-        # Apply screen shake
-        shake_x, shake_y = effects.get_shake_offset()
-
-        # Draw game (without score/hits - we'll draw them with ScoreDisplay)
-        game.draw(draw_score=False, draw_hits=False)
-
-        # Draw power-ups
-        powerup_manager.draw(win)
-
-        # Draw effects
-        effects.draw(win)
-
-        # Draw score with modern UI
-        total_hits = game.left_hits + game.right_hits
-        score_display.draw(win, game.left_score, game.right_score, total_hits)
-
-        pygame.display.update()
+        # Draw: game, power-ups, effects và score display (UI TV4), chỉ cập
+        # nhật các vùng thay đổi trừ khi có shake/flash/animation điểm số
+        renderer.draw()
+        if profiler:
+            profiler.end_frame()
 
         # Check game over
         if game.left_score >= 10 or game.right_score >= 10:
@@ -447,6 +498,15 @@ def play_vs_ai(difficulty="medium", fullscreen=False):
     pygame.quit()
     print("[INFO] Game ended")
 
+    if profiler and profiler.frames:
+        path = profile_path(PROFILE_DIR, f"frame_profile_{difficulty}")
+        profiler.to_csv(path)
+        recent = min(profiler.frames, profiler.window)
+        print(f"\n Frame profile (p50 / p99 ms, last {recent} of {profiler.frames} frames):")
+        for stage, (p50, p99) in profiler.percentiles().items():
+            print(f"  • {stage:<10} {p50:6.2f} / {p99:6.2f}")
+        print(f" Saved to: {path}")
+
 
 def main():
     """Main entry point"""
@@ -496,7 +556,7 @@ def main():
             if d_choice == "1": target = "easy"
             elif d_choice == "3": target = "hard"
 
-            train_ai(CONFIG_PATH, target_difficulty=target)
+            train_ai(CONFIG_PATH, target_difficulty=target, workers=TRAINING_WORKERS)
 
         elif choice == 'play_easy':
             play_vs_ai('easy', is_fullscreen)
@@ -0,0 +1,210 @@
+"""
+Dirty Rect Renderer - TV4 (Bảo)
+Chỉ vẽ lại và cập nhật các vùng màn hình thay đổi trong play_vs_ai
+
+Phần lớn màn hình (gradient, đường giữa, badges, điểm số, hits) không đổi
+giữa các frame. Renderer gộp chúng thành một background vẽ sẵn; mỗi frame
+chỉ xóa vùng cũ của các vật thể động (bóng, vợt, power-ups, particles) bằng
+background, vẽ lại chúng và gọi pygame.display.update() với các vùng đó.
+
+Score display (HUD) luôn nằm trên các vật thể động như khi vẽ toàn màn
+hình. Ở vùng vật thể động chồng lên HUD, renderer vẽ lại theo đúng thứ tự:
+layer tĩnh (không có HUD), vật thể động, rồi HUD.
+
+Khi có hiệu ứng toàn màn hình (screen shake, flash) hoặc điểm số đang
+animation, frame được vẽ đầy đủ như trước.
+
+Nếu có profiler (utils.profiler.FrameProfiler), overlay của nó được vẽ
+trước khi cập nhật display và thời gian được chia thành stage 'draw' và
+'flip' (pygame.display.update).
+"""
+import pygame
+
+
+class DirtyRectRenderer:
+    """
+    Vẽ một frame play_vs_ai với dirty rects
+
+    Attributes:
+        window: Pygame window
+        game: GameManager
+        powerup_manager: PowerUpManager
+        effects: VisualEffects
+        score_display: ScoreDisplay
+        profiler: FrameProfiler (None = không đo)
+        full_frames (int): Số frame đã vẽ toàn màn hình
+        dirty_frames (int): Số frame chỉ cập nhật dirty rects
+    """
+
+    def __init__(self, window, game, powerup_manager, effects, score_display,
+                 profiler=None):
+        """
+        Khởi tạo renderer
+
+        Args:
+            window: Pygame window
+            game: GameManager (bóng, vợt, layer tĩnh)
+            powerup_manager: PowerUpManager
+            effects: VisualEffects
+            score_display: ScoreDisplay
+            profiler: FrameProfiler có stage 'draw' và 'flip' (None = không đo)
+        """
+        self.window = window
+        self.game = game
+        self.powerup_manager = powerup_manager
+        self.effects = effects
+        self.score_display = score_display
+        self.profiler = profiler
+        self.full_frames = 0
+        self.dirty_frames = 0
+
+        self._background = None
+        self._composite = None
+        self._scratch = None
+        self._hud_rects = []
+        self._background_key = None
+        self._rects = []
+        self._needs_full = True
+
+    def invalidate(self):
+        """Vẽ lại toàn màn hình ở frame sau (vd. sau overlay pause/waiting)"""
+        self._needs_full = True
+
+    def draw(self):
+        """Vẽ frame hiện tại và cập nhật display"""
+        game = self.game
+        hits = game.left_hits + game.right_hits
+
+        if self.effects.full_screen or self.score_display.animating:
+            # Thứ tự vẽ như trước khi có renderer
+            game.draw(draw_score=False, draw_hits=False)
+            self.powerup_manager.draw(self.window)
+            self.effects.draw(self.window)
+            self.score_display.draw(self.window, game.left_score, game.right_score, hits)
+            self._draw_overlay()
+            self._present()
+            self.full_frames += 1
+            self._needs_full = True
+            return
+
+        key = (game.left_score, game.right_score, hits, self.window.get_size())
+        if key != self._background_key:
+            self._build_background()
+            self._background_key = key
+            self._needs_full = True
+
+        if self._needs_full:
+            self.window.blit(self._composite, (0, 0))
+            self._rects = self._draw_objects() + self._draw_overlay()
+            self._present()
+            self._needs_full = False
+            self.full_frames += 1
+            return
+
+        # Xóa vị trí cũ bằng background (kèm HUD) rồi vẽ vị trí mới
+        for rect in self._rects:
+            self.window.blit(self._composite, rect, rect)
+        rects = self._draw_objects() + self._draw_overlay()
+        self._present(self._rects + rects)
+        self._rects = rects
+        self.dirty_frames += 1
+
+    def _build_background(self):
+        """Vẽ sẵn phần tĩnh: layer của game, và layer đó + score display"""
+        game = self.game
+        size = self.window.get_size()
+        if self._background is None or self._background.get_size() != size:
+            self._background = pygame.Surface(size, 0, self.window)
+            self._composite = pygame.Surface(size, 0, self.window)
+            self._scratch = pygame.Surface(size, 0, self.window)
+        self._background.blit(game._get_static_layer(), (0, 0))
+        self._composite.blit(self._background, (0, 0))
+        self._hud_rects = self._draw_hud(self._composite)
+
+    def _draw_hud(self, surface):
+        """
+        Vẽ score display ở trạng thái hiện tại (không chạy animation)
+
+        Args:
+            surface: Surface để vẽ
+
+        Returns:
+            list: Vùng của HUD
+        """
+        game = self.game
+        return self.score_display.draw(surface, game.left_score, game.right_score,
+                                       game.left_hits + game.right_hits, animate=False)
+
+    def _draw_objects(self):
+        """
+        Vẽ các vật thể động, giữ HUD nằm trên chúng
+
+        Returns:
+            list: Vùng đã vẽ (đã cắt theo màn hình)
+        """
+        rects = self._draw_dynamic()
+        overlaps = [rect.clip(hud) for rect in rects for hud in self._hud_rects
+                    if rect.colliderect(hud)]
+        if not overlaps:
+            return rects
+
+        # Vẽ lại vùng chồng lên HUD theo thứ tự layer tĩnh, vật thể, HUD trên
+        # surface phụ (set_clip làm viền bo góc của badges bị vẽ khác đi)
+        region = overlaps[0].unionall(overlaps[1:])
+        self._scratch.blit(self._background, region, region)
+        self._draw_dynamic(self._scratch)
+        self._draw_hud(self._scratch)
+        self.window.blit(self._scratch, region, region)
+        return rects + [region]
+
+    def _draw_dynamic(self, surface=None):
+        """
+        Vẽ các vật thể động
+
+        Args:
+            surface: Surface để vẽ (None = window)
+
+        Returns:
+            list: Vùng đã vẽ (đã cắt theo màn hình)
+        """
+        if surface is None:
+            surface = self.window
+        game = self.game
+        rects = [
+            game.left_paddle.draw(surface),
+            game.right_paddle.draw(surface),
+            game.ball.draw(surface),
+        ]
+        rects += self.powerup_manager.draw(surface)
+        rects += self.effects.draw(surface)
+
+        screen = surface.get_rect()
+        return [rect.clip(screen) for rect in rects]
+
+    def _draw_overlay(self):
+        """
+        Vẽ overlay của profiler (nếu có)
+
+        Returns:
+            list: Vùng đã vẽ
+        """
+        if self.profiler is None:
+            return []
+        return [self.profiler.draw(self.window).clip(self.window.get_rect())]
+
+    def _present(self, rects=None):
+        """
+        Cập nhật display (toàn màn hình nếu rects là None)
+
+        Args:
+            rects: Các vùng cần cập nhật
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.lap('draw')
+        if rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
+        if profiler is not None:
+            profiler.lap('flip')
@@ -3,90 +3,286 @@ Visual Effects & Asset Management - TV4 (Bảo)
 Quản lý assets và hiệu ứng
 """
 import pygame
-import os
+import numpy as np
+# AssetManager nằm trong utils.assets (dùng chung với game_engine), re-export ở đây
+from utils.assets import AssetManager, get_asset_manager
 
 
-class AssetManager:
-    """Quản lý fonts và assets"""
-    
-    _instance = None
-    
-    def __new__(cls):
-        """Singleton pattern"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-    
-    def __init__(self):
-        """Khởi tạo manager"""
-        if self._initialized:
+class ParticleSystem:
+    """
+    Particles dạng structure-of-arrays (NumPy)
+
+    Vị trí, vận tốc, lifetime và size nằm trong các array cấp phát sẵn
+    MAX_PARTICLES phần tử; count phần tử đầu là particles còn sống. Update
+    tính cả mảng một lần, particle chết được lấp bằng particle còn sống ở
+    cuối mảng (swap-remove) nên không có list.remove O(n²).
+
+    Attributes:
+        count (int): Số particles còn sống
+        x, y, vx, vy (ndarray): Vị trí và vận tốc
+        lifetime (ndarray): Số frame còn lại
+        size (ndarray): Bán kính (pixels)
+        rng: np.random.Generator cho vận tốc/size khi emit
+    """
+
+    MAX_PARTICLES = 65536
+    LIFETIME = 40  # Frames
+    GRAVITY = 0.3
+    DRAG = 0.98  # Air resistance
+    COLOR = (80, 50, 30)  # Màu nâu tối cho nền vàng
+
+    def __init__(self, capacity=None, rng=None):
+        """
+        Cấp phát các array
+
+        Args:
+            capacity: Số particles tối đa (None = MAX_PARTICLES)
+            rng: np.random.Generator (None = generator mới)
+        """
+        capacity = self.MAX_PARTICLES if capacity is None else capacity
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity, dtype=np.int64)
+        self.size = np.zeros(capacity, dtype=np.int64)
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    @property
+    def capacity(self):
+        """Số particles tối đa"""
+        return len(self.x)
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, amount):
+        """
+        Thêm particles tại một điểm (bỏ bớt nếu vượt capacity)
+
+        Args:
+            x, y: Vị trí
+            amount: Số particles
+        """
+        start = self.count
+        stop = min(start + amount, self.capacity)
+        amount = stop - start
+        self.x[start:stop] = x
+        self.y[start:stop] = y
+        self.vx[start:stop] = self.rng.uniform(-8, 8, amount)
+        self.vy[start:stop] = self.rng.uniform(-8, 8, amount)
+        self.lifetime[start:stop] = self.LIFETIME
+        self.size[start:stop] = self.rng.integers(3, 7, amount)
+        self.count = stop
+
+    def update(self):
+        """Tích phân 1 frame và loại particles hết lifetime"""
+        n = self.count
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += self.GRAVITY
+        self.vx[:n] *= self.DRAG
+        self.lifetime[:n] -= 1
+
+        dead = np.flatnonzero(self.lifetime[:n] <= 0)
+        if not len(dead):
             return
-        
-        self.fonts = {}
-        self.assets_dir = "assets"
-        self.fonts_dir = os.path.join(self.assets_dir, "fonts")
-        self._initialized = True
-        
-        # Ensure directories exist
-        os.makedirs(self.fonts_dir, exist_ok=True)
-    
-    def get_font(self, name, size):
+
+        # Swap-remove: particles còn sống ở cuối lấp vào các chỗ trống
+        alive = n - len(dead)
+        holes = dead[dead < alive]
+        tail = np.arange(alive, n)
+        fillers = tail[self.lifetime[alive:n] > 0]
+        for values in (self.x, self.y, self.vx, self.vy, self.lifetime, self.size):
+            values[holes] = values[fillers]
+        self.count = alive
+
+    def draw(self, win):
         """
-        Lấy font (cache)
-        
+        Vẽ mọi particles bằng sprites vẽ sẵn (một lần blits)
+
         Args:
-            name: Font name (None for default)
-            size: Font size
-        
+            win: Pygame window
+
         Returns:
-            pygame.font.Font
+            pygame.Rect: Vùng bao các particles (None nếu không có)
         """
-        key = f"{name}_{size}"
-        
-        if key not in self.fonts:
-            try:
-                if name:
-                    font_path = os.path.join(self.fonts_dir, name)
-                    if os.path.exists(font_path):
-                        self.fonts[key] = pygame.font.Font(font_path, size)
-                    else:
-                        print(f"Warning: Font not found: {font_path}, using default")
-                        self.fonts[key] = pygame.font.Font(None, size)
-                else:
-                    self.fonts[key] = pygame.font.Font(None, size)
-            except Exception as e:
-                print(f"Error loading font {name}: {e}")
-                self.fonts[key] = pygame.font.Font(None, size)
-        
-        return self.fonts[key]
-    
-    def list_available_fonts(self):
-        """Liệt kê các fonts có sẵn"""
-        if not os.path.exists(self.fonts_dir):
-            return []
-        
-        fonts = [f for f in os.listdir(self.fonts_dir) 
-                if f.endswith('.ttf') or f.endswith('.otf')]
-        return fonts
+        n = self.count
+        if n == 0:
+            return None
+
+        assets = get_asset_manager()
+        size = self.size[:n]
+        alpha = self.lifetime[:n] * 200 // self.LIFETIME
+        alpha = np.minimum(255, (alpha + assets.GLOW_ALPHA_STEP // 2)
+                           // assets.GLOW_ALPHA_STEP * assets.GLOW_ALPHA_STEP)
+
+        left = (self.x[:n] - size).astype(np.int64)
+        top = (self.y[:n] - size).astype(np.int64)
+
+        # Bỏ particles nằm ngoài màn hình (rơi khỏi màn hình trước khi hết lifetime)
+        width, height = win.get_size()
+        visible = ((left < width) & (top < height) &
+                   (left + 2 * size > 0) & (top + 2 * size > 0))
+        if not visible.all():
+            if not visible.any():
+                return None
+            size, alpha, left, top = size[visible], alpha[visible], left[visible], top[visible]
+
+        # Mỗi tổ hợp (size, alpha) chỉ lấy sprite 1 lần mỗi frame
+        codes = alpha * 16 + size
+        unique = np.unique(codes)
+        lookup = np.empty(unique[-1] + 1, dtype=object)
+        for code in unique.tolist():
+            radius, level = code % 16, code // 16
+            lookup[code] = assets.get_sprite(
+                ('particle', radius, self.COLOR, level),
+                lambda: _render_dot(radius, (*self.COLOR, level))
+            )
+
+        win.blits(list(zip(lookup[codes].tolist(), zip(left.tolist(), top.tolist()))),
+                  doreturn=False)
+        return pygame.Rect(int(left.min()), int(top.min()),
+                           int((left + 2 * size).max() - left.min()),
+                           int((top + 2 * size).max() - top.min()))
+
+    def clear(self):
+        """Xóa mọi particles"""
+        self.count = 0
+
+
+class TrailBuffer:
+    """
+    Ring buffer các vị trí gần nhất của bóng
+
+    Điểm mới ghi đè điểm cũ nhất khi đầy (không có list.pop(0)). Mọi điểm
+    có cùng lifetime ban đầu nên điểm cũ nhất luôn hết hạn trước.
+
+    Attributes:
+        length (int): Số điểm tối đa
+        x, y (ndarray): Vị trí
+        life (ndarray): Số frame còn lại
+        head (int): Index điểm cũ nhất
+        count (int): Số điểm hiện có
+    """
+
+    LIFE = 15  # Frames
+    COLOR = (100, 70, 50)  # Nâu tối
+
+    def __init__(self, length=15):
+        """
+        Khởi tạo buffer
+
+        Args:
+            length: Số điểm tối đa
+        """
+        self.length = length
+        self.x = np.zeros(length)
+        self.y = np.zeros(length)
+        self.life = np.zeros(length, dtype=np.int64)
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, x, y):
+        """
+        Thêm vị trí mới nhất (ghi đè vị trí cũ nhất nếu đầy)
+
+        Args:
+            x, y: Vị trí bóng
+        """
+        index = (self.head + self.count) % self.length
+        self.x[index] = x
+        self.y[index] = y
+        self.life[index] = self.LIFE
+        if self.count < self.length:
+            self.count += 1
+        else:
+            self.head = (self.head + 1) % self.length
+
+    def update(self):
+        """Giảm lifetime, bỏ các điểm cũ đã hết hạn"""
+        self.life -= 1
+        while self.count and self.life[self.head] <= 0:
+            self.head = (self.head + 1) % self.length
+            self.count -= 1
+
+    def indices(self):
+        """Index các điểm từ cũ nhất đến mới nhất"""
+        return [(self.head + i) % self.length for i in range(self.count)]
+
+    def draw(self, win):
+        """
+        Vẽ trail (cũ nhất trước)
+
+        Args:
+            win: Pygame window
+
+        Returns:
+            pygame.Rect: Vùng bao trail (None nếu trống)
+        """
+        if not self.count:
+            return None
+
+        assets = get_asset_manager()
+        dirty = []
+        for i in self.indices():
+            life = int(self.life[i])
+            alpha = assets.glow_alpha(life / self.LIFE * 120)
+            size = max(3, int(7 * (life / self.LIFE)))
+            surf = assets.get_sprite(
+                ('trail', size, self.COLOR, alpha),
+                lambda: _render_dot(size, (*self.COLOR, alpha))
+            )
+            dirty.append(win.blit(surf, (self.x[i] - size, self.y[i] - size)))
+        return dirty[0].unionall(dirty[1:])
+
+    def clear(self):
+        """Xóa trail"""
+        self.head = 0
+        self.count = 0
+
+
+def _render_dot(radius, color):
+    """
+    Vẽ một chấm tròn trong suốt (sprite của particle/trail)
+
+    Args:
+        radius: Bán kính
+        color: Màu RGBA
+
+    Returns:
+        pygame.Surface: Kích thước (2 * radius, 2 * radius)
+    """
+    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (radius, radius), radius)
+    return surf
 
 
 class VisualEffects:
     """Hiệu ứng visual cho game với trail effects"""
     
-    def __init__(self):
-        """Khởi tạo effects"""
-        self.particles = []
+    PARTICLES_PER_HIT = 15
+    
+    def __init__(self, rng=None):
+        """
+        Khởi tạo effects
+        
+        Args:
+            rng: np.random.Generator cho particles (None = generator mới)
+        """
+        self.particles = ParticleSystem(rng=rng)
         self.screen_shake = 0
         self.flash_alpha = 0
-        self.ball_trail = []  # Trail effect cho ball
         self.max_trail_length = 15
+        self.ball_trail = TrailBuffer(self.max_trail_length)  # Trail effect cho ball
     
     def add_ball_position(self, x, y):
         """Thêm vị trí ball vào trail"""
-        self.ball_trail.append({'x': x, 'y': y, 'life': 15})
-        if len(self.ball_trail) > self.max_trail_length:
-            self.ball_trail.pop(0)
+        self.ball_trail.append(x, y)
     
     def add_hit_effect(self, x, y, color=(255, 255, 255)):
         """
@@ -94,24 +290,9 @@ class VisualEffects:
         
         Args:
             x, y: Vị trí
-            color: Màu particles
+            color: Màu particles (particles luôn dùng ParticleSystem.COLOR)
         """
-        import random
-        
-        # Tạo particles với màu tối
-        particle_color = (80, 50, 30)  # Màu nâu tối cho nền vàng
-        
-        for _ in range(15):
-            particle = {
-                'x': x,
-                'y': y,
-                'vx': random.uniform(-8, 8),
-                'vy': random.uniform(-8, 8),
-                'lifetime': 40,
-                'color': particle_color,
-                'size': random.randint(3, 6)
-            }
-            self.particles.append(particle)
+        self.particles.emit(x, y, self.PARTICLES_PER_HIT)
         
         # Screen shake
         self.screen_shake = 8
@@ -129,22 +310,8 @@ class VisualEffects:
     
     def update(self):
         """Update tất cả effects"""
-        # Update particles
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.3  # Gravity
-            particle['vx'] *= 0.98  # Air resistance
-            particle['lifetime'] -= 1
-            
-            if particle['lifetime'] <= 0:
-                self.particles.remove(particle)
-        
-        # Update trail
-        for trail in self.ball_trail[:]:
-            trail['life'] -= 1
-            if trail['life'] <= 0:
-                self.ball_trail.remove(trail)
+        self.particles.update()
+        self.ball_trail.update()
         
         # Update screen shake
         if self.screen_shake > 0:
@@ -160,37 +327,27 @@ class VisualEffects:
         
         Args:
             win: Pygame window
+        
+        Returns:
+            list: Các vùng đã vẽ (pygame.Rect)
         """
-        # Draw ball trail
-        for i, trail in enumerate(self.ball_trail):
-            alpha = int((trail['life'] / 15) * 120)
-            size = max(3, int(7 * (trail['life'] / 15)))
-            color = (100, 70, 50, alpha)  # Nâu tối với alpha
-            
-            surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, color, (size, size), size)
-            win.blit(surf, (trail['x'] - size, trail['y'] - size))
-        
-        # Draw particles
-        for particle in self.particles:
-            alpha = int((particle['lifetime'] / 40) * 200)
-            color = (*particle['color'], alpha)
-            
-            # Create surface with alpha
-            surf = pygame.Surface((particle['size'] * 2, particle['size'] * 2), 
-                                 pygame.SRCALPHA)
-            pygame.draw.circle(surf, color, 
-                             (particle['size'], particle['size']), 
-                             particle['size'])
-            
-            win.blit(surf, (particle['x'] - particle['size'], 
-                           particle['y'] - particle['size']))
+        dirty = [
+            self.ball_trail.draw(win),
+            self.particles.draw(win),
+        ]
         
         # Draw flash (white flash for score)
         if self.flash_alpha > 0:
             flash_surf = pygame.Surface(win.get_size(), pygame.SRCALPHA)
             flash_surf.fill((255, 255, 255, self.flash_alpha))
-            win.blit(flash_surf, (0, 0))
+            dirty.append(win.blit(flash_surf, (0, 0)))
+        
+        return [rect for rect in dirty if rect is not None]
+    
+    @property
+    def full_screen(self):
+        """Đang có hiệu ứng toàn màn hình (screen shake hoặc flash)"""
+        return self.screen_shake > 0 or self.flash_alpha > 0
     
     def get_shake_offset(self):
         """
@@ -220,9 +377,10 @@ class ScoreDisplay:
     def __init__(self, width, height):
         self.width = width
         self.height = height
-        self.score_font = pygame.font.Font(None, 80)
-        self.label_font = pygame.font.Font(None, 32)
-        self.hits_font = pygame.font.Font(None, 28)
+        self.assets = get_asset_manager()
+        self.score_font = self.assets.get_font(None, 80)
+        self.label_font = self.assets.get_font(None, 32)
+        self.hits_font = self.assets.get_font(None, 28)
         
         # Animation
         self.left_score_scale = 1.0
@@ -230,44 +388,63 @@ class ScoreDisplay:
         self.left_glow = 0
         self.right_glow = 0
     
-    def draw(self, win, left_score, right_score, hits=None):
-        """Draw modern score display with beautiful player badges"""
+    def draw(self, win, left_score, right_score, hits=None, animate=True):
+        """
+        Draw modern score display with beautiful player badges
+
+        Args:
+            win: Surface để vẽ
+            left_score: Điểm vợt trái
+            right_score: Điểm vợt phải
+            hits: Tổng số hits (None = không vẽ)
+            animate: Chạy tiếp animation điểm số (False = vẽ lại trạng thái hiện tại)
+
+        Returns:
+            list: Các vùng đã vẽ (đường giữa, badges, điểm số, hits)
+        """
         # Update animations
-        self.left_score_scale += (1.0 - self.left_score_scale) * 0.15
-        self.right_score_scale += (1.0 - self.right_score_scale) * 0.15
-        self.left_glow = max(0, self.left_glow - 5)
-        self.right_glow = max(0, self.right_glow - 5)
+        if animate:
+            self.left_score_scale += (1.0 - self.left_score_scale) * 0.15
+            self.right_score_scale += (1.0 - self.right_score_scale) * 0.15
+            self.left_glow = max(0, self.left_glow - 5)
+            self.right_glow = max(0, self.right_glow - 5)
         
         # Center line
         center_x = self.width // 2
+        dashes = []
         for i in range(0, self.height, 30):
             alpha = 120 if i % 60 == 0 else 60
-            pygame.draw.rect(win, (80, 150, 200), 
-                           (center_x - 2, i, 4, 15))
+            dashes.append(pygame.draw.rect(win, (80, 150, 200), 
+                                           (center_x - 2, i, 4, 15)))
+        rects = [dashes[0].unionall(dashes[1:])] if dashes else []
         
         # Draw Player Badge (YOU) - Left side
-        self._draw_player_badge(win, self.width // 4, 35, "PLAYER", (80, 60, 40), left_score)
+        rects.append(self._draw_player_badge(win, self.width // 4, 35, "PLAYER",
+                                             (80, 60, 40), left_score))
         
         # Draw AI Badge - Right side
-        self._draw_ai_badge(win, 3 * self.width // 4, 35, "AI", (80, 60, 40), right_score)
+        rects.append(self._draw_ai_badge(win, 3 * self.width // 4, 35, "AI",
+                                         (80, 60, 40), right_score))
         
         # Scores with glow
-        self._draw_score(win, str(left_score), (self.width // 4, 80),
-                        (100, 200, 255), self.left_score_scale, self.left_glow)
-        self._draw_score(win, str(right_score), (3 * self.width // 4, 80),
-                        (255, 100, 100), self.right_score_scale, self.right_glow)
+        rects.append(self._draw_score(win, str(left_score), (self.width // 4, 80),
+                                      (100, 200, 255), self.left_score_scale, self.left_glow))
+        rects.append(self._draw_score(win, str(right_score), (3 * self.width // 4, 80),
+                                      (255, 100, 100), self.right_score_scale, self.right_glow))
         
         # Hits counter
         if hits is not None:
             bg = pygame.Surface((120, 35), pygame.SRCALPHA)
             pygame.draw.rect(bg, (30, 30, 50, 180), bg.get_rect(), border_radius=8)
-            win.blit(bg, (center_x - 60, self.height - 50))
+            box = win.blit(bg, (center_x - 60, self.height - 50))
             
-            hits_text = self.hits_font.render(f"HITS: {hits}", True, (255, 220, 100))
-            win.blit(hits_text, hits_text.get_rect(center=(center_x, self.height - 33)))
+            hits_text = self.assets.render_text(self.hits_font, f"HITS: {hits}", (255, 220, 100))
+            text = win.blit(hits_text, hits_text.get_rect(center=(center_x, self.height - 33)))
+            rects.append(box.union(text))
+        return rects
     
     def _draw_player_badge(self, win, x, y, text, text_color, score):
-        """Vẽ badge đẹp cho Player"""
+        """Vẽ badge đẹp cho Player, trả về vùng đã vẽ"""
         # Badge dimensions
         badge_width = 160
         badge_height = 50
@@ -278,7 +455,7 @@ class ScoreDisplay:
         glow_surf = pygame.Surface((badge_width + 10, badge_height + 10), pygame.SRCALPHA)
         glow_color = (100, 200, 255, 80) if score > 0 else (100, 200, 255, 40)
         pygame.draw.rect(glow_surf, glow_color, glow_surf.get_rect(), border_radius=15)
-        win.blit(glow_surf, (badge_x - 5, badge_y - 5))
+        glow = win.blit(glow_surf, (badge_x - 5, badge_y - 5))
         
         # Main badge background
         badge_surf = pygame.Surface((badge_width, badge_height), pygame.SRCALPHA)
@@ -295,16 +472,17 @@ class ScoreDisplay:
         self._draw_gamepad_icon(win, icon_x, icon_y, (100, 200, 255))
         
         # Text with shadow
-        font = pygame.font.Font(None, 32)
-        shadow = font.render(text, True, (50, 50, 50))
-        text_surf = font.render(text, True, text_color)
+        font = self.label_font
+        shadow = self.assets.render_text(font, text, (50, 50, 50))
+        text_surf = self.assets.render_text(font, text, text_color)
         text_x = badge_x + 50
         text_y = badge_y + badge_height // 2 - text_surf.get_height() // 2
-        win.blit(shadow, (text_x + 2, text_y + 2))
-        win.blit(text_surf, (text_x, text_y))
+        shadow_rect = win.blit(shadow, (text_x + 2, text_y + 2))
+        text_rect = win.blit(text_surf, (text_x, text_y))
+        return glow.unionall([shadow_rect, text_rect])
     
     def _draw_ai_badge(self, win, x, y, text, text_color, score):
-        """Vẽ badge đẹp cho AI"""
+        """Vẽ badge đẹp cho AI, trả về vùng đã vẽ"""
         # Badge dimensions
         badge_width = 140
         badge_height = 50
@@ -315,7 +493,7 @@ class ScoreDisplay:
         glow_surf = pygame.Surface((badge_width + 10, badge_height + 10), pygame.SRCALPHA)
         glow_color = (255, 100, 100, 80) if score > 0 else (255, 100, 100, 40)
         pygame.draw.rect(glow_surf, glow_color, glow_surf.get_rect(), border_radius=15)
-        win.blit(glow_surf, (badge_x - 5, badge_y - 5))
+        glow = win.blit(glow_surf, (badge_x - 5, badge_y - 5))
         
         # Main badge background
         badge_surf = pygame.Surface((badge_width, badge_height), pygame.SRCALPHA)
@@ -332,13 +510,14 @@ class ScoreDisplay:
         self._draw_ai_icon(win, icon_x, icon_y, (255, 100, 100))
         
         # Text with shadow
-        font = pygame.font.Font(None, 36)
-        shadow = font.render(text, True, (50, 50, 50))
-        text_surf = font.render(text, True, text_color)
+        font = self.assets.get_font(None, 36)
+        shadow = self.assets.render_text(font, text, (50, 50, 50))
+        text_surf = self.assets.render_text(font, text, text_color)
         text_x = badge_x + 55
         text_y = badge_y + badge_height // 2 - text_surf.get_height() // 2
-        win.blit(shadow, (text_x + 2, text_y + 2))
-        win.blit(text_surf, (text_x, text_y))
+        shadow_rect = win.blit(shadow, (text_x + 2, text_y + 2))
+        text_rect = win.blit(text_surf, (text_x, text_y))
+        return glow.unionall([shadow_rect, text_rect])
     
     def _draw_gamepad_icon(self, win, x, y, color):
         """Vẽ icon gamepad đơn giản"""
@@ -369,24 +548,33 @@ class ScoreDisplay:
             pygame.draw.line(win, color, (x + 8 * i, y + 6), (x + 11 * i, y + 6), 2)
     
     def _draw_score(self, win, score, pos, color, scale, glow):
-        """Draw score with effects"""
+        """Draw score with effects, trả về vùng đã vẽ"""
+        rects = []
         # Glow
         if glow > 0:
-            glow_surf = self.score_font.render(score, True, color)
+            glow_surf = self.assets.render_text(self.score_font, score, color).copy()
             glow_surf.set_alpha(glow)
             for i in range(1, 4):
-                win.blit(glow_surf, glow_surf.get_rect(center=(pos[0]+i, pos[1]+i)))
+                rects.append(win.blit(glow_surf, glow_surf.get_rect(center=(pos[0]+i, pos[1]+i))))
         
         # Shadow
-        shadow = self.score_font.render(score, True, (0, 0, 0))
-        win.blit(shadow, shadow.get_rect(center=(pos[0]+3, pos[1]+3)))
+        shadow = self.assets.render_text(self.score_font, score, (0, 0, 0))
+        rects.append(win.blit(shadow, shadow.get_rect(center=(pos[0]+3, pos[1]+3))))
         
         # Main score
-        surf = self.score_font.render(score, True, color)
-        if scale != 1.0:
-            surf = pygame.transform.scale(surf, 
-                (int(surf.get_width() * scale), int(surf.get_height() * scale)))
-        win.blit(surf, surf.get_rect(center=pos))
+        surf = self.assets.render_text(self.score_font, score, color)
+        size = (int(surf.get_width() * scale), int(surf.get_height() * scale))
+        if size != surf.get_size():
+            surf = pygame.transform.scale(surf, size)
+        main = win.blit(surf, surf.get_rect(center=pos))
+        return main.unionall(rects)
+    
+    @property
+    def animating(self):
+        """Điểm số đang chạy animation (glow hoặc scale chưa về 1.0)"""
+        return (self.left_glow > 0 or self.right_glow > 0 or
+                abs(self.left_score_scale - 1.0) > 0.01 or
+                abs(self.right_score_scale - 1.0) > 0.01)
     
     def animate_score(self, left_scored=False, right_scored=False):
         """Animate scoring"""
@@ -396,8 +584,3 @@ class ScoreDisplay:
         if right_scored:
             self.right_score_scale = 1.4
             self.right_glow = 150
-
-
-def get_asset_manager():
-    """Lấy AssetManager instance (singleton)"""
-    return AssetManager()
@@ -4,5 +4,8 @@ Các công cụ tiện ích cho dự án NEAT Pong
 """
 from .logger import get_logger, setup_logging
 from .constants import GameConstants, TrainingConstants, UIConstants
+from .profiler import FrameProfiler
+from .assets import AssetManager, get_asset_manager
 
-__all__ = ['get_logger', 'setup_logging', 'GameConstants', 'TrainingConstants', 'UIConstants']
+__all__ = ['get_logger', 'setup_logging', 'GameConstants', 'TrainingConstants', 'UIConstants',
+           'FrameProfiler', 'AssetManager', 'get_asset_manager']
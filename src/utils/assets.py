@@ -0,0 +1,155 @@
+"""
+Asset Manager - TV4 (Bảo)
+Cache fonts, text đã render và sprites vẽ sẵn
+
+Dùng chung bởi game_engine, features và ui; module này không phụ thuộc
+package nào của game nên engine không cần import ui để vẽ.
+"""
+import pygame
+import os
+from collections import OrderedDict
+
+
+class AssetManager:
+    """Quản lý fonts và assets"""
+    
+    _instance = None
+    
+    TEXT_CACHE_SIZE = 256  # Số text surfaces tối đa được giữ (LRU)
+    SPRITE_CACHE_SIZE = 256  # Số sprites vẽ sẵn tối đa được giữ (LRU)
+    GLOW_ALPHA_STEP = 10  # Glow có alpha thay đổi được cache theo bậc này
+    
+    def __new__(cls):
+        """Singleton pattern"""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+    
+    def __init__(self):
+        """Khởi tạo manager"""
+        if self._initialized:
+            return
+        
+        self.fonts = {}
+        self.text_cache = OrderedDict()
+        self.text_hits = 0
+        self.text_misses = 0
+        self.sprite_cache = OrderedDict()
+        self.assets_dir = "assets"
+        self.fonts_dir = os.path.join(self.assets_dir, "fonts")
+        self._initialized = True
+    
+    def get_font(self, name, size):
+        """
+        Lấy font (cache)
+        
+        Args:
+            name: Font name (None for default)
+            size: Font size
+        
+        Returns:
+            pygame.font.Font
+        """
+        key = f"{name}_{size}"
+        
+        if key not in self.fonts:
+            try:
+                if name:
+                    font_path = os.path.join(self.fonts_dir, name)
+                    if os.path.exists(font_path):
+                        self.fonts[key] = pygame.font.Font(font_path, size)
+                    else:
+                        print(f"Warning: Font not found: {font_path}, using default")
+                        self.fonts[key] = pygame.font.Font(None, size)
+                else:
+                    self.fonts[key] = pygame.font.Font(None, size)
+            except Exception as e:
+                print(f"Error loading font {name}: {e}")
+                self.fonts[key] = pygame.font.Font(None, size)
+        
+        return self.fonts[key]
+    
+    def render_text(self, font, text, color, antialias=True):
+        """
+        Render text (cache LRU theo font, text, màu)
+        
+        Điểm số, badges và HUD vẽ lại cùng một chuỗi mỗi frame; chỉ render
+        lại khi nội dung đổi (vd. điểm số). Surface trả về được dùng chung:
+        copy() trước khi sửa (set_alpha, fill...).
+        
+        Args:
+            font: pygame.font.Font (nên lấy từ get_font để dùng chung key)
+            text: Nội dung
+            color: Màu chữ
+            antialias: Khử răng cưa
+        
+        Returns:
+            pygame.Surface
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+            self.text_hits += 1
+            return surface
+        
+        self.text_misses += 1
+        surface = font.render(text, antialias, color)
+        self.text_cache[key] = surface
+        if len(self.text_cache) > self.TEXT_CACHE_SIZE:
+            self.text_cache.popitem(last=False)
+        return surface
+    
+    def get_sprite(self, key, render):
+        """
+        Lấy sprite vẽ sẵn (cache LRU), chỉ gọi render() lần đầu
+        
+        Dùng cho các hiệu ứng glow: vẽ nhiều lớp alpha vào Surface mới mỗi
+        frame tốn hơn nhiều so với blit một Surface có sẵn. Surface trả về
+        được dùng chung và không được sửa.
+        
+        Args:
+            key: Mô tả đầy đủ sprite, vd. ('ball_glow', radius, color)
+            render: Hàm không tham số trả về pygame.Surface
+        
+        Returns:
+            pygame.Surface
+        """
+        surface = self.sprite_cache.get(key)
+        if surface is not None:
+            self.sprite_cache.move_to_end(key)
+            return surface
+        
+        surface = render()
+        self.sprite_cache[key] = surface
+        if len(self.sprite_cache) > self.SPRITE_CACHE_SIZE:
+            self.sprite_cache.popitem(last=False)
+        return surface
+    
+    @classmethod
+    def glow_alpha(cls, alpha):
+        """
+        Làm tròn alpha của glow về bậc GLOW_ALPHA_STEP (giới hạn số sprites)
+        
+        Args:
+            alpha: Alpha mong muốn
+        
+        Returns:
+            int: Alpha trong [0, 255]
+        """
+        return min(255, max(0, int(round(alpha / cls.GLOW_ALPHA_STEP)) * cls.GLOW_ALPHA_STEP))
+    
+    def list_available_fonts(self):
+        """Liệt kê các fonts có sẵn"""
+        if not os.path.exists(self.fonts_dir):
+            return []
+        
+        fonts = [f for f in os.listdir(self.fonts_dir) 
+                if f.endswith('.ttf') or f.endswith('.otf')]
+        return fonts
+
+
+def get_asset_manager():
+    """Lấy AssetManager instance (singleton)"""
+    return AssetManager()
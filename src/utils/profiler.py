@@ -0,0 +1,222 @@
+"""
+Frame Profiler - Đo thời gian từng stage của game loop
+Tìm stage nào làm frame vượt budget 16.6 ms (60 FPS).
+
+Mỗi frame được chia thành các stage (events, AI, physics, draw, flip...).
+Thời gian được đo bằng time.perf_counter_ns() theo kiểu "lap": mỗi lần gọi
+lap(stage) cộng khoảng thời gian từ lap trước (hoặc begin_frame) vào stage
+đó, nên mỗi điểm đo chỉ tốn một lần đọc clock.
+
+Kết quả:
+- Rolling p50/p99 của WINDOW frames gần nhất (overlay hoặc percentiles())
+- Toàn bộ lịch sử frame xuất ra CSV (to_csv)
+
+Usage:
+    >>> profiler = FrameProfiler(['events', 'loop', 'draw'])
+    >>> profiler.begin_frame()
+    >>> handle_events(); profiler.lap('events')
+    >>> game.loop(); profiler.lap('loop')
+    >>> game.draw(); profiler.lap('draw')
+    >>> profiler.end_frame()
+    >>> profiler.to_csv('logs/profile.csv')
+"""
+import csv
+import os
+from datetime import datetime
+from time import perf_counter_ns
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+
+
+class FrameProfiler:
+    """
+    Đo thời gian từng stage của mỗi frame.
+
+    Attributes:
+        stages (list): Tên các stage, theo thứ tự cột trong CSV
+        window (int): Số frame gần nhất dùng cho rolling percentiles
+        frames (int): Số frame đã đo xong
+        rows (list): Lịch sử (tổng, stage1, stage2, ...) của MAX_ROWS frames đầu, tính bằng ns
+    """
+
+    # Budget của một frame ở 60 FPS (ms)
+    BUDGET_MS = 1000 / 60
+    # Số frame gần nhất cho p50/p99
+    WINDOW = 300
+    # Số frame tối đa giữ cho CSV (training có thể chạy hàng triệu frames)
+    MAX_ROWS = 1_000_000
+    # Overlay tính lại percentiles mỗi N frames
+    REFRESH_FRAMES = 30
+    # Overlay
+    FONT_SIZE = 14
+    TEXT_COLOR = (220, 220, 220)
+    OVER_BUDGET_COLOR = (255, 90, 90)
+    BACKGROUND_COLOR = (10, 10, 20)
+
+    def __init__(self, stages: Sequence[str], window: int = WINDOW, max_rows: int = MAX_ROWS):
+        """
+        Khởi tạo profiler
+
+        Args:
+            stages: Tên các stage sẽ được lap()
+            window: Số frame gần nhất dùng cho rolling percentiles
+            max_rows: Số frame tối đa giữ cho CSV
+
+        Raises:
+            ValueError: Không có stage, stage trùng tên hoặc window không dương
+        """
+        if not stages:
+            raise ValueError("Profiler needs at least one stage")
+        if len(set(stages)) != len(stages):
+            raise ValueError(f"Duplicate stage names: {list(stages)}")
+        if window < 1:
+            raise ValueError(f"Window must be positive, got {window}")
+
+        self.stages = list(stages)
+        self.window = window
+        self.max_rows = max_rows
+        self.frames = 0
+        self.rows: List[Tuple[int, ...]] = []
+
+        self._index = {stage: i for i, stage in enumerate(self.stages)}
+        self._current = [0] * len(self.stages)
+        self._start = None
+        self._last = 0
+
+        # Ring buffer: cột 0 = tổng frame, các cột sau = stages
+        self._ring = np.zeros((window, len(self.stages) + 1), dtype=np.int64)
+
+        self._overlay = None
+        self._overlay_frame = 0
+        self._font = None
+
+    def begin_frame(self) -> None:
+        """Bắt đầu đo một frame (frame chưa end_frame trước đó bị bỏ)"""
+        self._current = [0] * len(self.stages)
+        self._start = self._last = perf_counter_ns()
+
+    def lap(self, stage: str) -> None:
+        """
+        Cộng thời gian từ lap trước (hoặc begin_frame) vào stage
+
+        Args:
+            stage: Tên stage (phải nằm trong stages)
+
+        Raises:
+            KeyError: Stage không được khai báo
+        """
+        now = perf_counter_ns()
+        self._current[self._index[stage]] += now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        """
+        Kết thúc frame và lưu kết quả
+
+        Thời gian giữa lap cuối và end_frame chỉ tính vào tổng frame.
+        """
+        if self._start is None:
+            return
+        row = (perf_counter_ns() - self._start, *self._current)
+        if len(self.rows) < self.max_rows:
+            self.rows.append(row)
+        self._ring[self.frames % self.window] = row
+        self.frames += 1
+        self._start = None
+
+    def percentiles(self, q: Sequence[float] = (50, 99)) -> Dict[str, Tuple[float, ...]]:
+        """
+        Rolling percentiles của WINDOW frames gần nhất
+
+        Args:
+            q: Các percentile cần tính
+
+        Returns:
+            dict: {'total': (...), stage: (...)} tính bằng ms (rỗng nếu chưa có frame)
+        """
+        filled = min(self.frames, self.window)
+        if filled == 0:
+            return {}
+        values = np.percentile(self._ring[:filled], q, axis=0) / 1e6
+        names = ['total'] + self.stages
+        return {name: tuple(values[:, i]) for i, name in enumerate(names)}
+
+    def to_csv(self, path: str) -> None:
+        """
+        Ghi lịch sử mọi frame ra CSV (một dòng mỗi frame, đơn vị ms)
+
+        Args:
+            path: Đường dẫn file
+        """
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame', 'total_ms'] + [f'{stage}_ms' for stage in self.stages])
+            for frame, row in enumerate(self.rows):
+                writer.writerow([frame] + [f'{value / 1e6:.4f}' for value in row])
+
+    def reset(self) -> None:
+        """Xóa toàn bộ kết quả"""
+        self.frames = 0
+        self.rows = []
+        self._start = None
+        self._overlay = None
+
+    def draw(self, surface, pos: Tuple[int, int] = (10, 10)):
+        """
+        Vẽ overlay p50/p99 (text chỉ render lại mỗi REFRESH_FRAMES frames)
+
+        Args:
+            surface: Pygame surface
+            pos: Góc trên trái của overlay
+
+        Returns:
+            pygame.Rect: Vùng đã vẽ
+        """
+        if self._overlay is None or self.frames - self._overlay_frame >= self.REFRESH_FRAMES:
+            self._overlay = self._render_overlay()
+            self._overlay_frame = self.frames
+        return surface.blit(self._overlay, pos)
+
+    def _render_overlay(self):
+        """
+        Render bảng p50/p99 thành một surface
+
+        Returns:
+            pygame.Surface
+        """
+        import pygame
+
+        if self._font is None:
+            self._font = pygame.font.SysFont('monospace', self.FONT_SIZE)
+
+        stats = self.percentiles()
+        lines = [(f"{'stage':<10}{'p50':>7}{'p99':>7} ms", self.TEXT_COLOR)]
+        for name in ['total'] + self.stages:
+            p50, p99 = stats.get(name, (0.0, 0.0))
+            color = self.OVER_BUDGET_COLOR if p99 > self.BUDGET_MS else self.TEXT_COLOR
+            lines.append((f"{name:<10}{p50:>7.2f}{p99:>7.2f}", color))
+
+        texts = [self._font.render(text, True, color) for text, color in lines]
+        line_height = self._font.get_linesize()
+        width = max(text.get_width() for text in texts) + 10
+        overlay = pygame.Surface((width, line_height * len(texts) + 10))
+        overlay.fill(self.BACKGROUND_COLOR)
+        for i, text in enumerate(texts):
+            overlay.blit(text, (5, 5 + i * line_height))
+        return overlay
+
+
+def profile_path(directory: str, name: str) -> str:
+    """
+    Đường dẫn CSV mới trong directory (tạo directory nếu chưa có)
+
+    Args:
+        directory: Thư mục chứa file
+        name: Tiền tố tên file
+
+    Returns:
+        str: '<directory>/<name>_<YYYYmmdd_HHMMSS>.csv'
+    """
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return os.path.join(directory, f"{name}_{stamp}.csv")
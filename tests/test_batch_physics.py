@@ -0,0 +1,117 @@
+"""
+Unit Tests for Batch Physics
+Testing that BatchPongPhysics reproduces PongPhysics frame by frame.
+
+Run tests:
+    pytest tests/test_batch_physics.py -v
+"""
+import pytest
+import random
+import sys
+from pathlib import Path
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from game_engine.physics import PongPhysics
+from game_engine.batch_physics import BatchPongPhysics
+
+
+def _scalar_move(game, left, move):
+    """Apply a -1/0/1 move to a scalar game."""
+    if move != 0:
+        game.move_paddle(left=left, up=move < 0)
+
+
+class TestBatchMatchesScalar:
+    """Test lock-step batch simulation against the scalar engine."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4])
+    def test_trajectory_matches_scalar(self, seed):
+        """Test ball, paddles, hits and scores stay identical."""
+        random.seed(seed)
+        batch = BatchPongPhysics(1, 800, 600)
+        random.seed(seed)
+        game = PongPhysics(800, 600)
+
+        moves = random.Random(seed + 100)
+        for _ in range(3000):
+            # Both engines draw serves from the global RNG: give them
+            # the same numbers on every frame
+            state = random.getstate()
+            batch.step()
+            random.setstate(state)
+            game.loop()
+
+            left, right = moves.choice([-1, 0, 1]), moves.choice([-1, 0, 1])
+            batch.move_paddles(np.array([left]), np.array([right]))
+            _scalar_move(game, True, left)
+            _scalar_move(game, False, right)
+
+            assert batch.ball_x[0] == pytest.approx(game.ball.x)
+            assert batch.ball_y[0] == pytest.approx(game.ball.y)
+            assert batch.left_y[0] == pytest.approx(game.left_paddle.y)
+            assert batch.right_y[0] == pytest.approx(game.right_paddle.y)
+            assert batch.left_hits[0] == game.left_hits
+            assert batch.right_hits[0] == game.right_hits
+            assert batch.left_score[0] == game.left_score
+            assert batch.right_score[0] == game.right_score
+
+    @pytest.mark.parametrize("seed", [5, 6])
+    def test_fast_ball_matches_scalar(self, seed):
+        """Test swept paddle collisions with a boosted ball."""
+        random.seed(seed)
+        batch = BatchPongPhysics(1, 800, 600)
+        random.seed(seed)
+        game = PongPhysics(800, 600)
+
+        moves = random.Random(seed)
+        for _ in range(2000):
+            # Boost the ball after every serve
+            if batch.ball_speed[0] == 1.0:
+                speed = moves.uniform(2.0, 8.0)
+                batch.ball_speed[0] = speed
+                game.ball.speed_modifier = speed
+
+            state = random.getstate()
+            batch.step()
+            random.setstate(state)
+            game.loop()
+
+            # Paddles track the ball so rallies happen
+            for is_left, paddle_y in ((True, game.left_paddle.y), (False, game.right_paddle.y)):
+                move = 1 if game.ball.y > paddle_y + 50 else -1
+                (batch.move_paddles(np.array([move]), np.array([0])) if is_left
+                 else batch.move_paddles(np.array([0]), np.array([move])))
+                _scalar_move(game, is_left, move)
+
+            assert batch.ball_x[0] == pytest.approx(game.ball.x)
+            assert batch.ball_y[0] == pytest.approx(game.ball.y)
+            assert batch.left_hits[0] == game.left_hits
+            assert batch.right_hits[0] == game.right_hits
+            assert batch.left_score[0] == game.left_score
+
+        assert game.left_hits + game.right_hits > 0
+
+
+class TestBatchRetirement:
+    """Test masking of finished matches."""
+
+    def test_retired_games_are_frozen(self):
+        """Test retired games no longer move."""
+        batch = BatchPongPhysics(3, 800, 600)
+        batch.retire(np.array([False, True, False]))
+        x_before = batch.ball_x.copy()
+
+        batch.step()
+        batch.move_paddles(np.array([1, 1, 1]), np.array([1, 1, 1]))
+
+        assert batch.ball_x[1] == x_before[1]
+        assert batch.ball_x[0] != x_before[0]
+        assert batch.frames.tolist() == [1, 0, 1]
+        assert batch.left_y[1] == batch.left_y[0] - batch.paddle_vel
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
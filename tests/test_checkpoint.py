@@ -0,0 +1,129 @@
+"""
+Unit Tests for Training Checkpoints
+Testing atomic snapshots, pruning and resuming a training run.
+
+Run tests:
+    pytest tests/test_checkpoint.py -v
+"""
+import pytest
+import sys
+import threading
+from pathlib import Path
+
+neat = pytest.importorskip("neat")
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR / 'src'))
+
+from ai_engine.checkpoint import (
+    checkpoint_path, save_checkpoint, load_checkpoint,
+    list_checkpoints, find_latest_checkpoint, clear_checkpoints
+)
+from ai_engine.trainer import NEATTrainer
+
+
+def _config():
+    return neat.Config(
+        neat.DefaultGenome,
+        neat.DefaultReproduction,
+        neat.DefaultSpeciesSet,
+        neat.DefaultStagnation,
+        str(ROOT_DIR / 'config' / 'config-feedforward.txt')
+    )
+
+
+class TestCheckpointFiles:
+    """Test snapshot files."""
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Test state survives a save/load and no temp file is left."""
+        path = checkpoint_path(str(tmp_path), 'easy', 3)
+
+        save_checkpoint(path, {'generation': 3, 'data': [1, 2, 3]})
+
+        assert load_checkpoint(path) == {'generation': 3, 'data': [1, 2, 3]}
+        assert [p.name for p in tmp_path.iterdir()] == ['easy-gen0003.pkl.gz']
+
+    def test_failed_save_leaves_no_file(self, tmp_path):
+        """Test a state that cannot be pickled leaves no temp file behind."""
+        path = checkpoint_path(str(tmp_path), 'easy', 1)
+
+        with pytest.raises(TypeError):
+            save_checkpoint(path, {'lock': threading.Lock()})
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_latest_and_clear(self, tmp_path):
+        """Test checkpoints are ordered by generation and per difficulty."""
+        for generation in (10, 2, 5):
+            save_checkpoint(checkpoint_path(str(tmp_path), 'hard', generation), {})
+        save_checkpoint(checkpoint_path(str(tmp_path), 'easy', 50), {})
+
+        assert find_latest_checkpoint(str(tmp_path), 'hard').endswith('hard-gen0010.pkl.gz')
+        assert len(list_checkpoints(str(tmp_path), 'hard')) == 3
+
+        clear_checkpoints(str(tmp_path), 'hard')
+
+        assert find_latest_checkpoint(str(tmp_path), 'hard') is None
+        assert find_latest_checkpoint(str(tmp_path), 'easy') is not None
+
+
+class TestCheckpointer:
+    """Test checkpoints written during training."""
+
+    def test_checkpoint_with_worker_pool(self, tmp_path):
+        """Test the run's reporters (trainer and its pool) are not pickled."""
+        trainer = NEATTrainer(_config())
+        trainer.CHECKPOINT_GENERATIONS = 1
+        trainer.train_ai(generations=1, difficulty='easy', workers=2, seed=5,
+                         checkpoint_dir=str(tmp_path))
+
+        assert [p.name for p in tmp_path.iterdir()] == ['easy-gen0001.pkl.gz']
+        state = load_checkpoint(str(tmp_path / 'easy-gen0001.pkl.gz'))
+        assert state['species_set'].reporters is None
+
+
+class TestResume:
+    """Test resuming training from a checkpoint."""
+
+    def test_resume_matches_uninterrupted_run(self, tmp_path):
+        """Test resuming from generation 2 gives the same winner."""
+        trainer = NEATTrainer(_config())
+        trainer.CHECKPOINT_GENERATIONS = 2
+        winner = trainer.train_ai(generations=4, difficulty='easy', seed=5,
+                                  checkpoint_dir=str(tmp_path))
+
+        # Older checkpoints are pruned, the last two are kept
+        checkpoints = list_checkpoints(str(tmp_path), 'easy')
+        assert [Path(p).name for p in checkpoints] == ['easy-gen0002.pkl.gz',
+                                                       'easy-gen0004.pkl.gz']
+
+        # Simulate an interrupt right after generation 2 was saved
+        Path(checkpoints[-1]).unlink()
+        resumed = NEATTrainer(_config()).train_ai(
+            generations=4, difficulty='easy',
+            checkpoint_dir=str(tmp_path), resume=True
+        )
+
+        assert resumed.key == winner.key
+        assert resumed.fitness == winner.fitness
+
+    def test_finished_checkpoint_is_not_extended(self, tmp_path):
+        """Test resuming a checkpoint at the target generation trains nothing."""
+        trainer = NEATTrainer(_config())
+        trainer.CHECKPOINT_GENERATIONS = 2
+        winner = trainer.train_ai(generations=4, difficulty='easy', seed=5,
+                                  checkpoint_dir=str(tmp_path))
+
+        resumed = NEATTrainer(_config()).train_ai(
+            generations=4, difficulty='easy',
+            checkpoint_dir=str(tmp_path), resume=True
+        )
+
+        assert resumed.key == winner.key
+        assert resumed.fitness == winner.fitness
+        assert find_latest_checkpoint(str(tmp_path), 'easy').endswith('easy-gen0004.pkl.gz')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,139 @@
+"""
+Unit Tests for Compiled Network
+Testing that CompiledNetwork matches neat-python outputs.
+
+Run tests:
+    pytest tests/test_compiled_network.py -v
+"""
+import pytest
+import random
+import sys
+from pathlib import Path
+
+neat = pytest.importorskip("neat")
+np = pytest.importorskip("numpy")
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR / 'src'))
+
+from ai_engine.compiled_network import CompiledNetwork, PopulationNetwork, create_network
+
+
+@pytest.fixture
+def config():
+    """NEAT config from the project config file"""
+    return neat.Config(
+        neat.DefaultGenome,
+        neat.DefaultReproduction,
+        neat.DefaultSpeciesSet,
+        neat.DefaultStagnation,
+        str(ROOT_DIR / 'config' / 'config-feedforward.txt')
+    )
+
+
+def _mutated_genomes(config, count=20, mutations=15, seed=0):
+    """Create genomes with hidden nodes and extra links."""
+    random.seed(seed)
+    population = neat.Population(config)
+    genomes = list(population.population.values())[:count]
+    for genome in genomes:
+        for _ in range(mutations):
+            genome.mutate(config.genome_config)
+    return genomes
+
+
+def _random_inputs(rng, count):
+    return [[rng.uniform(-1, 1) for _ in range(5)] for _ in range(count)]
+
+
+class TestCompiledNetworkMatchesNeat:
+    """Test compiled outputs against neat.nn.FeedForwardNetwork."""
+
+    @pytest.mark.parametrize("activation", ["relu", "sigmoid", "tanh"])
+    def test_activate_matches(self, config, activation):
+        """Test single activations match neat within float tolerance."""
+        config.genome_config.activation_default = activation
+        config.genome_config.activation_options = [activation]
+        rng = random.Random(1)
+
+        for genome in _mutated_genomes(config):
+            reference = neat.nn.FeedForwardNetwork.create(genome, config)
+            compiled = CompiledNetwork.create(genome, config)
+            for inputs in _random_inputs(rng, 20):
+                assert compiled.activate(inputs) == pytest.approx(reference.activate(inputs))
+
+    def test_activate_batch_matches(self, config):
+        """Test batched activations match neat row by row."""
+        rng = random.Random(2)
+
+        for genome in _mutated_genomes(config):
+            reference = neat.nn.FeedForwardNetwork.create(genome, config)
+            compiled = CompiledNetwork.create(genome, config)
+            inputs = _random_inputs(rng, 32)
+            outputs = compiled.activate_batch(np.array(inputs))
+
+            assert outputs.shape == (32, 1)
+            for row, sample in zip(outputs, inputs):
+                assert row.tolist() == pytest.approx(reference.activate(sample))
+
+    def test_wrong_input_count_raises(self, config):
+        """Test activate rejects the wrong number of inputs like neat."""
+        compiled = CompiledNetwork.create(_mutated_genomes(config, count=1)[0], config)
+        with pytest.raises(RuntimeError):
+            compiled.activate([0.0, 0.0])
+
+
+class TestCreateNetwork:
+    """Test the network factory."""
+
+    def test_returns_compiled_network(self, config):
+        """Test supported genomes are compiled."""
+        genome = _mutated_genomes(config, count=1)[0]
+        assert isinstance(create_network(genome, config), CompiledNetwork)
+
+    def test_falls_back_for_unsupported_aggregation(self, config):
+        """Test unsupported aggregation returns neat's network."""
+        genome = _mutated_genomes(config, count=1)[0]
+        for node in genome.nodes.values():
+            node.aggregation = 'product'
+
+        net = create_network(genome, config)
+
+        assert isinstance(net, neat.nn.FeedForwardNetwork)
+
+
+class TestPopulationNetwork:
+    """Test population-wide batched inference."""
+
+    def test_matches_each_genome(self, config):
+        """Test each row uses its own genome's network."""
+        genomes = _mutated_genomes(config, count=12, mutations=25)
+        population = PopulationNetwork.create(genomes, config)
+        rng = random.Random(3)
+        indices = [rng.randrange(len(genomes)) for _ in range(200)]
+        inputs = _random_inputs(rng, 200)
+
+        outputs = population.activate(np.array(indices), np.array(inputs))
+
+        for g, sample, row in zip(indices, inputs, outputs):
+            reference = neat.nn.FeedForwardNetwork.create(genomes[g], config)
+            assert row.tolist() == pytest.approx(reference.activate(sample))
+
+    def test_fallback_genome_rows(self, config):
+        """Test genomes that cannot be compiled still give neat's outputs."""
+        genomes = _mutated_genomes(config, count=3)
+        for node in genomes[1].nodes.values():
+            node.aggregation = 'max'
+        population = PopulationNetwork.create(genomes, config)
+        inputs = _random_inputs(random.Random(4), 3)
+
+        outputs = population.activate(np.array([0, 1, 2]), np.array(inputs))
+
+        assert population.fallback.tolist() == [False, True, False]
+        for g, sample, row in zip(range(3), inputs, outputs):
+            reference = neat.nn.FeedForwardNetwork.create(genomes[g], config)
+            assert row.tolist() == pytest.approx(reference.activate(sample))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
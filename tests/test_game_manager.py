@@ -0,0 +1,87 @@
+"""
+Unit Tests for GameManager rendering
+Testing the cached background layer.
+
+Run tests:
+    pytest tests/test_game_manager.py -v
+"""
+import os
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+pygame = pytest.importorskip("pygame")
+
+SRC_DIR = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(SRC_DIR))
+
+from game_engine.game_manager import GameManager
+
+
+@pytest.fixture
+def window():
+    """Headless display surface"""
+    pygame.init()
+    GameManager.clear_layer_cache()
+    yield pygame.display.set_mode((200, 150))
+    GameManager.clear_layer_cache()
+
+
+class TestStaticLayer:
+    """Test the pre-rendered gradient and divider."""
+
+    def test_layer_matches_direct_drawing(self, window):
+        """Test blitting the layer gives the same pixels as drawing it."""
+        game = GameManager(window, 200, 150)
+        game._draw_gradient_background()
+        game._draw_divider()
+        expected = pygame.image.tobytes(window, 'RGB')
+
+        window.fill((0, 0, 0))
+        window.blit(game._get_static_layer(), (0, 0))
+
+        assert pygame.image.tobytes(window, 'RGB') == expected
+
+    def test_layer_shared_between_games(self, window):
+        """Test a new game reuses the layer of the same resolution."""
+        layer = GameManager(window, 200, 150)._get_static_layer()
+
+        assert GameManager(window, 200, 150)._get_static_layer() is layer
+
+    def test_resolution_change_rebuilds_layer(self, window):
+        """Test a different resolution gets its own layer."""
+        layer = GameManager(window, 200, 150)._get_static_layer()
+        other = GameManager(window, 300, 200)._get_static_layer()
+
+        assert other is not layer
+        assert other.get_size() == (300, 200)
+
+
+class TestTextCache:
+    """Test steady-state frames do not re-render text."""
+
+    def test_unchanged_hud_is_not_rendered_again(self, window):
+        """Test only a score change renders new text."""
+        game = GameManager(window, 200, 150)
+        game.draw(draw_score=True, draw_hits=True)
+        misses = game.assets.text_misses
+
+        game.draw(draw_score=True, draw_hits=True)
+        assert game.assets.text_misses == misses
+
+        game.left_score += 1
+        game.draw(draw_score=True, draw_hits=True)
+        assert game.assets.text_misses == misses + 2
+
+
+
+class TestPackageDependencies:
+    """Test the engine does not need the UI package at import time."""
+
+    def test_importing_engine_skips_ui(self):
+        """Test game_engine and features import without loading ui."""
+        code = ("import sys, game_engine.game_manager, features.powerups; "
+                "assert 'ui' not in sys.modules")
+        subprocess.run([sys.executable, '-c', code], cwd=SRC_DIR, check=True)
@@ -0,0 +1,111 @@
+"""
+Unit Tests for Match Scheduler
+Testing pairings, coverage and match budgets of every scheduler mode.
+
+Run tests:
+    pytest tests/test_match_scheduler.py -v
+"""
+import pytest
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from ai_engine.match_scheduler import MatchScheduler
+
+
+GENOMES = [f"g{i}" for i in range(7)]
+
+
+def _appearances(pairs):
+    counts = Counter()
+    for left, right in pairs:
+        counts[left] += 1
+        counts[right] += 1
+    return counts
+
+
+class TestSchedulerModes:
+    """Test pairings produced by each mode."""
+
+    def test_sequential_is_a_ring(self):
+        """Test every genome plays twice and nobody plays itself."""
+        pairs = MatchScheduler().schedule_round(GENOMES)
+
+        assert pairs[-1] == ("g6", "g0")
+        assert all(left != right for left, right in pairs)
+        assert set(_appearances(pairs).values()) == {2}
+
+    def test_round_robin_covers_every_pair_once(self):
+        """Test each unordered pair appears exactly once."""
+        pairs = MatchScheduler('round_robin').schedule_round(GENOMES)
+
+        assert len(pairs) == 21
+        assert len({frozenset(pair) for pair in pairs}) == 21
+
+    def test_k_random_opponents(self):
+        """Test each genome starts k matches against others."""
+        scheduler = MatchScheduler('k_random', opponents=3, rng=random.Random(1))
+        pairs = scheduler.schedule_round(GENOMES)
+
+        assert Counter(left for left, right in pairs) == {genome: 3 for genome in GENOMES}
+        assert all(left != right for left, right in pairs)
+
+    def test_swiss_pairs_by_score_without_rematches(self):
+        """Test later rounds pair neighbours by score and avoid rematches."""
+        scheduler = MatchScheduler('swiss', rounds=3, rng=random.Random(2))
+        genomes = GENOMES[:6]
+        first = scheduler.schedule_round(genomes, 0)
+        scores = [6, 5, 4, 3, 2, 1]
+        second = scheduler.schedule_round(genomes, 1, scores)
+
+        assert len(first) == len(second) == 3
+        assert not {frozenset(p) for p in first} & {frozenset(p) for p in second}
+        # The top scorer meets the best-ranked genome it has not played yet
+        top_pair = next(p for p in second if "g0" in p)
+        assert genomes.index(next(g for g in top_pair if g != "g0")) <= 2
+
+    def test_benchmark_mode(self):
+        """Test every genome meets the benchmark genome."""
+        pairs = MatchScheduler('benchmark', benchmark="champion").schedule_round(GENOMES)
+
+        assert pairs == [(genome, "champion") for genome in GENOMES]
+
+    def test_single_genome_plays_itself(self):
+        """Test a lone genome still gets a match."""
+        assert MatchScheduler().schedule_round(["g0"]) == [("g0", "g0")]
+
+
+class TestSchedulerValidation:
+    """Test invalid configurations."""
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            MatchScheduler('knockout')
+
+    def test_benchmark_requires_genome(self):
+        with pytest.raises(ValueError):
+            MatchScheduler('benchmark')
+
+
+class TestMatchBudget:
+    """Test the per-generation match budget."""
+
+    def test_budget_limits_and_covers(self):
+        """Test the budget caps matches but still covers every genome."""
+        scheduler = MatchScheduler('round_robin', match_budget=5, rng=random.Random(3))
+        pairs = scheduler.schedule_round(GENOMES)
+
+        assert len(pairs) == 5
+        assert set(_appearances(pairs)) == set(GENOMES)
+
+    def test_budget_split_across_swiss_rounds(self):
+        """Test Swiss rounds share the budget."""
+        scheduler = MatchScheduler('swiss', rounds=2, match_budget=4, rng=random.Random(4))
+        assert len(scheduler.schedule_round(GENOMES, 0)) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,295 @@
+"""
+Unit Tests for Headless Physics Core
+Testing collisions, scoring and paddle movement without pygame.
+
+Run tests:
+    pytest tests/test_physics.py -v
+"""
+import pytest
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(SRC_DIR))
+
+from game_engine.physics import BallPhysics, PaddlePhysics, PongPhysics
+
+
+class TestHeadlessImport:
+    """Test that the training path never loads pygame."""
+
+    def test_trainer_import_does_not_load_pygame(self):
+        """Test importing physics and trainer leaves pygame unloaded."""
+        code = (
+            "import sys; sys.path.insert(0, sys.argv[1]);"
+            "import game_engine.physics, ai_engine.trainer;"
+            "sys.exit(1 if 'pygame' in sys.modules else 0)"
+        )
+        result = subprocess.run([sys.executable, "-c", code, str(SRC_DIR)])
+        assert result.returncode == 0
+
+
+class TestPongPhysicsSetup:
+    """Test game object creation."""
+
+    def test_objects_are_headless_types(self):
+        """Test default objects come from the physics module."""
+        game = PongPhysics(800, 600)
+        assert type(game.ball) is BallPhysics
+        assert type(game.left_paddle) is PaddlePhysics
+        assert type(game.right_paddle) is PaddlePhysics
+
+    def test_initial_positions(self):
+        """Test paddles and ball spawn at the standard positions."""
+        game = PongPhysics(800, 600)
+        assert game.left_paddle.x == 10
+        assert game.right_paddle.x == 800 - 10 - PaddlePhysics.WIDTH
+        assert game.left_paddle.y == 300 - PaddlePhysics.HEIGHT // 2
+        assert (game.ball.x, game.ball.y) == (400, 300)
+
+
+class TestPongPhysicsCollision:
+    """Test wall and paddle collisions."""
+
+    def test_bottom_wall_bounce(self):
+        """Test ball reverses Y velocity at the bottom wall."""
+        game = PongPhysics(800, 600)
+        game.ball.x, game.ball.y = 400, 600 - BallPhysics.RADIUS
+        game.ball.y_vel = 3.0
+
+        game.handle_collision()
+
+        assert game.ball.y_vel == -3.0
+
+    def test_left_paddle_hit(self):
+        """Test ball bounces off left paddle and counts a hit."""
+        game = PongPhysics(800, 600)
+        paddle = game.left_paddle
+        game.ball.x = paddle.x + paddle.WIDTH + BallPhysics.RADIUS - 1
+        game.ball.y = paddle.y + paddle.HEIGHT / 2
+        game.ball.x_vel, game.ball.y_vel = -5.0, 0.0
+
+        assert game.handle_collision() is True
+        assert game.ball.x_vel == 5.0
+        assert game.left_hits == 1
+
+    def test_paddle_miss(self):
+        """Test ball outside paddle range does not bounce."""
+        game = PongPhysics(800, 600)
+        paddle = game.right_paddle
+        game.ball.x = paddle.x
+        game.ball.y = paddle.y + paddle.HEIGHT + 20
+        game.ball.x_vel, game.ball.y_vel = 5.0, 0.0
+
+        assert game.handle_collision() is False
+        assert game.right_hits == 0
+
+    def test_fast_ball_does_not_tunnel(self):
+        """Test a ball crossing the paddle and goal line in one frame bounces."""
+        game = PongPhysics(800, 600)
+        paddle = game.left_paddle
+        game.ball.x, game.ball.y = 40, paddle.y + paddle.HEIGHT / 2
+        game.ball.x_vel, game.ball.y_vel = -5.0, 0.0
+        game.ball.speed_modifier = 9.0  # 45 px per frame, ends behind the goal line
+
+        info = game.loop()
+
+        assert info.left_hits == 1
+        assert info.right_score == 0
+        # Contact after 3 of 45 px, the other 42 px go back to the right
+        assert game.ball.x == pytest.approx(paddle.x + paddle.WIDTH + BallPhysics.RADIUS + 42)
+
+    def test_swept_contact_uses_contact_y(self):
+        """Test a diagonal ball that is past the paddle end at frame end still hits."""
+        game = PongPhysics(800, 600)
+        paddle = game.left_paddle
+        face = paddle.x + paddle.WIDTH + BallPhysics.RADIUS
+        # Crosses the face 2 px below the paddle top, ends 18 px above it
+        game.ball.x, game.ball.y = face - 20, paddle.y - 18
+        game.ball.x_vel, game.ball.y_vel = -5.0, -5.0
+        game.ball.speed_modifier = 8.0
+
+        assert game.handle_collision() is True
+        assert game.ball.x_vel == 5.0
+        assert game.left_hits == 1
+
+class TestPongPhysicsLoop:
+    """Test game loop scoring and paddle movement."""
+
+    def test_right_scores_when_ball_leaves_left(self):
+        """Test scoring resets the ball to the centre."""
+        game = PongPhysics(800, 600)
+        game.ball.x, game.ball.y = 2, 50
+        game.ball.x_vel, game.ball.y_vel = -5.0, 0.0
+
+        info = game.loop()
+
+        assert info.right_score == 1
+        assert (game.ball.x, game.ball.y) == (400, 300)
+
+    def test_move_paddle_respects_top_boundary(self):
+        """Test paddle cannot move above the window."""
+        game = PongPhysics(800, 600)
+        game.left_paddle.y = 2
+
+        assert game.move_paddle(left=True, up=True) is False
+        assert game.left_paddle.y == 2
+
+    def test_reset_restores_state(self):
+        """Test reset clears scores and hits."""
+        game = PongPhysics(800, 600)
+        game.left_score, game.right_hits = 3, 4
+
+        game.reset()
+
+        assert game.left_score == 0
+        assert game.right_hits == 0
+
+
+class TestCompactState:
+    """Test slotted state objects and the reused GameInfo."""
+
+    def test_no_instance_dicts(self):
+        game = PongPhysics(800, 600)
+        for obj in (game.ball, game.left_paddle, game.info):
+            assert not hasattr(obj, '__dict__')
+
+    def test_loop_reuses_game_info(self):
+        """Test loop() updates one GameInfo instead of allocating."""
+        game = PongPhysics(800, 600)
+        first = game.loop()
+        game.left_hits = 3
+
+        assert game.loop() is first
+        assert first.left_hits == 3
+
+    def test_per_instance_speeds(self):
+        """Test max_vel/vel overrides only affect their own object."""
+        game = PongPhysics(800, 600)
+        game.left_paddle.vel = 6.0
+        game.ball.max_vel = 2.0
+
+        game.move_paddle(left=True, up=True)
+        game.ball.reset()
+
+        assert game.left_paddle.y == game.left_paddle.original_y - 6.0
+        assert PaddlePhysics.VEL == 4.0
+        assert abs(game.ball.y_vel) <= 2.0
+
+
+def _trace(game, frames):
+    """Positions and counters of the next frames with moving paddles."""
+    trace = []
+    for frame in range(frames):
+        game.loop()
+        game.move_paddle(left=True, up=frame % 50 < 25)
+        trace.append((game.ball.x, game.ball.y, game.left_paddle.y,
+                      game.left_hits, game.right_hits, game.left_score, game.right_score))
+    return trace
+
+
+class TestSnapshot:
+    """Test snapshot/restore/clone."""
+
+    def test_restore_replays_identically(self):
+        """Test play after restore() repeats play after snapshot(), serves included."""
+        game = PongPhysics(800, 600, rng=random.Random(8))
+        _trace(game, 50)
+        snapshot = game.snapshot()
+
+        first = _trace(game, 800)
+        game.restore(snapshot)
+
+        assert _trace(game, 800) == first
+        assert any(step[5] or step[6] for step in first)  # Covers a serve
+
+    def test_snapshot_is_immutable(self):
+        snapshot = PongPhysics(800, 600, rng=random.Random(1)).snapshot()
+        with pytest.raises(AttributeError):
+            snapshot.left_score = 3
+        assert isinstance(snapshot.ball, tuple)
+
+    def test_clone_is_independent(self):
+        """Test a clone plays the same future without touching the original."""
+        game = PongPhysics(800, 600, rng=random.Random(9))
+        _trace(game, 30)
+        before = game.snapshot()
+
+        fork = game.clone()
+        forked = _trace(fork, 500)
+
+        assert game.snapshot() == before
+        assert _trace(game, 500) == forked
+
+
+class TestSeededRandom:
+    """Test per-game random sources."""
+
+    def test_same_seed_same_serves(self):
+        """Test games with equal seeds serve identically."""
+        game1 = PongPhysics(800, 600, rng=random.Random(42))
+        game2 = PongPhysics(800, 600, rng=random.Random(42))
+
+        for _ in range(5):
+            assert (game1.ball.x_vel, game1.ball.y_vel) == (game2.ball.x_vel, game2.ball.y_vel)
+            game1.ball.reset()
+            game2.ball.reset()
+
+    def test_default_uses_global_random(self):
+        """Test objects without rng fall back to the random module."""
+        assert PongPhysics(800, 600).ball.rng is random
+
+
+def _step(game, frames, left_move, right_move):
+    """Reference: loop() and paddle moves one frame at a time."""
+    for _ in range(frames):
+        game.loop()
+        if left_move != 0:
+            game.move_paddle(left=True, up=left_move < 0)
+        if right_move != 0:
+            game.move_paddle(left=False, up=right_move < 0)
+
+
+class TestAdvance:
+    """Test event-driven advance() against per-frame stepping."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_frame_stepping(self, seed):
+        """Test positions and counters are identical to loop()."""
+        fast = PongPhysics(800, 600, rng=random.Random(seed))
+        slow = PongPhysics(800, 600, rng=random.Random(seed))
+        inputs = random.Random(seed + 100)
+
+        for _ in range(30):
+            left, right = inputs.choice([-1, 0, 1]), inputs.choice([-1, 0, 1])
+            done = fast.advance(inputs.randint(1, 400), left, right)
+            _step(slow, done, left, right)
+
+            for a, b in ((fast.ball, slow.ball), (fast.left_paddle, slow.left_paddle),
+                         (fast.right_paddle, slow.right_paddle)):
+                assert (a.x, a.y) == (b.x, b.y)
+            assert (fast.ball.x_vel, fast.ball.y_vel) == (slow.ball.x_vel, slow.ball.y_vel)
+            assert (fast.left_hits, fast.right_hits, fast.left_score, fast.right_score) == \
+                (slow.left_hits, slow.right_hits, slow.left_score, slow.right_score)
+
+    def test_stops_after_score(self):
+        """Test advance() returns right after the frame that scored."""
+        game = PongPhysics(800, 600, rng=random.Random(1))
+        game.left_paddle.y = game.right_paddle.y = 0  # Both paddles miss
+
+        done = game.advance(10000)
+
+        assert done < 10000
+        assert game.left_score + game.right_score == 1
+        assert game.ball.x == game.ball.original_x
+
+    def test_respects_frame_limit(self):
+        """Test advance() never runs more frames than asked."""
+        game = PongPhysics(800, 600, rng=random.Random(2))
+        assert game.advance(7) == 7
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
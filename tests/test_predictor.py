@@ -0,0 +1,121 @@
+"""
+Unit Tests for Ball Predictor
+Testing closed-form trajectory prediction against a bounce-by-bounce walk.
+
+Run tests:
+    pytest tests/test_predictor.py -v
+"""
+import pytest
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from ai_engine.predictor import BallPredictor
+
+
+def _walk_y_at_x(height, x, y, vx, vy, radius, target_x):
+    """Reference: follow the ball wall by wall until it reaches target_x."""
+    while True:
+        t = (target_x - x) / vx
+        future_y = y + vy * t
+        if future_y - radius < 0:
+            wall = radius
+        elif future_y + radius > height:
+            wall = height - radius
+        else:
+            return future_y
+        t_wall = (wall - y) / vy
+        x, y, vy = x + vx * t_wall, wall, -vy
+
+
+@pytest.fixture
+def predictor():
+    return BallPredictor(800, 600, 20, 100)
+
+
+class TestPredictYAtX:
+    """Test the intercept Y prediction."""
+
+    def test_straight_line(self, predictor):
+        assert predictor.predict_y_at_x(400, 300, -5, 1, 7, 100) == pytest.approx(360)
+
+    def test_moving_away_returns_none(self, predictor):
+        assert predictor.predict_y_at_x(400, 300, 5, 1, 7, 100) is None
+        assert predictor.predict_y_at_x(400, 300, 0, 1, 7, 100) is None
+
+    def test_matches_bounce_walk(self, predictor):
+        """Test any number of bounces against the reference walk."""
+        rng = random.Random(0)
+        for _ in range(500):
+            x, y = rng.uniform(50, 750), rng.uniform(8, 592)
+            vx = rng.choice([-1, 1]) * rng.uniform(0.2, 8)
+            vy = rng.uniform(-8, 8) or 1.0
+            target_x = 30 if vx < 0 else 770
+
+            expected = _walk_y_at_x(600, x, y, vx, vy, 7, target_x)
+            assert predictor.predict_y_at_x(x, y, vx, vy, 7, target_x) == \
+                pytest.approx(expected, abs=1e-6)
+
+    def test_max_bounces_returns_wall(self, predictor):
+        """Test the legacy bounce limit stops at the wall of the extra bounce."""
+        # Slow in x, fast in y: many bounces before reaching the paddle
+        assert predictor.predict_y_at_x(400, 300, -0.5, 8, 7, 30, max_bounces=0) == 593
+        assert predictor.predict_y_at_x(400, 300, -0.5, 8, 7, 30, max_bounces=1) == 7
+
+
+class TestPredictBallPosition:
+    """Test position prediction after N steps."""
+
+    def test_wall_reflection(self, predictor):
+        x, y, vx, vy = predictor.predict_ball_position(400, 580, 2, 5, 7, time_steps=4)
+        assert (x, y, vx, vy) == (408, 586, 2, -5)
+
+    def test_paddle_bounce(self, predictor):
+        """Test the ball comes back off the paddle face."""
+        x, y, vx, vy = predictor.predict_ball_position(
+            60, 300, -5, 0, 7, time_steps=10, paddle_x=10, paddle_y=250
+        )
+        assert vx == 5
+        assert x == pytest.approx(37 + 5 * 5)
+        assert y == 300
+
+
+class TestBatchAPI:
+    """Test the vectorized API against the scalar methods."""
+
+    def _states(self, count):
+        rng = random.Random(1)
+        return [
+            (rng.uniform(50, 750), rng.uniform(8, 592),
+             rng.choice([-1, 1]) * rng.uniform(0.5, 8), rng.uniform(-8, 8),
+             rng.uniform(0, 500), rng.choice([True, False]))
+            for _ in range(count)
+        ]
+
+    def test_intercepts_and_actions_match_scalar(self, predictor):
+        np = pytest.importorskip("numpy")
+        states = self._states(300)
+        x, y, vx, vy, paddle_y, is_left = (np.array(column) for column in zip(*states))
+        paddle_x = np.where(is_left, 10, 770)
+
+        points = predictor.get_intercept_points(x, y, vx, vy, 7, paddle_x, is_left)
+        actions = predictor.get_optimal_actions(paddle_y, x, y, vx, vy, 7, paddle_x, is_left)
+
+        for i, (bx, by, bvx, bvy, py, left) in enumerate(states):
+            px = 10 if left else 770
+            assert points[i] == pytest.approx(
+                predictor.get_intercept_point(bx, by, bvx, bvy, 7, px, left))
+            assert actions[i] == predictor.get_optimal_action(py, bx, by, bvx, bvy, 7, px, left)
+
+    def test_unreachable_target_is_nan(self, predictor):
+        np = pytest.importorskip("numpy")
+        result = predictor.predict_y_at_x_batch([400, 400, 400], [300] * 3,
+                                                [5, 0, -5], [1] * 3, 7, 100)
+        assert np.isnan(result[0]) and np.isnan(result[1])
+        assert result[2] == pytest.approx(360)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
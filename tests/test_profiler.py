@@ -0,0 +1,171 @@
+"""
+Unit Tests for FrameProfiler
+Testing stage timing, rolling percentiles, CSV export and the overlay.
+
+Run tests:
+    pytest tests/test_profiler.py -v
+"""
+import csv
+import os
+import pytest
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from utils import profiler as profiler_module
+from utils.profiler import FrameProfiler
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """perf_counter_ns trả về các giá trị đặt trước (ns)"""
+    ticks = []
+    monkeypatch.setattr(profiler_module, 'perf_counter_ns', lambda: ticks.pop(0))
+    return ticks
+
+
+def _frame(profiler, ticks, clock, *laps):
+    """Đo một frame: begin, các (stage, ns) lap, end 1 ms sau lap cuối"""
+    now = clock
+    ticks.append(now)
+    for _, duration in laps:
+        now += duration
+        ticks.append(now)
+    ticks.append(now + 1_000_000)
+    profiler.begin_frame()
+    for stage, _ in laps:
+        profiler.lap(stage)
+    profiler.end_frame()
+
+
+class TestStageTiming:
+    """Test lap accounting."""
+
+    def test_laps_accumulate_per_stage(self, fake_clock):
+        """Test repeated laps of a stage add up and the frame total covers all."""
+        profiler = FrameProfiler(['events', 'draw'])
+        _frame(profiler, fake_clock, 0,
+               ('events', 2_000_000), ('draw', 3_000_000), ('events', 1_000_000))
+
+        assert profiler.rows == [(7_000_000, 3_000_000, 3_000_000)]
+        assert profiler.frames == 1
+
+    def test_unfinished_frame_is_dropped(self, fake_clock):
+        """Test begin_frame discards a frame that never ended."""
+        profiler = FrameProfiler(['loop'])
+        fake_clock.extend([0, 5_000_000])
+        profiler.begin_frame()
+        profiler.lap('loop')
+        _frame(profiler, fake_clock, 10_000_000, ('loop', 2_000_000))
+
+        assert profiler.rows == [(3_000_000, 2_000_000)]
+
+    def test_end_frame_without_begin_is_ignored(self):
+        """Test end_frame outside a frame records nothing."""
+        profiler = FrameProfiler(['loop'])
+        profiler.end_frame()
+
+        assert profiler.frames == 0
+
+    def test_unknown_stage_raises(self):
+        """Test laps must use declared stages."""
+        profiler = FrameProfiler(['loop'])
+        profiler.begin_frame()
+
+        with pytest.raises(KeyError):
+            profiler.lap('draw')
+
+    def test_invalid_stages_raise(self):
+        """Test empty or duplicate stage lists are rejected."""
+        with pytest.raises(ValueError):
+            FrameProfiler([])
+        with pytest.raises(ValueError):
+            FrameProfiler(['loop', 'loop'])
+
+
+class TestPercentiles:
+    """Test rolling statistics."""
+
+    def test_percentiles_in_ms(self, fake_clock):
+        """Test p50/p99 of each stage are reported in milliseconds."""
+        profiler = FrameProfiler(['loop'])
+        for i in range(1, 101):
+            _frame(profiler, fake_clock, 0, ('loop', i * 1_000_000))
+
+        stats = profiler.percentiles()
+        assert stats['loop'][0] == pytest.approx(50.5)
+        assert stats['loop'][1] == pytest.approx(99.01)
+        assert stats['total'][0] == pytest.approx(51.5)
+
+    def test_only_last_window_frames_count(self, fake_clock):
+        """Test frames older than the window are forgotten."""
+        profiler = FrameProfiler(['loop'], window=10)
+        for _ in range(10):
+            _frame(profiler, fake_clock, 0, ('loop', 50_000_000))
+        for _ in range(10):
+            _frame(profiler, fake_clock, 0, ('loop', 1_000_000))
+
+        assert profiler.percentiles()['loop'] == pytest.approx((1.0, 1.0))
+        assert len(profiler.rows) == 20
+
+    def test_no_frames(self):
+        """Test an empty profiler has no statistics."""
+        assert FrameProfiler(['loop']).percentiles() == {}
+
+
+class TestCsvExport:
+    """Test CSV output."""
+
+    def test_csv_has_one_row_per_frame(self, fake_clock, tmp_path):
+        """Test the header and per-frame values in ms."""
+        profiler = FrameProfiler(['ai', 'draw'])
+        _frame(profiler, fake_clock, 0, ('ai', 250_000), ('draw', 4_000_000))
+        _frame(profiler, fake_clock, 0, ('draw', 2_000_000))
+
+        path = tmp_path / 'profile.csv'
+        profiler.to_csv(str(path))
+        with open(path, newline='') as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == ['frame', 'total_ms', 'ai_ms', 'draw_ms']
+        assert rows[1] == ['0', '5.2500', '0.2500', '4.0000']
+        assert rows[2] == ['1', '3.0000', '0.0000', '2.0000']
+
+    def test_history_is_capped(self, fake_clock):
+        """Test only max_rows frames are kept for the CSV."""
+        profiler = FrameProfiler(['loop'], max_rows=3)
+        for _ in range(5):
+            _frame(profiler, fake_clock, 0, ('loop', 1_000_000))
+
+        assert len(profiler.rows) == 3
+        assert profiler.frames == 5
+
+
+class TestOverlay:
+    """Test the p50/p99 overlay."""
+
+    def test_overlay_is_cached_between_refreshes(self):
+        """Test the text is rendered once per REFRESH_FRAMES frames."""
+        pygame = pytest.importorskip("pygame")
+        pygame.init()
+        surface = pygame.Surface((400, 300))
+        profiler = FrameProfiler(['loop'])
+
+        rect = profiler.draw(surface)
+        overlay = profiler._overlay
+        for _ in range(FrameProfiler.REFRESH_FRAMES - 1):
+            profiler.begin_frame()
+            profiler.lap('loop')
+            profiler.end_frame()
+            profiler.draw(surface)
+        assert profiler._overlay is overlay
+
+        profiler.begin_frame()
+        profiler.end_frame()
+        assert profiler.draw(surface) == rect
+        assert profiler._overlay is not overlay
+        assert rect.topleft == (10, 10)
@@ -0,0 +1,114 @@
+"""
+Unit Tests for DirtyRectRenderer
+Testing that partial redraws leave the same picture as full redraws.
+
+Run tests:
+    pytest tests/test_renderer.py -v
+"""
+import os
+import random
+import pytest
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+pygame = pytest.importorskip("pygame")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from game_engine.game_manager import GameManager
+from features.powerups import PowerUpManager
+from ui.visuals import VisualEffects, ScoreDisplay
+from ui.renderer import DirtyRectRenderer
+
+
+@pytest.fixture
+def scene():
+    """Renderer over a seeded headless match"""
+    pygame.init()
+    window = pygame.display.set_mode((400, 300))
+    game = GameManager(window, 400, 300, rng=random.Random(3))
+    effects = VisualEffects()
+    renderer = DirtyRectRenderer(window, game, PowerUpManager(400, 300), effects,
+                                 ScoreDisplay(400, 300))
+    return window, game, effects, renderer
+
+
+def _full_picture(renderer):
+    """Static layer, dynamic objects, then the HUD, drawn on a clean copy"""
+    expected = renderer._background.copy()
+    renderer._draw_dynamic(expected)
+    renderer._draw_hud(expected)
+    return pygame.image.tobytes(expected, 'RGB')
+
+
+class TestDirtyRects:
+    """Test dirty-rect frames."""
+
+    def test_moving_objects_leave_no_trails(self, scene):
+        """Test dirty frames match a full redraw of the same state."""
+        window, game, effects, renderer = scene
+        for frame in range(30):
+            game.loop()
+            game.move_paddle(left=True, up=frame % 2 == 0)
+            renderer.draw()
+
+        assert renderer.full_frames == 1
+        assert renderer.dirty_frames == 29
+        assert pygame.image.tobytes(window, 'RGB') == _full_picture(renderer)
+
+    def test_flash_forces_full_redraw(self, scene):
+        """Test screen-wide effects fall back to full frames."""
+        window, game, effects, renderer = scene
+        renderer.draw()
+        effects.flash_alpha = 3
+
+        renderer.draw()
+        renderer.draw()
+        effects.update()
+        renderer.draw()
+
+        assert renderer.full_frames == 4
+        assert pygame.image.tobytes(window, 'RGB') == _full_picture(renderer)
+
+    def test_hud_stays_above_objects(self, scene):
+        """Test objects passing under the score and center line are covered by the HUD."""
+        window, game, effects, renderer = scene
+        renderer.draw()
+        for x, y in ((100, 40), (200, 150), (300, 30)):
+            game.ball.x, game.ball.y = x, y
+            renderer.draw()
+            assert pygame.image.tobytes(window, 'RGB') == _full_picture(renderer)
+
+        assert renderer.dirty_frames == 3
+
+    def test_hits_rebuild_background(self, scene):
+        """Test a HUD change redraws the whole screen once."""
+        window, game, effects, renderer = scene
+        renderer.draw()
+        renderer.draw()
+        game.left_hits += 1
+        renderer.draw()
+
+        assert (renderer.full_frames, renderer.dirty_frames) == (2, 1)
+
+
+class TestProfilerOverlay:
+    """Test the renderer with a frame profiler."""
+
+    def test_overlay_and_stage_timing(self, scene):
+        """Test draw/flip are timed and the overlay stays in the dirty rects."""
+        from utils.profiler import FrameProfiler
+
+        window, game, effects, renderer = scene
+        renderer.profiler = FrameProfiler(['draw', 'flip'])
+        for _ in range(3):
+            renderer.profiler.begin_frame()
+            game.loop()
+            renderer.draw()
+            renderer.profiler.end_frame()
+
+        overlay = renderer.profiler.draw(window)
+        assert renderer.profiler.frames == 3
+        assert all(draw > 0 and flip > 0 for _, draw, flip in renderer.profiler.rows)
+        assert overlay in renderer._rects
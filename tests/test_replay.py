@@ -0,0 +1,72 @@
+"""
+Unit Tests for Match Replays
+Testing that recorded matches re-simulate to the same final state.
+
+Run tests:
+    pytest tests/test_replay.py -v
+"""
+import pytest
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from game_engine.physics import PongPhysics
+from game_engine.replay import ReplayRecorder, ReplayPlayer
+
+
+def _state(game):
+    return (game.ball.x, game.ball.y, game.left_paddle.y, game.right_paddle.y,
+            game.left_hits, game.right_hits, game.left_score, game.right_score)
+
+
+class TestReplayRoundtrip:
+    """Test recording and playing back matches."""
+
+    def test_replay_reproduces_match(self, tmp_path):
+        """Test loop(), move_paddle() and advance() all replay identically."""
+        game = PongPhysics(800, 600, rng=random.Random(12))
+        recorder = ReplayRecorder(game, 12)
+        inputs = random.Random(0)
+        for _ in range(300):
+            game.loop()
+            game.move_paddle(left=True, up=inputs.random() < 0.5)
+            if inputs.random() < 0.3:
+                game.advance(inputs.randint(1, 30), inputs.choice([-1, 0, 1]), 1)
+        recorder.save(tmp_path / "match.rpl")
+
+        player = ReplayPlayer.load(tmp_path / "match.rpl")
+        replayed = player.play()
+
+        assert player.frames == recorder.frames
+        assert _state(replayed) == _state(game)
+
+    def test_file_is_compact(self):
+        """Test a 3600-frame match stays within a few KB."""
+        game = PongPhysics(800, 600, rng=random.Random(1))
+        recorder = ReplayRecorder(game, 1)
+        for frame in range(3600):
+            game.loop()
+            game.move_paddle(left=True, up=frame % 120 < 60)
+            game.move_paddle(left=False, up=frame % 90 < 45)
+
+        assert len(recorder.to_bytes()) < 4096
+
+    def test_detach_stops_recording(self):
+        game = PongPhysics(800, 600, rng=random.Random(1))
+        recorder = ReplayRecorder(game, 1)
+        game.loop()
+        recorder.detach()
+        game.loop()
+
+        assert recorder.frames == 1
+        assert game.recorder is None
+
+    def test_rejects_other_files(self):
+        with pytest.raises(ValueError):
+            ReplayPlayer.from_bytes(b"not a replay file at all, sorry!")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
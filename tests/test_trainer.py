@@ -0,0 +1,275 @@
+"""
+Unit Tests for NEAT Trainer
+Testing match termination and fitness of headless training.
+
+Run tests:
+    pytest tests/test_trainer.py -v
+"""
+import pytest
+import random
+import sys
+from pathlib import Path
+
+neat = pytest.importorskip("neat")
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR / 'src'))
+
+from ai_engine.trainer import NEATTrainer
+from ai_engine.fitness_cache import genome_fingerprint
+from game_engine.replay import ReplayPlayer
+
+
+def _config():
+    return neat.Config(
+        neat.DefaultGenome,
+        neat.DefaultReproduction,
+        neat.DefaultSpeciesSet,
+        neat.DefaultStagnation,
+        str(ROOT_DIR / 'config' / 'config-feedforward.txt')
+    )
+
+
+@pytest.fixture
+def config():
+    """NEAT config from the project config file"""
+    return _config()
+
+
+@pytest.fixture
+def genomes(config):
+    """Two genomes from a fresh population"""
+    random.seed(0)
+    population = neat.Population(config)
+    return list(population.population.values())[:2]
+
+
+def _play(trainer, genome1, genome2, seed):
+    genome1.fitness = genome2.fitness = 0
+    trainer._train_pair(genome1, genome2, seed)
+    return genome1.fitness, genome2.fitness
+
+
+class TestFrameBudget:
+    """Test frame-based match termination."""
+
+    def test_fitness_is_reproducible(self, config, genomes):
+        """Test the same match gives the same fitness every time."""
+        trainer = NEATTrainer(config)
+
+        assert _play(trainer, *genomes, seed=5) == _play(trainer, *genomes, seed=5)
+
+    def test_budget_ends_match(self, config, genomes):
+        """Test a match stops at MAX_FRAMES with duration in game seconds."""
+        trainer = NEATTrainer(config)
+        trainer.MAX_FRAMES = 10
+
+        fitness1, fitness2 = _play(trainer, *genomes, seed=5)
+
+        # No hit or point is possible within 10 frames from the serve
+        assert fitness1 == fitness2 == pytest.approx(10 / NEATTrainer.FPS)
+
+
+class TestFitnessAggregation:
+    """Test fitness assignment from scheduled matches."""
+
+    def test_fitness_is_mean_of_matches(self, config):
+        """Test every genome gets the mean of its ring matches."""
+        random.seed(6)
+        genomes = list(neat.Population(config).population.items())[:5]
+        trainer = NEATTrainer(config)
+        trainer.seed = 2
+
+        trainer._eval_genomes(genomes, config)
+
+        population = [genome for _, genome in genomes]
+        for i, genome in enumerate(population):
+            left = population[(i + 1) % 5]
+            right = population[i - 1]
+            expected = (_replay(trainer, genome, left)[0] +
+                        _replay(trainer, right, genome)[1]) / 2
+            assert genome.fitness == pytest.approx(expected)
+
+
+def _replay(trainer, genome1, genome2):
+    """Play one seeded match again outside the trainer's bookkeeping."""
+    seed = trainer._match_seed(genome_fingerprint(genome1), genome_fingerprint(genome2))
+    fitness = (genome1.fitness, genome2.fitness)
+    result = trainer._play_pair(genome1, genome2, seed)
+    genome1.fitness, genome2.fitness = fitness
+    return result
+
+
+class TestSeededMatches:
+    """Test per-match RNG seeding."""
+
+    def test_seed_isolated_from_global_random(self, config, genomes):
+        """Test global random state does not change a seeded match."""
+        trainer = NEATTrainer(config)
+        random.seed(1)
+        first = _play(trainer, *genomes, seed=7)
+        random.seed(2)
+
+        assert _play(trainer, *genomes, seed=7) == first
+
+    def test_batch_engine_matches_scalar(self, config):
+        """Test seeded batch play gives the scalar engine's fitness."""
+        random.seed(3)
+        population = neat.Population(config)
+        genomes = list(population.population.values())[:8]
+        trainer = NEATTrainer(config)
+        matches = [(g1, g2, seed) for seed, (g1, g2) in
+                   enumerate(zip(genomes, genomes[1:] + genomes[:1]))]
+
+        results = trainer._play_batch(matches)
+
+        for (genome1, genome2, seed), result in zip(matches, results):
+            assert result == pytest.approx(_play(trainer, genome1, genome2, seed))
+
+    def test_run_seed_reproduces_training(self):
+        """Test the same run seed gives the same winner."""
+        def run():
+            # Fresh config: neat keeps node/innovation counters in it
+            trainer = NEATTrainer(_config())
+            winner = trainer.train_ai(generations=2, difficulty='easy', seed=11)
+            return winner.key, winner.fitness
+
+        assert run() == run()
+
+
+class TestFrameSkip:
+    """Test action repeat between network decisions."""
+
+    def test_networks_queried_every_k_frames(self, config, genomes):
+        """Test a 40-frame match asks each network 10 times with k=4."""
+        genome1, genome2 = genomes
+        trainer = NEATTrainer(config)
+        trainer.frame_skip = 4
+        trainer.MAX_FRAMES = 40  # Too short for anyone to score
+        calls = []
+        get_move = trainer._get_move
+        trainer._get_move = lambda *args: calls.append(1) or get_move(*args)
+
+        _play(trainer, genome1, genome2, seed=1)
+
+        assert len(calls) == 2 * 10
+
+    def test_batch_engine_matches_scalar(self, config):
+        """Test frame-skipped batch play gives the scalar engine's fitness."""
+        random.seed(3)
+        genomes = list(neat.Population(config).population.values())[:8]
+        trainer = NEATTrainer(config)
+        trainer.frame_skip = 4
+        matches = [(g1, g2, seed) for seed, (g1, g2) in
+                   enumerate(zip(genomes, genomes[1:] + genomes[:1]))]
+
+        results = trainer._play_batch(matches)
+
+        for (genome1, genome2, seed), result in zip(matches, results):
+            assert result == pytest.approx(_play(trainer, genome1, genome2, seed))
+
+    def test_invalid_frame_skip(self, config):
+        with pytest.raises(ValueError):
+            NEATTrainer(config).train_ai(generations=1, frame_skip=0)
+
+
+class TestReplays:
+    """Test archiving evaluation matches."""
+
+    def test_recorded_match_replays(self, config, genomes, tmp_path):
+        """Test a frame-skipped training match replays to the same fitness."""
+        genome1, genome2 = genomes
+        trainer = NEATTrainer(config)
+        trainer.replay_dir = str(tmp_path)
+        trainer.frame_skip = 3
+
+        result = trainer._play_pair(genome1, genome2, 77)
+
+        player = ReplayPlayer.load(tmp_path / f"{77:016x}.rpl")
+        game = player.play()
+        assert trainer._match_fitness(
+            game.left_hits, game.right_hits, game.left_score, game.right_score,
+            player.frames / trainer.FPS
+        ) == pytest.approx(result)
+
+
+    def test_batch_engine_rejects_replays(self, config, tmp_path):
+        """Test replays cannot be requested from the batch engine."""
+        with pytest.raises(ValueError):
+            NEATTrainer(config).train_ai(generations=1, engine='batch',
+                                         replay_dir=str(tmp_path))
+
+    def test_cache_hits_keep_a_replay(self, config, tmp_path):
+        """Test every match of a generation has a replay, cached ones included."""
+        random.seed(4)
+        genomes = list(neat.Population(config).population.items())[:4]
+        trainer = NEATTrainer(config)
+        trainer.seed = 9
+        trainer._eval_genomes(genomes, config)  # Cached without replays
+
+        trainer.replay_dir = str(tmp_path)
+        trainer._eval_genomes(genomes, config)
+        assert len(list(tmp_path.iterdir())) == 4
+
+        # Replays exist now, so the third evaluation is served from the cache
+        misses = trainer.fitness_cache.misses
+        trainer._eval_genomes(genomes, config)
+        assert trainer.fitness_cache.misses == misses
+        assert len(list(tmp_path.iterdir())) == 4
+
+
+class TestFitnessCache:
+    """Test skipping matches between unchanged genomes."""
+
+    def test_unchanged_genomes_are_not_replayed(self, config):
+        """Test a second evaluation of the same genomes hits the cache."""
+        random.seed(4)
+        genomes = list(neat.Population(config).population.items())[:6]
+        trainer = NEATTrainer(config)
+        trainer.seed = 9
+
+        trainer._eval_genomes(genomes, config)
+        first = [genome.fitness for _, genome in genomes]
+        misses = trainer.fitness_cache.misses
+        trainer._eval_genomes(genomes, config)
+
+        assert trainer.fitness_cache.hits == misses
+        assert [genome.fitness for _, genome in genomes] == first
+
+    def test_mutated_genome_is_replayed(self, config):
+        """Test changing a genome's weights invalidates its matches."""
+        random.seed(4)
+        genomes = list(neat.Population(config).population.items())[:4]
+        trainer = NEATTrainer(config)
+        trainer.seed = 9
+        trainer._eval_genomes(genomes, config)
+
+        connection = next(iter(genomes[0][1].connections.values()))
+        connection.weight += 1.0
+        trainer._eval_genomes(genomes, config)
+
+        # Only genome 0's two ring matches are played again
+        assert trainer.fitness_cache.hits == 2
+
+
+class TestProfiler:
+    """Test per-stage timing of training matches."""
+
+    def test_profiler_times_every_frame(self, config, genomes):
+        """Test each frame is recorded without changing the result."""
+        from utils.profiler import FrameProfiler
+
+        trainer = NEATTrainer(config)
+        trainer.MAX_FRAMES = 50
+        expected = _play(trainer, *genomes, seed=5)
+
+        trainer.profiler = FrameProfiler(NEATTrainer.TRAIN_STAGES)
+        assert _play(trainer, *genomes, seed=5) == expected
+        assert trainer.profiler.frames == 50
+        stats = trainer.profiler.percentiles()
+        assert stats['loop'][0] > 0
+        assert stats['draw'] == (0.0, 0.0)  # Headless
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,121 @@
+"""
+Unit Tests for VectorPongEnv
+Testing that the Gym-style env plays by the training rules.
+
+Run tests:
+    pytest tests/test_vector_env.py -v
+"""
+import pytest
+import random
+import sys
+from pathlib import Path
+
+neat = pytest.importorskip("neat")
+np = pytest.importorskip("numpy")
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR / 'src'))
+
+from ai_engine.trainer import NEATTrainer
+from ai_engine.compiled_network import create_network
+from ai_engine.vector_env import VectorPongEnv
+
+
+def _config():
+    return neat.Config(
+        neat.DefaultGenome,
+        neat.DefaultReproduction,
+        neat.DefaultSpeciesSet,
+        neat.DefaultStagnation,
+        str(ROOT_DIR / 'config' / 'config-feedforward.txt')
+    )
+
+
+def _run(env, seed, steps):
+    """Play fixed pseudo-random actions, return every step result"""
+    actions = np.random.default_rng(seed).integers(-1, 2, size=(steps,) + env.action_shape)
+    results = [env.reset(seed=seed)[0]]
+    for action in actions:
+        results.append(env.step(action))
+    return results
+
+
+class TestTrainingParity:
+    """Test the env reproduces the trainer's matches."""
+
+    @pytest.mark.parametrize("frame_skip", [1, 3])
+    def test_episode_reward_equals_fitness(self, frame_skip):
+        """Test summed rewards equal the fitness of the same seeded match."""
+        config = _config()
+        random.seed(2)
+        genomes = list(neat.Population(config).population.values())[:4]
+        pairs = [(genomes[0], genomes[1]), (genomes[2], genomes[3])]
+        nets = [(create_network(g1, config), create_network(g2, config)) for g1, g2 in pairs]
+
+        trainer = NEATTrainer(config)
+        trainer.frame_skip = frame_skip
+        expected = [trainer._play_pair(g1, g2, seed) for seed, (g1, g2) in enumerate(pairs, 40)]
+
+        env = VectorPongEnv(len(pairs), frame_skip=frame_skip)
+        observations, _ = env.reset(seed=40)
+        totals = np.zeros((len(pairs), 2))
+        finished = np.zeros(len(pairs), dtype=bool)
+        while not finished.all():
+            decisions = np.array([[net.activate(obs)[0] for net, obs in zip(pair, game)]
+                                  for pair, game in zip(nets, observations)])
+            actions = trainer._decisions_to_moves(decisions)
+            observations, rewards, terminated, truncated, _ = env.step(actions)
+            totals += rewards * ~finished[:, None]
+            finished |= terminated | truncated
+
+        assert totals == pytest.approx(np.array(expected))
+
+
+class TestVectorEnv:
+    """Test reset/step semantics and backends."""
+
+    def test_observations_are_normalized(self):
+        """Test observations use the network input normalization."""
+        env = VectorPongEnv(3)
+        observations, _ = env.reset(seed=0)
+
+        assert observations.shape == (3, 2, 5)
+        sim = env._shard.sim
+        assert observations[:, 0, 0] == pytest.approx(sim.ball_x / 800)
+        assert observations[:, 1, 4] == pytest.approx(sim.right_y / 600)
+
+    def test_finished_games_restart(self):
+        """Test games restart with the final observation kept in info."""
+        env = VectorPongEnv(2, max_frames=5)
+        env.reset(seed=1)
+
+        for _ in range(3):
+            observations, rewards, terminated, truncated, info = env.step(np.zeros((2, 2)))
+        assert not truncated.any()
+        observations, rewards, terminated, truncated, info = env.step(np.zeros((2, 2)))
+
+        assert truncated.all() and not terminated.any()
+        assert not np.isnan(info['final_observation']).any()
+        assert (env._shard.sim.frames == 1).all()
+
+    def test_subprocess_matches_sync(self):
+        """Test the subprocess backend returns exactly the sync results."""
+        sync = VectorPongEnv(5, max_frames=200)
+        with VectorPongEnv(5, max_frames=200, backend='subprocess', workers=2) as sub:
+            expected = _run(sync, seed=9, steps=300)
+            actual = _run(sub, seed=9, steps=300)
+
+        np.testing.assert_array_equal(expected[0], actual[0])
+        for step_expected, step_actual in zip(expected[1:], actual[1:]):
+            for a, b in zip(step_expected[:4], step_actual[:4]):
+                np.testing.assert_array_equal(a, b)
+
+    def test_step_requires_reset(self):
+        """Test step() before reset() is rejected."""
+        with pytest.raises(RuntimeError):
+            VectorPongEnv(2).step(np.zeros((2, 2)))
+
+    def test_invalid_backend(self):
+        """Test unknown backends are rejected."""
+        with pytest.raises(ValueError):
+            VectorPongEnv(2, backend='threads')
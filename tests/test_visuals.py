@@ -0,0 +1,159 @@
+"""
+Unit Tests for AssetManager
+Testing the text and sprite caches and the particle effects.
+
+Run tests:
+    pytest tests/test_visuals.py -v
+"""
+import os
+import pytest
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+pygame = pytest.importorskip("pygame")
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from ui.visuals import get_asset_manager, ParticleSystem, TrailBuffer
+
+
+@pytest.fixture
+def assets():
+    """Asset manager with an empty text cache"""
+    pygame.init()
+    manager = get_asset_manager()
+    manager.text_cache.clear()
+    manager.sprite_cache.clear()
+    yield manager
+    manager.text_cache.clear()
+    manager.sprite_cache.clear()
+
+
+class TestTextCache:
+    """Test text surfaces are rendered once."""
+
+    def test_same_text_is_reused(self, assets):
+        """Test repeated renders return the cached surface."""
+        font = assets.get_font(None, 32)
+        first = assets.render_text(font, "HITS: 3", (80, 60, 40))
+
+        assert assets.render_text(font, "HITS: 3", (80, 60, 40)) is first
+        assert assets.render_text(font, "HITS: 4", (80, 60, 40)) is not first
+        assert assets.render_text(font, "HITS: 3", (0, 0, 0)) is not first
+
+    def test_least_recently_used_is_evicted(self, assets, monkeypatch):
+        """Test the cache keeps only the most recently used texts."""
+        monkeypatch.setattr(type(assets), 'TEXT_CACHE_SIZE', 2)
+        font = assets.get_font(None, 32)
+        first = assets.render_text(font, "1", (0, 0, 0))
+        assets.render_text(font, "2", (0, 0, 0))
+        assets.render_text(font, "1", (0, 0, 0))
+        assets.render_text(font, "3", (0, 0, 0))
+
+        assert len(assets.text_cache) == 2
+        assert assets.render_text(font, "1", (0, 0, 0)) is first
+
+
+class TestSpriteCache:
+    """Test glow sprites are rendered once."""
+
+    def test_sprite_rendered_once(self, assets):
+        """Test the render callback only runs on the first request."""
+        calls = []
+
+        def render():
+            calls.append(1)
+            return pygame.Surface((4, 4), pygame.SRCALPHA)
+
+        first = assets.get_sprite(('glow', 4), render)
+
+        assert assets.get_sprite(('glow', 4), render) is first
+        assert len(calls) == 1
+
+    def test_glow_alpha_buckets(self, assets):
+        """Test glow alpha is rounded to a few cached steps."""
+        assert assets.glow_alpha(104) == 100
+        assert assets.glow_alpha(146.3) == 150
+        assert assets.glow_alpha(300) == 255
+
+    def test_paddle_glow_follows_height(self, assets):
+        """Test each paddle height gets its own cached glow."""
+        from game_engine.paddle import Paddle
+        window = pygame.Surface((200, 300))
+        paddle = Paddle(10, 50)
+        paddle.draw(window)
+        paddle.draw(window)
+        paddle.height_modifier = 1.5
+        paddle.draw(window)
+
+        sizes = sorted(sprite.get_height() for sprite in assets.sprite_cache.values())
+        assert sizes == [Paddle.HEIGHT + 12, int(Paddle.HEIGHT * 1.5) + 12]
+
+
+class TestParticleSystem:
+    """Test the array-backed particles."""
+
+    def test_integration_matches_per_particle_rules(self):
+        """Test position, gravity and drag follow the original update."""
+        particles = ParticleSystem(capacity=8, rng=np.random.default_rng(1))
+        particles.emit(100, 200, 1)
+        x, y, vx, vy = 100.0, 200.0, particles.vx[0], particles.vy[0]
+
+        for _ in range(5):
+            particles.update()
+            x, y = x + vx, y + vy
+            vy += 0.3
+            vx *= 0.98
+
+        assert (particles.x[0], particles.y[0]) == pytest.approx((x, y))
+        assert particles.lifetime[0] == ParticleSystem.LIFETIME - 5
+
+    def test_dead_particles_are_removed(self):
+        """Test swap-remove keeps exactly the live particles."""
+        particles = ParticleSystem(capacity=64, rng=np.random.default_rng(2))
+        particles.emit(0, 0, 10)
+        for _ in range(ParticleSystem.LIFETIME - 5):
+            particles.update()
+        particles.emit(50, 50, 4)
+        particles.lifetime[[0, 3]] = 0  # Die early, while others still live
+        particles.update()
+
+        assert len(particles) == 12
+        assert (particles.lifetime[:12] > 0).all()
+        assert (particles.x[:12] == 50).sum() == 0  # new ones already moved
+        for _ in range(5):
+            particles.update()
+        assert len(particles) == 4
+
+    def test_emit_stops_at_capacity(self):
+        """Test particles beyond the capacity are dropped."""
+        particles = ParticleSystem(capacity=20)
+        particles.emit(0, 0, 15)
+        particles.emit(0, 0, 15)
+
+        assert len(particles) == 20
+
+
+class TestTrailBuffer:
+    """Test the ball trail ring buffer."""
+
+    def test_keeps_latest_positions_in_order(self):
+        """Test a full buffer overwrites the oldest position."""
+        trail = TrailBuffer(3)
+        for x in range(5):
+            trail.append(x, 0)
+
+        assert [trail.x[i] for i in trail.indices()] == [2, 3, 4]
+
+    def test_expired_positions_are_dropped(self):
+        """Test positions expire oldest first."""
+        trail = TrailBuffer(4)
+        trail.append(1, 0)
+        for _ in range(TrailBuffer.LIFE - 1):
+            trail.update()
+        trail.append(2, 0)
+        trail.update()
+
+        assert [trail.x[i] for i in trail.indices()] == [2]